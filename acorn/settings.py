@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 
 import os
+import sys
 from decouple import config
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -51,6 +52,7 @@ INSTALLED_APPS = [
 
 
 MIDDLEWARE = [
+    'application.metrics.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -156,6 +158,11 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+
+    'DEFAULT_RENDERER_CLASSES': (
+        'application.api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
 }
 
 SENDGRID_API_KEY = config('SENDGRID_API_KEY')
@@ -174,11 +181,87 @@ COMPANY_PATH = config('COMPANY_PATH')
 AWS_STORAGE_BUCKET_NAME = config('AWS_STORAGE_BUCKET_NAME')
 
 CRONJOBS = [
-    ('*/5 * * * *', 'application.cron.my_cron_job')
+    ('*/5 * * * *', 'application.cron.my_cron_job'),
+    # Background jobs (Twilio rooms, calendar events, reports, exports) queued by the apis
+    ('* * * * *', 'django.core.management.call_command', ['run_jobs'], {'once': True})
 ]
 
+# Every cron run is a new process, django_crontab's file lock skips a run while
+# the previous one is still busy
+CRONTAB_LOCK_JOBS = True
+
 DATA_UPLOAD_MAX_MEMORY_SIZE = 20971520
 
+# Template views call the api views in-process, set to False to use HTTP
+INTERNAL_API_DISPATCH = config('INTERNAL_API_DISPATCH', default=True, cast=bool)
+
+# Number of applications per page of the claim dashboard tabs, unset shows every
+# application of a tab, set it once the tab templates render the next page links
+LISTING_PAGE_SIZE = config(
+    'LISTING_PAGE_SIZE',
+    default=None,
+    cast=lambda value: int(value) if value else None
+)
+
+# Seconds a compiled catalog (claim taxonomy, survey definition) stays in process memory
+CATALOG_CACHE_TIMEOUT = config('CATALOG_CACHE_TIMEOUT', default=300, cast=int)
+
+# Concurrent S3 uploads of the files of a submission over one pooled client
+S3_UPLOAD_WORKERS = config('S3_UPLOAD_WORKERS', default=8, cast=int)
+S3_MAX_POOL_CONNECTIONS = config('S3_MAX_POOL_CONNECTIONS', default=20, cast=int)
+S3_MULTIPART_THRESHOLD = config('S3_MULTIPART_THRESHOLD', default=8 * 1024 * 1024, cast=int)
+
+# Seconds a presigned file url is valid, urls are reused for a quarter of it
+PRESIGNED_URL_EXPIRY = config('PRESIGNED_URL_EXPIRY', default=3600, cast=int)
+
+# Streamed copies to S3 (Twilio recordings), part size in bytes and timeout in seconds
+S3_STREAM_PART_SIZE = config('S3_STREAM_PART_SIZE', default=16 * 1024 * 1024, cast=int)
+S3_STREAM_TIMEOUT = config('S3_STREAM_TIMEOUT', default=60, cast=int)
+S3_PART_RETRIES = config('S3_PART_RETRIES', default=3, cast=int)
+
+# Background jobs run by the run_jobs command, delays and timeouts in seconds
+JOB_MAX_ATTEMPTS = config('JOB_MAX_ATTEMPTS', default=5, cast=int)
+JOB_RETRY_BACKOFF = config('JOB_RETRY_BACKOFF', default=30, cast=int)
+JOB_RETRY_BACKOFF_MAX = config('JOB_RETRY_BACKOFF_MAX', default=3600, cast=int)
+JOB_LOCK_TIMEOUT = config('JOB_LOCK_TIMEOUT', default=900, cast=int)
+JOB_POLL_INTERVAL = config('JOB_POLL_INTERVAL', default=5, cast=float)
+
+# Resolution the report page backgrounds are scaled down to, 0 keeps the image size
+REPORT_BACKGROUND_DPI = config('REPORT_BACKGROUND_DPI', default=150, cast=int)
+
+# Flatten the transparency of the report page backgrounds onto the white page
+REPORT_FLATTEN_BACKGROUNDS = config('REPORT_FLATTEN_BACKGROUNDS', default=True, cast=bool)
+
+# Worker processes that render the reports of a bulk export
+REPORT_EXPORT_WORKERS = config('REPORT_EXPORT_WORKERS', default=2, cast=int)
+
+# Applications a bulk export may merge into one PDF, larger exports are zipped
+REPORT_EXPORT_MAX_MERGED = config('REPORT_EXPORT_MAX_MERGED', default=200, cast=int)
+
+# Rows read per query by the streamed data exports
+EXPORT_CHUNK_SIZE = config('EXPORT_CHUNK_SIZE', default=2000, cast=int)
+
+# Longest [start, end) window the calendar apis return, a month view with its
+# leading and trailing weeks fits in two months
+CALENDAR_MAX_WINDOW_DAYS = config('CALENDAR_MAX_WINDOW_DAYS', default=62, cast=int)
+
+# Load only the visible month grid on the calendar page, turn on once the calendar
+# template loads the other months with calendar_events
+CALENDAR_MONTH_WINDOW = config('CALENDAR_MONTH_WINDOW', default=False, cast=bool)
+
+# First day of a week in the calendar grid, 0 is Monday and 6 Sunday
+CALENDAR_FIRST_WEEKDAY = config('CALENDAR_FIRST_WEEKDAY', default=6, cast=int)
+
+# Record and log the queries, pandas and HTTP time of every request
+REQUEST_METRICS = config('REQUEST_METRICS', default=True, cast=bool)
+
+# Fail a view over its query budget instead of logging it, on for the tests
+QUERY_BUDGET_STRICT = config(
+    'QUERY_BUDGET_STRICT',
+    default=len(sys.argv) > 1 and sys.argv[1] == 'test',
+    cast=bool
+)
+
 SESSION_COOKIE_SECURE = True
 CSRF_COOKIE_SECURE = True
 SECURE_HSTS_SECONDS = 31536000
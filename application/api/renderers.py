@@ -0,0 +1,69 @@
+"""
+Api renderers used by the rest framework views.
+"""
+import datetime
+import decimal
+import uuid
+
+import orjson
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer
+
+
+def _default(value):
+    """
+    Convert the values orjson does not serialize natively.
+
+    :param value:
+        Value that is not json serializable by orjson.
+
+    :return:
+        Json serializable representation of the value.
+    """
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+
+    if isinstance(value, (uuid.UUID, Promise)):
+        return str(value)
+
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+
+    if hasattr(value, 'item'):
+        return value.item()
+
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Render the response envelope to json in a single pass with orjson.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render the response data to json bytes.
+
+        :param data:
+            Response data of the view.
+
+        :return:
+            Json encoded bytes.
+        """
+        if data is None:
+            return b''
+
+        return orjson.dumps(
+            data,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
@@ -1,15 +1,20 @@
 """
 Application api serializers for cleaning incoming and outgoing data.
 """
+from datetime import timedelta
+from django.conf import settings
 from rest_framework import serializers
 from system_management.general_func_classes import BaseFormSerializer
+from application.api.services import decode_cursor
+from application.data_export import EXPORT_DATASETS, EXPORT_FORMATS
 from application.models import (
     InsuranceProvider,
     ApplicationType,
     Application,
     Client,
     Assessment,
-    TwilioRoom
+    TwilioRoom,
+    BackgroundJob
 )
 from claims.models import (
     AssessmentNote
@@ -339,14 +344,30 @@ class CreateAssessmentSerializer(BaseFormSerializer):
     )
     event_id = serializers.CharField(
         max_length=250,
-        required=True,
+        required=False,
+        allow_blank=True,
+        default='',
         read_only=False,
         write_only=False,
         error_messages={
-            'required': 'The event id field is required.',
             'max_length': 'The event id field must be less than 250 characters.',
         }
     )
+    event = serializers.JSONField(
+        required=False,
+        read_only=False,
+        write_only=False
+    )
+
+    def validate(self, attrs):
+        """
+        Require the event id or the calendar event to insert.
+        """
+        if not attrs.get('event_id') and not attrs.get('event'):
+            raise serializers.ValidationError(
+                'The event id or event field is required.'
+            )
+        return attrs
 
 
 class GetApplicationStatusSerializer(BaseFormSerializer):
@@ -524,8 +545,55 @@ class GetRoomSerializer(BaseFormSerializer):
     )
 
 
-class EventCalendarSerializer(BaseFormSerializer):
-    """Serializer for Getting Room by id"""
+class CalendarWindowSerializer(BaseFormSerializer):
+    """Serializer for the [start, end) window of the calendar"""
+    start = serializers.DateTimeField(
+        required=True,
+        read_only=False,
+        write_only=False,
+        input_formats=['iso-8601', '%Y-%m-%d'],
+        error_messages={
+            'required': 'The start field is required.',
+        }
+    )
+    end = serializers.DateTimeField(
+        required=True,
+        read_only=False,
+        write_only=False,
+        input_formats=['iso-8601', '%Y-%m-%d'],
+        error_messages={
+            'required': 'The end field is required.',
+        }
+    )
+
+    def validate(self, attrs):
+        """
+        Require both ends of the window, in order and at most
+        CALENDAR_MAX_WINDOW_DAYS apart.
+        """
+        start = attrs.get('start')
+        end = attrs.get('end')
+
+        if start is None and end is None:
+            return attrs
+
+        if start is None or end is None:
+            raise serializers.ValidationError(
+                'The start and end fields are required together.'
+            )
+
+        if end <= start:
+            raise serializers.ValidationError('The end must be after the start.')
+
+        if end - start > timedelta(days=settings.CALENDAR_MAX_WINDOW_DAYS):
+            raise serializers.ValidationError(
+                f'The window may be at most {settings.CALENDAR_MAX_WINDOW_DAYS} days.'
+            )
+        return attrs
+
+
+class EventCalendarSerializer(CalendarWindowSerializer):
+    """Serializer for the events of a user, optionally in a window"""
     user_id = serializers.IntegerField(
         required=True,
         read_only=False,
@@ -534,6 +602,18 @@ class EventCalendarSerializer(BaseFormSerializer):
             'required': 'The user id field is required.',
         }
     )
+    start = serializers.DateTimeField(
+        required=False,
+        read_only=False,
+        write_only=False,
+        input_formats=['iso-8601', '%Y-%m-%d']
+    )
+    end = serializers.DateTimeField(
+        required=False,
+        read_only=False,
+        write_only=False,
+        input_formats=['iso-8601', '%Y-%m-%d']
+    )
 
 
 class GetAssessmentEventTokenSerializer(BaseFormSerializer):
@@ -566,4 +646,139 @@ class TwilioRoomModelSerializer(serializers.ModelSerializer):
             'room_name', 
             'room_status', 
             'assessment_id'
-        )
\ No newline at end of file
+        )
+
+class ApplicationListingSerializer(BaseFormSerializer):
+    """
+    Serializer for the filters and cursor of the application listings.
+    """
+    status = serializers.CharField(
+        max_length=250,
+        required=False,
+        allow_null=True,
+        allow_blank=True,
+        read_only=False,
+        write_only=False,
+        error_messages={
+            'max_length': 'The status field must be less than 250 characters.'
+        }
+    )
+    assessor_id = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        read_only=False,
+        write_only=False
+    )
+    application_type_id = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        read_only=False,
+        write_only=False
+    )
+    cursor = serializers.CharField(
+        max_length=250,
+        required=False,
+        allow_null=True,
+        allow_blank=True,
+        read_only=False,
+        write_only=False,
+        error_messages={
+            'max_length': 'The cursor field must be less than 250 characters.'
+        }
+    )
+    page_size = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        min_value=1,
+        max_value=500,
+        read_only=False,
+        write_only=False,
+        error_messages={
+            'min_value': 'The page size must be at least 1.',
+            'max_value': 'The page size must be at most 500.'
+        }
+    )
+
+    @staticmethod
+    def validate_cursor(value):
+        """
+        Check that the cursor was issued by a previous page.
+        """
+        if value:
+            try:
+                decode_cursor(value)
+            except ValueError as error:
+                raise serializers.ValidationError(str(error)) from error
+        return value
+
+
+class GetJobStatusSerializer(BaseFormSerializer):
+    """Serializer for Getting a background job by id"""
+    job_id = serializers.IntegerField(
+        required=True,
+        read_only=False,
+        write_only=False,
+        error_messages={
+            'required': 'The job id field is required.',
+        }
+    )
+
+
+class BackgroundJobModelSerializer(serializers.ModelSerializer):
+    """Model serializer for background job status"""
+    class Meta:
+        model = BackgroundJob
+        fields = (
+            'id',
+            'name',
+            'status',
+            'attempts',
+            'max_attempts',
+            'run_after',
+            'result',
+            'user',
+            'date_created',
+            'date_modified'
+        )
+
+
+class ExportDataSerializer(BaseFormSerializer):
+    """Serializer for the dataset, format and filters of a data export"""
+    dataset = serializers.ChoiceField(
+        choices=list(EXPORT_DATASETS),
+        required=True,
+        read_only=False,
+        write_only=False,
+        error_messages={
+            'required': 'The dataset field is required.',
+            'invalid_choice': f"The dataset must be one of {', '.join(EXPORT_DATASETS)}."
+        }
+    )
+    export_format = serializers.ChoiceField(
+        choices=list(EXPORT_FORMATS),
+        required=False,
+        default='csv',
+        read_only=False,
+        write_only=False,
+        error_messages={
+            'invalid_choice': 'The export format must be csv or parquet.'
+        }
+    )
+    date_from = serializers.DateField(
+        required=False,
+        allow_null=True,
+        read_only=False,
+        write_only=False
+    )
+    date_to = serializers.DateField(
+        required=False,
+        allow_null=True,
+        read_only=False,
+        write_only=False
+    )
+    application_type_id = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        read_only=False,
+        write_only=False
+    )
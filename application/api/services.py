@@ -0,0 +1,477 @@
+"""
+Additional functions for application api shared by claims and surveys.
+"""
+from __future__ import annotations
+import base64
+import binascii
+import hashlib
+import json
+from datetime import date, datetime, timedelta
+from application.lazy import lazy_module
+from django.db.models import Count, QuerySet
+from django.utils import timezone
+from application.models import Application, Assessment
+from application.metrics import measured
+import system_management.constants as constants
+
+
+pd = lazy_module('pandas')
+
+
+def encode_cursor(application_id: int) -> str:
+    """
+    Encode the last application id of a page as an opaque cursor
+
+    Args:
+        application_id (int): id of the last application on the page
+
+    Returns:
+        str: url safe cursor
+    """
+    return base64.urlsafe_b64encode(str(application_id).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decode a cursor back to the application id it points at
+
+    Args:
+        cursor (str): cursor returned with the previous page
+
+    Raises:
+        ValueError: when the cursor is not a valid cursor
+
+    Returns:
+        int: application id to continue after
+    """
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+        raise ValueError(f"Invalid cursor: {cursor}") from error
+
+
+def filter_listing_applications(link_queryset: QuerySet, filters: dict) -> QuerySet:
+    """
+    Applications linked to a claim or survey queryset filtered server side
+
+    Args:
+        link_queryset (QuerySet): Claim or Survey queryset linking the applications
+        filters (dict): optional status, assessor_id and application_type_id
+
+    Returns:
+        QuerySet: filtered applications
+    """
+    application_type_id = filters.get('application_type_id')
+    if application_type_id:
+        link_queryset = link_queryset.filter(application_type_id=application_type_id)
+
+    applications = Application.objects.filter(
+        id__in=link_queryset.values_list('application_id', flat=True)
+    )
+
+    application_status = filters.get('status')
+    if application_status:
+        applications = applications.filter(application_status__name=application_status)
+
+    assessor_id = filters.get('assessor_id')
+    if assessor_id:
+        applications = applications.filter(assessor_id=assessor_id)
+
+    return applications
+
+
+def paginate_applications(applications: QuerySet, cursor: str, page_size: int) -> tuple:
+    """
+    Keyset page of applications, newest first
+
+    Args:
+        applications (QuerySet): filtered applications
+        cursor (str): cursor of the previous page or None for the first page
+        page_size (int): number of applications on the page
+
+    Returns:
+        tuple: applications on the page and the cursor of the next page or None
+    """
+    applications = applications.order_by('-id')
+
+    if cursor:
+        applications = applications.filter(id__lt=decode_cursor(cursor))
+
+    page = list(applications[:page_size + 1])
+    next_cursor = None
+
+    if len(page) > page_size:
+        page = page[:page_size]
+        next_cursor = encode_cursor(page[-1].id)
+
+    return page, next_cursor
+
+
+def count_applications_by_status(applications: QuerySet) -> dict:
+    """
+    Number of applications per application status in one grouped query
+
+    Args:
+        applications (QuerySet): filtered applications
+
+    Returns:
+        dict: application status name to count, and the total
+    """
+    counts = applications.order_by().values(
+        'application_status__name'
+    ).annotate(
+        total=Count('id')
+    )
+
+    data = {
+        row['application_status__name']: row['total'] for row in counts
+    }
+    data['total'] = sum(data.values())
+    return data
+
+
+def month_window(year: int, month: int) -> tuple:
+    """
+    Calendar window of a month, from its first day up to the first day of the next
+
+    Args:
+        year (int): year of the month
+        month (int): month number
+
+    Returns:
+        tuple: aware start and end datetimes in the current time zone
+    """
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return (
+        timezone.make_aware(datetime(year, month, 1)),
+        timezone.make_aware(datetime(next_year, next_month, 1))
+    )
+
+
+def month_grid_window(year: int, month: int, first_weekday: int) -> tuple:
+    """
+    Calendar window of the full weeks a month grid shows
+
+    The grid starts with the week of the first day of the month and ends with
+    the week of its last day, so the days of the previous and next months it
+    shows have their events too.
+
+    Args:
+        year (int): year of the month
+        month (int): month number
+        first_weekday (int): first day of a grid week, 0 is Monday and 6 Sunday
+
+    Returns:
+        tuple: aware start and end datetimes in the current time zone
+    """
+    first_day = date(year, month, 1)
+    last_day = timezone.localtime(month_window(year, month)[1]).date() - timedelta(days=1)
+
+    grid_start = first_day - timedelta(days=(first_day.weekday() - first_weekday) % 7)
+    grid_end = last_day + timedelta(days=(first_weekday + 6 - last_day.weekday()) % 7 + 1)
+
+    return (
+        timezone.make_aware(datetime.combine(grid_start, datetime.min.time())),
+        timezone.make_aware(datetime.combine(grid_end, datetime.min.time()))
+    )
+
+
+def day_window(day: date) -> tuple:
+    """
+    Calendar window of a single day
+
+    Args:
+        day (date): day of the window
+
+    Returns:
+        tuple: aware start and end datetimes in the current time zone
+    """
+    return (
+        timezone.make_aware(datetime.combine(day, datetime.min.time())),
+        timezone.make_aware(datetime.combine(day + timedelta(days=1), datetime.min.time()))
+    )
+
+
+def calendar_assessments(user) -> QuerySet:
+    """
+    Assessments a user may see in the calendar
+
+    Admins see every assessment, clients the assessments of their applications
+    and assessors the assessments of the applications assigned to them.
+
+    Args:
+        user (User): user the calendar is shown to
+
+    Returns:
+        QuerySet: assessments of the user
+    """
+    if user.user_type.name == constants.ADMIN:
+        return Assessment.objects.all()
+    if user.user_type.name == constants.CLIENT_ROLE:
+        return Assessment.objects.filter(application_id__client_id__email=user.email)
+    return Assessment.objects.filter(application_id__assessor_id=user.id)
+
+
+def in_window(assessments: QuerySet, start: datetime, end: datetime) -> QuerySet:
+    """
+    Assessments scheduled in the [start, end) window, in order of their start
+
+    The window is a range on the indexed scheduled date time, so the database
+    reads the assessments of the window only.
+
+    Args:
+        assessments (QuerySet): assessments to filter
+        start (datetime): first moment of the window
+        end (datetime): first moment after the window
+
+    Returns:
+        QuerySet: assessments in the window
+    """
+    return assessments.filter(
+        scheduled_date_time__gte=start,
+        scheduled_date_time__lt=end
+    ).order_by('scheduled_date_time', 'id')
+
+
+def calendar_event_records(assessments: QuerySet) -> list:
+    """
+    Fields of the assessments the calendar draws its events with
+
+    The other fields of an assessment are loaded with get_assessment_info_api
+    when an event is opened.
+
+    Args:
+        assessments (QuerySet): assessments of the window, in order
+
+    Returns:
+        list: event records with their times formatted in the current time zone
+    """
+    records = list(assessments.values(
+        'id',
+        'summary',
+        'scheduled_date_time',
+        'end_date_time',
+        'application_id'
+    ))
+    for record in records:
+        for field in ('scheduled_date_time', 'end_date_time'):
+            record[field] = timezone.localtime(record[field]).strftime("%Y-%m-%d %H:%M:%S")
+    return records
+
+
+def records_etag(records) -> str:
+    """
+    Entity tag of a json serializable response body
+
+    Args:
+        records (list | dict): data returned by the api
+
+    Returns:
+        str: quoted entity tag that changes whenever the data does
+    """
+    body = json.dumps(records, sort_keys=True, default=str)
+    return f'"{hashlib.sha1(body.encode()).hexdigest()}"'
+
+
+def group_records(records, foreign_key: str) -> dict:
+    """
+    Group child records on their parent key in a single pass
+
+    Records without a parent key are left out, as they never match a parent.
+
+    Args:
+        records (iterable): child records as dictionaries
+        foreign_key (str): key of the record holding the parent id
+
+    Returns:
+        dict: parent id to the list of its child records, in the original order
+    """
+    groups = {}
+    for record in records:
+        parent_id = record[foreign_key]
+        if parent_id is None or parent_id != parent_id:
+            continue
+        groups.setdefault(parent_id, []).append(record)
+    return groups
+
+
+def filter_records(records, **conditions) -> list:
+    """
+    Records whose fields equal the given values, without a DataFrame
+
+    Args:
+        records (iterable): records as dictionaries
+        **conditions: field names and the values they must equal
+
+    Returns:
+        list: matching records, in the original order
+    """
+    return [
+        record for record in records
+        if all(record.get(field) == value for field, value in conditions.items())
+    ]
+
+
+def nest_records(
+        parents: list,
+        parent_key: str,
+        children,
+        foreign_key: str,
+        field: str
+        ) -> list:
+    """
+    Add the child records of every parent record under a field, without a DataFrame
+
+    The pure Python counterpart of ``nest_children`` for the small record sets
+    of single requests, where building DataFrames costs more than the nesting.
+
+    Args:
+        parents (list): parent records, changed in place
+        parent_key (str): parent field matched against the child foreign key
+        children (iterable): child records
+        foreign_key (str): child field holding the parent id
+        field (str): parent field the list of children is saved in
+
+    Returns:
+        list: the parent records
+    """
+    groups = group_records(children, foreign_key)
+    for parent in parents:
+        parent[field] = list(groups.get(parent[parent_key], []))
+    return parents
+
+
+@measured('pandas')
+def nest_children(
+        parent_df: pd.DataFrame,
+        parent_key: str,
+        child_df: pd.DataFrame,
+        foreign_key: str
+        ) -> pd.Series:
+    """
+    Child records of every parent row, grouped once instead of filtered per parent
+
+    Gives the same lists as applying
+    ``child_df.loc[child_df[foreign_key] == parent_id].to_dict('records')``
+    to every parent id.
+
+    Args:
+        parent_df (DataFrame): parent data
+        parent_key (str): parent column matched against the child foreign key
+        child_df (DataFrame): child data
+        foreign_key (str): child column holding the parent id
+
+    Returns:
+        Series: list of child records for every parent row
+    """
+    groups = {}
+    if not child_df.empty:
+        groups = group_records(child_df.to_dict('records'), foreign_key)
+
+    return parent_df[parent_key].apply(
+        lambda parent_id:
+        list(groups.get(parent_id, []))
+    )
+
+
+def plan_answer_upserts(
+        answers: list,
+        questions: dict,
+        saved_answers: dict,
+        new_answer
+        ) -> tuple:
+    """
+    Work out in memory which question answers to create and which to update
+
+    Answers are applied in order with the rules the per answer save used:
+    a question without an answer gets a new one. A question with an other
+    field keeps its option answer first and its 'other' text second, so an
+    'other' answer is added next to a single option answer and otherwise
+    updates the last answer, while any other answer updates the first one.
+    Every answer of a question without an other field is updated.
+    Answers of questions that do not exist are skipped.
+
+    Args:
+        answers (list): answers with question_id, question_type and answer
+        questions (dict): question id to its has_other_field flag
+        saved_answers (dict): question id to its saved answers ordered by id,
+            changed in place with the answers planned for creation
+        new_answer (callable): builds an unsaved answer from a question id
+            and the answer text
+
+    Returns:
+        tuple: answers to create and saved answers to update
+    """
+    creates = []
+    updates = {}
+
+    for answer in answers:
+        question_id = answer['question_id']
+        if question_id not in questions:
+            continue
+
+        has_other_field = questions[question_id]
+        is_other = answer['question_type'] == 'other'
+        question_answers = saved_answers.setdefault(question_id, [])
+
+        if not question_answers or (
+                has_other_field and is_other and len(question_answers) == 1
+        ):
+            instance = new_answer(question_id, answer['answer'])
+            question_answers.append(instance)
+            creates.append(instance)
+            continue
+
+        if not has_other_field:
+            targets = question_answers
+        elif is_other:
+            targets = question_answers[-1:]
+        else:
+            targets = question_answers[:1]
+
+        for instance in targets:
+            instance.answer = answer['answer']
+            if instance.pk is not None:
+                updates[instance.pk] = instance
+
+    return creates, list(updates.values())
+
+
+def save_question_answers(
+        answers: list,
+        questions: dict,
+        answer_queryset: QuerySet,
+        new_answer
+        ) -> None:
+    """
+    Save question answers with one read and one bulk write per operation
+
+    Call it inside ``transaction.atomic`` so the answers are saved together.
+
+    Args:
+        answers (list): answers with question_id, question_type and answer
+        questions (dict): question id to its has_other_field flag
+        answer_queryset (QuerySet): saved answers of the claim or survey for
+            the questions
+        new_answer (callable): builds an unsaved answer from a question id
+            and the answer text
+    """
+    saved_answers = {}
+    for instance in answer_queryset.order_by('id'):
+        saved_answers.setdefault(instance.question_id, []).append(instance)
+
+    creates, updates = plan_answer_upserts(
+        answers, questions, saved_answers, new_answer
+    )
+
+    if creates:
+        answer_queryset.model.objects.bulk_create(creates)
+
+    if updates:
+        date_modified = timezone.now()
+        for instance in updates:
+            instance.date_modified = date_modified
+
+        answer_queryset.model.objects.bulk_update(
+            updates, ['answer', 'date_modified']
+        )
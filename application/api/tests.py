@@ -1,4 +1,173 @@
 """
 Application api test cases.
 """
-from django.test import TestCase
+import json
+from datetime import date
+from types import SimpleNamespace
+import pandas as pd
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+from application.api.serializers import CalendarWindowSerializer
+from application.api.services import (
+    day_window,
+    month_grid_window,
+    month_window,
+    nest_children,
+    plan_answer_upserts,
+    records_etag
+)
+
+
+class PlanAnswerUpsertsTestCase(SimpleTestCase):
+    """
+    The bulk answer plan follows the rules of the per answer save.
+    """
+
+    @staticmethod
+    def new_answer(question_id, answer):
+        return SimpleNamespace(pk=None, question_id=question_id, answer=answer)
+
+    def test_creates_missing_answers(self):
+        creates, updates = plan_answer_upserts(
+            [
+                {'question_id': 1, 'question_type': 'text', 'answer': 'a'},
+                {'question_id': 2, 'question_type': 'text', 'answer': 'b'},
+                {'question_id': 3, 'question_type': 'text', 'answer': 'c'}
+            ],
+            {1: False, 2: True},
+            {},
+            self.new_answer
+        )
+
+        self.assertEqual([answer.answer for answer in creates], ['a', 'b'])
+        self.assertEqual(updates, [])
+
+    def test_updates_every_answer_without_other_field(self):
+        saved = [
+            SimpleNamespace(pk=1, question_id=1, answer='old'),
+            SimpleNamespace(pk=2, question_id=1, answer='old')
+        ]
+        creates, updates = plan_answer_upserts(
+            [{'question_id': 1, 'question_type': 'text', 'answer': 'new'}],
+            {1: False},
+            {1: list(saved)},
+            self.new_answer
+        )
+
+        self.assertEqual(creates, [])
+        self.assertEqual([answer.answer for answer in updates], ['new', 'new'])
+
+    def test_other_field_answers(self):
+        saved = SimpleNamespace(pk=1, question_id=1, answer='option')
+        creates, updates = plan_answer_upserts(
+            [
+                {'question_id': 1, 'question_type': 'checkbox', 'answer': 'first'},
+                {'question_id': 1, 'question_type': 'other', 'answer': 'other'},
+                {'question_id': 1, 'question_type': 'other', 'answer': 'changed'}
+            ],
+            {1: True},
+            {1: [saved]},
+            self.new_answer
+        )
+
+        self.assertEqual(saved.answer, 'first')
+        self.assertEqual(updates, [saved])
+        self.assertEqual([answer.answer for answer in creates], ['changed'])
+
+
+class NestChildrenTestCase(SimpleTestCase):
+    """
+    The grouped nesting gives the same tree as the per parent DataFrame filter.
+    """
+
+    @staticmethod
+    def filter_children(parent_df, parent_key, child_df, foreign_key):
+        return parent_df[parent_key].apply(
+            lambda parent_id:
+            child_df.loc[
+                child_df[foreign_key] == parent_id
+            ].to_dict('records')
+        )
+
+    @staticmethod
+    def category_tree(nest):
+        df_types = pd.DataFrame([
+            {'id': 1, 'name': 'Personal'},
+            {'id': 2, 'name': 'Business'},
+            {'id': 3, 'name': 'Empty'}
+        ])
+        df_cause = pd.DataFrame([
+            {'id': 10, 'name': 'Fire', 'application_type_id': 2},
+            {'id': 11, 'name': 'Theft', 'application_type_id': 1},
+            {'id': 12, 'name': 'Flood', 'application_type_id': 2},
+            {'id': 13, 'name': 'Other', 'application_type_id': None}
+        ])
+        df_what = pd.DataFrame([
+            {'id': 100, 'name': 'Stock', 'cause_id': 12},
+            {'id': 101, 'name': 'Vehicle', 'cause_id': 11},
+            {'id': 102, 'name': 'Building', 'cause_id': 12},
+            {'id': 103, 'name': 'Unlinked', 'cause_id': 99}
+        ])
+
+        df_cause['what_category'] = nest(df_cause, 'id', df_what, 'cause_id')
+        df_types['categories'] = nest(df_types, 'id', df_cause, 'application_type_id')
+        return df_types.to_dict('records')
+
+    def test_same_category_tree(self):
+        self.assertEqual(
+            json.dumps(self.category_tree(nest_children), default=str),
+            json.dumps(self.category_tree(self.filter_children), default=str)
+        )
+
+
+class CalendarWindowTestCase(SimpleTestCase):
+    """
+    The calendar reads [start, end) windows of bounded length.
+    """
+
+    def test_month_window(self):
+        start, end = month_window(2024, 12)
+
+        self.assertEqual(timezone.localtime(start).date(), date(2024, 12, 1))
+        self.assertEqual(timezone.localtime(end).date(), date(2025, 1, 1))
+
+    def test_month_grid_window(self):
+        sunday_start, sunday_end = month_grid_window(2024, 5, 6)
+        monday_start, monday_end = month_grid_window(2024, 5, 0)
+
+        self.assertEqual(timezone.localtime(sunday_start).date(), date(2024, 4, 28))
+        self.assertEqual(timezone.localtime(sunday_end).date(), date(2024, 6, 2))
+        self.assertEqual(timezone.localtime(monday_start).date(), date(2024, 4, 29))
+        self.assertEqual(timezone.localtime(monday_end).date(), date(2024, 6, 3))
+
+    def test_day_window(self):
+        start, end = day_window(date(2024, 2, 29))
+
+        self.assertEqual(timezone.localtime(start).date(), date(2024, 2, 29))
+        self.assertEqual(timezone.localtime(end).date(), date(2024, 3, 1))
+        self.assertEqual(timezone.localtime(start).hour, 0)
+
+    @override_settings(CALENDAR_MAX_WINDOW_DAYS=62)
+    def test_window_validation(self):
+        self.assertTrue(CalendarWindowSerializer(
+            data={'start': '2024-05-01', 'end': '2024-06-01'}
+        ).is_valid())
+        self.assertFalse(CalendarWindowSerializer(
+            data={'start': '2024-06-01', 'end': '2024-05-01'}
+        ).is_valid())
+        self.assertFalse(CalendarWindowSerializer(
+            data={'start': '2024-01-01', 'end': '2024-12-31'}
+        ).is_valid())
+        self.assertFalse(CalendarWindowSerializer(
+            data={'start': '2024-05-01'}
+        ).is_valid())
+
+    def test_records_etag(self):
+        events = [{'id': 1, 'summary': 'Assessment'}]
+
+        self.assertEqual(records_etag(events), records_etag([dict(events[0])]))
+        self.assertNotEqual(
+            records_etag(events),
+            records_etag([{'id': 1, 'summary': 'Assessment moved'}])
+        )
+        self.assertTrue(records_etag(events).startswith('"'))
@@ -32,6 +32,7 @@ urlpatterns = [
      path('change_status_api/', views.change_status_api, name="change_status_api"),
 
      path('event_calendar_api/', views.event_calendar_api, name="event_calendar_api"),
+     path('calendar_events_api/', views.calendar_events_api, name="calendar_events_api"),
      path('get_assessments_api/', views.get_assessments_api, name="get_assessments_api"),
      path('get_assessment_info_api/', views.get_assessment_info_api, name="get_assessment_info_api"),
      path('create_room_api/', views.create_room_api, name="create_room_api"),
@@ -40,4 +41,7 @@ urlpatterns = [
      path('video_conference_api/', views.video_conference_api, name="video_conference_api"),
      path('mark_event_complete_api/', views.mark_event_complete_api, name="mark_event_complete_api"),
      path('recording_to_s3_api/', views.recording_to_s3_api, name="recording_to_s3_api"),
+     path('get_job_status_api/', views.get_job_status_api, name="get_job_status_api"),
+    path('export_data_api/', views.export_data_api, name="export_data_api"),
+    path('get_request_metrics_api/', views.get_request_metrics_api, name="get_request_metrics_api"),
 ]
@@ -3,13 +3,12 @@ Application front end logic views containing the following views.
 
 """
 import json
-import io
-from system_management.amazons3 import delete_s3_file, upload_to_s3, open_s3_file
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from system_management.amazons3 import delete_s3_file
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
-from twilio.jwt.access_token import AccessToken
-from twilio.jwt.access_token.grants import VideoGrant
 from application.api.serializers import GetApplicationStatusSerializer
 import system_management.constants as constants
 from system_management.models import (
@@ -30,7 +29,8 @@ from application.models import (
     Business,
     ClientIncident,
     TwilioRoom,
-    TwilioRecording
+    TwilioRecording,
+    BackgroundJob
 )
 from application.api.serializers import (
     AssessmentSerializer,
@@ -54,16 +54,34 @@ from application.api.serializers import (
     GetAssessmentInfoSerializer,
     GetRoomSerializer,
     EventCalendarSerializer,
+    CalendarWindowSerializer,
     GetAssessmentEventTokenSerializer,
-    TwilioRoomModelSerializer
+    TwilioRoomModelSerializer,
+    GetJobStatusSerializer,
+    BackgroundJobModelSerializer,
+    ExportDataSerializer
+)
+from application.clients import get_twilio_client
+from application.data_export import EXPORT_FORMATS, iter_export
+from application.jobs import enqueue_job
+from application.metrics import endpoint_metrics, query_budget
+from application.api.services import (
+    calendar_assessments,
+    calendar_event_records,
+    day_window,
+    in_window,
+    records_etag
+)
+from application.tasks import (
+    CREATE_TWILIO_ROOM,
+    RECORDING_TO_S3,
+    INSERT_CALENDAR_EVENT
 )
 from surveys.models import (
     Survey
 )
 from decouple import config
-from twilio.rest import Client as CL
-import twilio
-import pandas as pd
+from application.lazy import lazy_module
 from claims.models import (
     HowQuestionAnswer,
     WhatQuestionAnswer,
@@ -76,6 +94,9 @@ from claims.models import (
 )
 
 
+twilio_exceptions = lazy_module('twilio.base.exceptions')
+
+
 @api_view(['GET'])
 def get_application_types_api(request):
     """
@@ -89,17 +110,17 @@ def get_application_types_api(request):
     if request.method == "GET":
         application_types = ApplicationType.objects.all()
         serializer = ApplicationTypeSerializer(application_types, many=True)
-        data = json.dumps({
+        data = {
             "status": "success",
             "data": serializer.data
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             'status': "error",
             'message': constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data, status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
@@ -125,28 +146,28 @@ def join_meeting_api(request):
             location = serializer.validated_data.get('gps_coordinates')
 
         else:
-            data = json.dumps({
+            data = {
                 'status': "error",
                 'message': str(serializer.errors)
-            })
+            }
             return Response(data, status.HTTP_400_BAD_REQUEST)
 
         assessment = Assessment.objects.get(id=assessment_id)
         assessment.client_location = location
         assessment.save()
 
-        data = json.dumps({
+        data = {
             'status': 'success',
             'message': 'Assessment joined successfully'
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
 
-        data = json.dumps({
+        data = {
             'status': "error",
             'message': constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data, status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
@@ -165,11 +186,11 @@ def insurance_providers_api(request):
         all_providers = InsuranceProvider.objects.all()
         serializer = InsuranceProviderModelSerializer(all_providers, many=True)
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "Insurance providers retrieved successfully.",
             "data": serializer.data
-        })
+        }
 
         return Response(data=data, status=status.HTTP_200_OK)
 
@@ -197,10 +218,10 @@ def add_insurance_provider_api(request):
             contact_no = validated_data['contact_no']
 
             if InsuranceProvider.objects.filter(insurance_name=insurance_name).exists():
-                data = json.dumps({
+                data = {
                     'status': "error",
                     'message': f"Insurance Provider with name {insurance_name} already exists."
-                })
+                }
                 return Response(data, status.HTTP_400_BAD_REQUEST)
 
             InsuranceProvider.objects.create(
@@ -212,18 +233,18 @@ def add_insurance_provider_api(request):
             all_providers = InsuranceProvider.objects.all()
             updated_serializer = InsuranceProviderModelSerializer(all_providers, many=True)
 
-            response_data = json.dumps({
+            response_data = {
                 "status": "success",
                 "message": "Insurance provider added successfully",
                 "data": updated_serializer.data
-            })
+            }
 
             return Response(response_data, status=status.HTTP_201_CREATED)
         else:
-            response_data = json.dumps({
+            response_data = {
                 "status": "error",
                 "errors": serializer.errors
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -259,19 +280,19 @@ def edit_insurance_provider_api(request):
             all_providers = InsuranceProvider.objects.all()
             updated_serializer = InsuranceProviderModelSerializer(all_providers, many=True)
 
-            response_data = json.dumps({
+            response_data = {
                 "status": "success",
                 "message": "Insurance provider added successfully",
                 "data": updated_serializer.data
-            })
+            }
 
             return Response(response_data, status=status.HTTP_201_CREATED)
 
         else:
-            response_data = json.dumps({
+            response_data = {
                 "status": "error",
                 "errors": serializer.errors
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -299,10 +320,10 @@ def del_insurance_provider_api(request):
                 insurance = InsuranceProvider.objects.get(id=insurance_id)
 
             except InsuranceProvider.DoesNotExist:
-                response_data = json.dumps({
+                response_data = {
                     "status": "error",
                     "message": "Insurance provider does not exist"
-                })
+                }
                 return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
             Client.objects.filter(
@@ -315,19 +336,19 @@ def del_insurance_provider_api(request):
             all_providers = InsuranceProvider.objects.all()
             updated_serializer = InsuranceProviderModelSerializer(all_providers, many=True)
 
-            response_data = json.dumps({
+            response_data = {
                 "status": "success",
                 "message": "Insurance provider deleted successfully",
                 "data": updated_serializer.data
-            })
+            }
 
             return Response(response_data, status=status.HTTP_201_CREATED)
 
         else:
-            response_data = json.dumps({
+            response_data = {
                 "status": "error",
                 "errors": serializer.errors
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -346,10 +367,10 @@ def create_application_api(request):
         serializer = CreateApplicationSerializer(data=body)
 
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors),
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -361,19 +382,19 @@ def create_application_api(request):
         try:
             client = Client.objects.get(id=client_id)
         except Client.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Client does not exist'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         try:
             application_type = ApplicationType.objects.get(name=application_type)
         except ApplicationType.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Application type does not exist'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         try:
@@ -404,21 +425,21 @@ def create_application_api(request):
 
             application.delete()
 
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Application category does not exist'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         data = {
             'id': application.id,
         }
 
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': 'Application created successfully',
             'data': data
-        })
+        }
         return Response(response_data, status=status.HTTP_201_CREATED)
 
 
@@ -441,10 +462,10 @@ def edit_assessment_note_file_api(request):
         serializer = SingleAssessmentNoteSerializer(data=body)
 
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors),
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -452,20 +473,20 @@ def edit_assessment_note_file_api(request):
         assessment_note = AssessmentNote.objects.filter(id=notes_id)
 
         if not assessment_note.exists():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Assessment note not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         assessment_note = assessment_note.first()
         serializer = AssessmentNoteModalSerializer(assessment_note)
 
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': 'Assessment note file data',
             'data': serializer.data
-        })
+        }
         return Response(response_data, status=status.HTTP_200_OK)
 
     elif request.method == 'POST':
@@ -473,10 +494,10 @@ def edit_assessment_note_file_api(request):
 
         serializer = EditAssessmentNoteFileSerializer(data=body)
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors),
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -487,19 +508,19 @@ def edit_assessment_note_file_api(request):
             assessment_note = AssessmentNote.objects.get(id=notes_id)
 
         except AssessmentNote.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Assessment note not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         assessment_note.file = file
         assessment_note.save()
 
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': 'File uploaded successfully'
-        })
+        }
         return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
 
@@ -520,10 +541,10 @@ def save_assessment_notes_api(request):
         serializer = CreateAssessmentNotesSerializer(data=body)
 
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors),
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -536,20 +557,20 @@ def save_assessment_notes_api(request):
             assessment = Assessment.objects.get(id=assessment_id)
 
         except Assessment.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Assessment not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         try:
             claim = Claim.objects.get(id=claim_id)
 
         except Claim.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Claim not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         if AssessmentNote.objects.filter(
@@ -557,10 +578,10 @@ def save_assessment_notes_api(request):
                 claim_id=claim_id,
                 note=description
         ).exists():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Assessment with description already exists'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         AssessmentNote.objects.create(
@@ -570,10 +591,10 @@ def save_assessment_notes_api(request):
             file=file,
         )
 
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': 'Assessment note saved successfully'
-        })
+        }
         return Response(response_data, status=status.HTTP_201_CREATED)
 
 
@@ -592,10 +613,10 @@ def create_assessment_api(request):
     body = json.loads(request.body)
     serializer = CreateAssessmentSerializer(data=body)
     if not serializer.is_valid():
-        response_data = json.dumps({
+        response_data = {
             'status': 'error',
             'message': str(serializer.errors),
-        })
+        }
         return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
     validated_data = serializer.validated_data
@@ -606,15 +627,16 @@ def create_assessment_api(request):
     end_time = validated_data.get('end_time')
     event_summary = validated_data.get('event_summary')
     event_id = validated_data.get('event_id')
+    event = validated_data.get('event')
 
     try:
         application = Application.objects.get(id=application_id)
 
     except Application.DoesNotExist:
-        response_data = json.dumps({
+        response_data = {
             'status': 'error',
             'message': 'Application not found'
-        })
+        }
         return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
     application_stats = ApplicationStatus.objects.values(
@@ -656,11 +678,23 @@ def create_assessment_api(request):
         application.application_status_id = application_status_id
         application.save()
 
-    response_data = json.dumps({
+    response_data = {
         'status': 'success',
         'message': 'Assessment created successfully',
         'assessment_id': assessment.id
-    })
+    }
+
+    if event:
+        job = enqueue_job(
+            INSERT_CALENDAR_EVENT,
+            {'assessment_id': assessment.id, 'event': event},
+            idempotency_key=(
+                f"{INSERT_CALENDAR_EVENT}:{assessment.id}:"
+                f"{event['start']['dateTime']}:{event['end']['dateTime']}"
+            )
+        )
+        response_data['job_id'] = job.id
+
     return Response(response_data, status=status.HTTP_201_CREATED)
 
 
@@ -680,10 +714,10 @@ def get_application_api(request):
         body = json.loads(request.body)
         serializer = GetApplicationSerializer(data=body)
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors),
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -694,21 +728,21 @@ def get_application_api(request):
         )
 
         if not application.exists():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Application not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         application = application.first()
 
         application_serializer = ApplicationAssessmentSerializer(application)
 
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': 'Application found successfully',
             'application': application_serializer.data,
-        })
+        }
 
         return Response(response_data, status=status.HTTP_200_OK)
 
@@ -719,10 +753,10 @@ def complete_status_api(request):
         body = json.loads(request.body)
         serializer = GetApplicationStatusSerializer(data=body)
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -734,10 +768,10 @@ def complete_status_api(request):
             application = Application.objects.get(id=application_id
                                                   )
         except Application.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Application not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         application_stats = ApplicationStatus.objects.values(
@@ -751,19 +785,19 @@ def complete_status_api(request):
                 name=constants.COMPLETED
             )
         else:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Application status does not exists'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         application.application_status_id = application_status.id
         application.save()
 
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': 'Application completed successfully',
-        })
+        }
 
         return Response(response_data, status=status.HTTP_200_OK)
 
@@ -784,10 +818,10 @@ def change_status_api(request):
         body = json.loads(request.body)
         serializer = GetApplicationStatusSerializer(data=body)
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -798,29 +832,29 @@ def change_status_api(request):
             application = Application.objects.get(id=application_id
                                                   )
         except Application.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Application not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         try:
             application_status = ApplicationStatus.objects.get(name=application_status)
 
         except ApplicationStatus.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Application Status not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         application.application_status_id = application_status.id
         application.save()
 
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': 'Application status changed successfully',
-        })
+        }
 
         return Response(response_data, status=status.HTTP_200_OK)
 
@@ -830,6 +864,9 @@ def event_calendar_api(request):
     """
     Events for assessments scheduled for applications.
 
+    The start and end of the visible window are optional, without them every
+    assessment of the user is returned.
+
     :param request:
         Django request parameter.
     
@@ -840,10 +877,10 @@ def event_calendar_api(request):
     if request.method == "GET":
         serializer = EventCalendarSerializer(data=request.data)
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -851,36 +888,79 @@ def event_calendar_api(request):
         try:
             user = User.objects.get(id=user_id)
         except User.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'User not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
-        if user.user_type.name == constants.ADMIN:
-            assessments = Assessment.objects.all()
-        elif user.user_type.name == constants.CLIENT_ROLE:
-            assessments = Assessment.objects.filter(
-            application_id__client_id__email = user.email)
-        else:
-            assessments = Assessment.objects.filter(
-                application_id__assessor_id = user_id
+        assessments = calendar_assessments(user)
+
+        if validated_data.get('start'):
+            assessments = in_window(
+                assessments,
+                validated_data.get('start'),
+                validated_data.get('end')
             )
+        else:
+            assessments = assessments.order_by('scheduled_date_time')
 
         assessments_serializer = AssessmentModelSerializer(assessments, many=True)
-        df_assessments = pd.DataFrame(assessments_serializer.data)
-
-        if not df_assessments.empty:
-            df_assessments = df_assessments.sort_values(by='scheduled_date_time')
 
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': 'Assessments retrieved successfully',
-            'data': df_assessments.to_dict(orient='records')
-        })
+            'data': assessments_serializer.data
+        }
         return Response(data=response_data, status=status.HTTP_200_OK)
 
 
+@api_view(['GET'])
+@query_budget(5)
+def calendar_events_api(request):
+    """
+    Calendar events of the requesting user in a [start, end) window.
+
+    Only the fields the calendar draws are returned, in order of their start.
+    The response carries an ETag, a request with a matching If-None-Match
+    header is answered with 304 Not Modified and no body.
+
+    :param request:
+        Django request parameter.
+
+    :return:
+        - GET:
+            Response of api call with data and status of api call.
+    """
+    if request.method == 'GET':
+        body = json.loads(request.body) if request.body else request.query_params.dict()
+        serializer = CalendarWindowSerializer(data=body)
+
+        if not serializer.is_valid():
+            response_data = {
+                'status': 'error',
+                'message': str(serializer.errors)
+            }
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+
+        validated_data = serializer.validated_data
+        assessments = in_window(
+            calendar_assessments(request.user),
+            validated_data.get('start'),
+            validated_data.get('end')
+        )
+
+        response_data = {
+            'status': 'success',
+            'message': 'Calendar events retrieved successfully',
+            'data': calendar_event_records(assessments)
+        }
+        response = Response(data=response_data, status=status.HTTP_200_OK)
+        response['ETag'] = records_etag(response_data)
+        patch_cache_control(response, private=True, no_cache=True)
+        return get_conditional_response(request, etag=response['ETag'], response=response)
+
+
 @api_view(['POST'])
 def create_room_api(request):
     """
@@ -896,10 +976,10 @@ def create_room_api(request):
         serializer = CreateRoomSerializer(data=request.data)
 
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(data=response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -909,10 +989,10 @@ def create_room_api(request):
             assessment = Assessment.objects.get(id=assessment_id)
 
         except Assessment.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Assessment not found'
-            })
+            }
             return Response(data=response_data, status=status.HTTP_404_NOT_FOUND)
 
         client_object = assessment.application.client
@@ -926,10 +1006,10 @@ def create_room_api(request):
             try:
                 role_client = UserType.objects.get(name = constants.CLIENT_ROLE)
             except UserType.DoesNotExist:
-                response_data = json.dumps({
+                response_data = {
                     'status': 'error',
                     'message': 'User type not found'
-                })
+                }
                 return Response(data=response_data, status=status.HTTP_404_NOT_FOUND)
             user_client = User.objects.create_user(
                 email=client_object.email,
@@ -949,49 +1029,35 @@ def create_room_api(request):
             )
 
         room_name = f"{assessment.summary}_{config('COMPANY_PATH')}"
-        client = CL(config('ACCOUNT_SID'), config('AUTH_TOKEN'))
-        try:
-            room = client.video.v1.rooms.create(
-                record_participants_on_connect=True,
-                type='group',
-                unique_name=room_name
-            )
-            TwilioRoom.objects.update_or_create(
-                assessment_id=assessment.id,
-                defaults={
-                    "room_sid":room.sid,
-                    "room_name":room_name,
-                    "room_status":constants.ACTIVE
-                }
-            )
-            
-            data = {
-                'password': password,
-                'email': user_client.email,
-                'first_name': user_client.first_name,
-                'last_name': user_client.last_name,
-            }
-            response_data = json.dumps({
-                'status': 'success',
-                'message': 'Room created successfully',
-                'data': data
-            })
-            return Response(data=response_data, status=status.HTTP_200_OK)
+        idempotency_key = f"{CREATE_TWILIO_ROOM}:{assessment.id}"
+        completed_room = TwilioRoom.objects.filter(
+            assessment_id=assessment.id,
+            room_status=constants.COMPLETE
+        ).first()
 
-        except twilio.base.exceptions.TwilioRestException as e:
-            if 'room exists' in str(e):
-                response_data = json.dumps({
-                    'status': 'success',
-                    'message': 'Room already created successfully'
-                })
-                return Response(data=response_data, status=status.HTTP_200_OK)
-            else:
-                
-                response_data = json.dumps({
-                    'status': 'error',
-                    'message':"Apologies, we have exceeded the allowed rate for requests. kindly wait for a duration of 10 minutes before attempting again. Thank you for your patience and understanding."
-                })
-                return Response(data=response_data, status=status.HTTP_400_BAD_REQUEST)
+        if completed_room is not None:
+            # Twilio reuses the name once the room ended, the key names the room replaced
+            idempotency_key = f"{idempotency_key}:{completed_room.room_sid}"
+
+        job = enqueue_job(
+            CREATE_TWILIO_ROOM,
+            {'assessment_id': assessment.id, 'room_name': room_name},
+            idempotency_key=idempotency_key
+        )
+
+        data = {
+            'password': password,
+            'email': user_client.email,
+            'first_name': user_client.first_name,
+            'last_name': user_client.last_name,
+            'job_id': job.id
+        }
+        response_data = {
+            'status': 'success',
+            'message': 'Room creation queued successfully',
+            'data': data
+        }
+        return Response(data=response_data, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
@@ -1009,31 +1075,31 @@ def complete_room_api(request):
         serializer = GetRoomSerializer(data=request.data)
 
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(data=response_data, status=status.HTTP_400_BAD_REQUEST)
         validated_data = serializer.validated_data
         room_id = validated_data.get('room_id')
-        client = CL(config('ACCOUNT_SID'), config('AUTH_TOKEN'))
+        client = get_twilio_client()
         try:
             twilio_room = TwilioRoom.objects.get(id=room_id)
         except TwilioRoom.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Room not found'
-            })
+            }
             return Response(data=response_data, status=status.HTTP_404_NOT_FOUND)
 
         client.video.v1.rooms(twilio_room.sid).update(status='completed')
         twilio_room.room_status=constants.COMPLETE
         twilio_room.save()
 
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': 'Room completed successfully',
-        })
+        }
         return Response(data=response_data, status=status.HTTP_200_OK)
 
 
@@ -1052,28 +1118,23 @@ def get_assessments_api(request):
         serializer = GetAssessmentsSerializer(data=request.data)
 
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(data=response_data, status=status.HTTP_400_BAD_REQUEST)
         
         validated_data = serializer.validated_data
         date = validated_data.get('date')
 
-        assessments = Assessment.objects.filter(
-            scheduled_date_time__contains=date
-        )
+        assessments = in_window(Assessment.objects.all(), *day_window(date))
         assessments_serializer = AssessmentModelSerializer(assessments, many=True)
-        df_assessments = pd.DataFrame(assessments_serializer.data)
-        if not df_assessments.empty:
-            df_assessments = df_assessments.sort_values(by='scheduled_date_time')
         
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': 'Assessments retrieved successfully',
-            'data': df_assessments.to_dict(orient='records')
-        })
+            'data': assessments_serializer.data
+        }
         return Response(data=response_data, status=status.HTTP_200_OK)
 
 
@@ -1094,10 +1155,10 @@ def get_assessment_info_api(request):
         serializer = GetAssessmentInfoSerializer(data=body)
         
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors),
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -1108,19 +1169,19 @@ def get_assessment_info_api(request):
         )
 
         if not assessment.exists():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Assessment not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         assessment = assessment.first()
         assessment_serializer = AssessmentApplicationSerializer(assessment)
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': 'Assessments retrieved successfully',
             'data': assessment_serializer.data
-        })
+        }
         return Response(data=response_data, status=status.HTTP_200_OK)
 
 
@@ -1135,16 +1196,20 @@ def get_event_token_api(request):
     Return:
         Response: JWT token
     """
+    # pylint: disable=import-outside-toplevel
+    from twilio.jwt.access_token import AccessToken
+    from twilio.jwt.access_token.grants import VideoGrant
+
     if request.method == 'GET':
         body = json.loads(request.body)
         serializer = GetAssessmentEventTokenSerializer(data=body)
         
         
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors),
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -1154,19 +1219,19 @@ def get_event_token_api(request):
         try:
             user = User.objects.get(id=user_id)
         except User.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'User not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         try:
             twilio_room = TwilioRoom.objects.get(id=twilio_room_id)
         except TwilioRoom.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Room not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         account_sid = config('ACCOUNT_SID')
@@ -1193,12 +1258,12 @@ def get_event_token_api(request):
 
         token.add_grant(video_grant)
 
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': 'Token retrieved successfully',
             'token': token.to_jwt(),
             'room_name': room_name
-        })
+        }
         return Response(data=response_data, status=status.HTTP_200_OK)
 
 
@@ -1218,10 +1283,10 @@ def video_conference_api(request):
         serializer = GetAssessmentInfoSerializer(data=body)
         
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors),
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -1232,28 +1297,28 @@ def video_conference_api(request):
         )
 
         if not assessment.exists():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Assessment not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         try:
             twilio_room = TwilioRoom.objects.get(assessment_id=assessment_id)
         except TwilioRoom.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Room not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         room_serializer = TwilioRoomModelSerializer(twilio_room)
 
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': 'Room info retrieved successfully',
             'data': room_serializer.data
-        })
+        }
         return Response(data=response_data, status=status.HTTP_200_OK)
 
 
@@ -1273,10 +1338,10 @@ def mark_event_complete_api(request):
         serializer = GetRoomSerializer(data=body)
         
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors),
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -1285,10 +1350,10 @@ def mark_event_complete_api(request):
         try:
             twilio_room = TwilioRoom.objects.get(id=twilio_room_id)
         except TwilioRoom.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Room not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         try:
@@ -1297,28 +1362,28 @@ def mark_event_complete_api(request):
             twilio_room.room_status = constants.COMPLETE
             twilio_room.save()
 
-            response_data = json.dumps({
+            response_data = {
                 'status': 'success',
                 'message': 'Room completed successfully',
-            })
+            }
             return Response(data=response_data, status=status.HTTP_200_OK)
 
         try:
-            client = CL(config('ACCOUNT_SID'), config('AUTH_TOKEN'))
+            client = get_twilio_client()
             client.video.recordings(twilio_recording.recording_sid).update(status='completed')
             twilio_room.room_status = constants.COMPLETE
             twilio_room.save()
 
-        except twilio.base.exceptions.TwilioRestException:
+        except twilio_exceptions.TwilioRestException:
             twilio_room.room_status = constants.COMPLETE
             twilio_room.save()
 
         finally:
 
-            response_data = json.dumps({
+            response_data = {
                 'status': 'success',
                 'message': 'Room completed successfully',
-            })
+            }
             return Response(data=response_data, status=status.HTTP_200_OK)
 
         
@@ -1338,10 +1403,10 @@ def recording_to_s3_api(request):
         serializer = GetRoomSerializer(data=body)
         
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors),
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -1350,72 +1415,142 @@ def recording_to_s3_api(request):
         try:
             twilio_room = TwilioRoom.objects.get(id=twilio_room_id)
         except TwilioRoom.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': 'Room not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
-        room_sid = twilio_room.room_sid
+        job = enqueue_job(
+            RECORDING_TO_S3,
+            {'room_id': twilio_room.id},
+            idempotency_key=f"{RECORDING_TO_S3}:{twilio_room.room_sid}"
+        )
+        job_serializer = BackgroundJobModelSerializer(job)
+
+        response_data = {
+            'status': 'success',
+            'message': 'Recording upload queued successfully',
+            'data': job_serializer.data
+        }
+        return Response(data=response_data, status=status.HTTP_202_ACCEPTED)
+
+
+@api_view(['GET'])
+def get_job_status_api(request):
+    """
+    Get the status and result of a background job.
+
+    Args:
+        request(Django): Django request parameter.
+
+    Return:
+        Reponse: Background job status.
+    """
+    if request.method == 'GET':
+        body = json.loads(request.body) if request.body else request.query_params.dict()
+        serializer = GetJobStatusSerializer(data=body)
+
+        if not serializer.is_valid():
+            response_data = {
+                'status': 'error',
+                'message': str(serializer.errors),
+            }
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+
+        validated_data = serializer.validated_data
+        job_id = validated_data.get('job_id')
 
         try:
-            client = CL(config('ACCOUNT_SID'), config('AUTH_TOKEN'))
-            recordings = client.video \
-                   .v1 \
-                   .rooms(room_sid) \
-                   .recordings \
-                   .list(limit=20)
-
-            recording_sid = ''
-
-            for recording in recordings:
-                if recording.status == 'completed':
-                    recording_sid = recording.sid            
-
-
-            if recording_sid == '':
-                response_data = json.dumps({
-                    'status': 'success',
-                    'message': 'No recordings found'
-                })
-                return Response(data=response_data, status=status.HTTP_200_OK)
-
-            chosen_recording = client.video.recordings(recording_sid).fetch()
-            recording_buffer = io.BytesIO(chosen_recording.content)
-            file_name = f'assessment_{twilio_room.assessment.id}/recordings/recording_{recording_sid}.mp4'
-            file_path = upload_to_s3(
-                file=recording_buffer,
-                file_name=file_name
-            )
-            TwilioRecording.objects.update_or_create(
-                twilio_room_id = twilio_room.id,
-                defaults={
-                    'recording_sid' : recording_sid,
-                    'recording_url' : file_path
-                }
-            )
-            recording_buffer.close()
-            recording_path = open_s3_file(
-                filepath=file_path
-            )
-            response_data = json.dumps({
-                'status': 'success',
-                'message': 'Recording uploaded successfully',
-                'data': recording_path
-            })
-            return Response(data=response_data, status=status.HTTP_200_OK)
+            job = BackgroundJob.objects.get(id=job_id)
+        except BackgroundJob.DoesNotExist:
+            job = None
 
-        except twilio.base.exceptions.TwilioRestException as e:
-            response_data = json.dumps({
+        if job is not None and job.user_id is not None \
+                and job.user_id != request.user.id \
+                and request.user.user_type.name != constants.ADMIN:
+            job = None
+
+        if job is None:
+            response_data = {
                 'status': 'error',
-                'message': f"Twilio error: {e}"
-            })
-            return Response(data=response_data, status=status.HTTP_400_BAD_REQUEST)
+                'message': 'Job not found'
+            }
+            return Response(response_data, status=status.HTTP_404_NOT_FOUND)
+
+        job_serializer = BackgroundJobModelSerializer(job)
+
+        response_data = {
+            'status': 'success',
+            'message': 'Job retrieved successfully',
+            'data': job_serializer.data
+        }
+        return Response(data=response_data, status=status.HTTP_200_OK)
+
 
-        except Exception as e:
-            response_data = json.dumps({
+@api_view(['GET'])
+def export_data_api(request):
+    """
+    Stream a dataset of the applications as CSV or Parquet, for admins.
+
+    Args:
+        request(Django): Django request parameter.
+
+    Return:
+        StreamingHttpResponse: Export file, or Response with the error.
+    """
+    if request.method == 'GET':
+        if request.user.user_type.name != constants.ADMIN:
+            response_data = {
                 'status': 'error',
-                'message': f"Error: {e}"
-            })
-            return Response(data=response_data, status=status.HTTP_400_BAD_REQUEST)
-        
\ No newline at end of file
+                'message': 'Only admins can export data'
+            }
+            return Response(response_data, status=status.HTTP_403_FORBIDDEN)
+
+        body = json.loads(request.body) if request.body else request.query_params.dict()
+        serializer = ExportDataSerializer(data=body)
+
+        if not serializer.is_valid():
+            response_data = {
+                'status': 'error',
+                'message': str(serializer.errors),
+            }
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+
+        validated_data = serializer.validated_data
+        dataset = validated_data.get('dataset')
+        export_format = validated_data.get('export_format')
+
+        response = StreamingHttpResponse(
+            iter_export(dataset, export_format, validated_data),
+            content_type=EXPORT_FORMATS[export_format]
+        )
+        response['Content-Disposition'] = f'attachment; filename="{dataset}.{export_format}"'
+        return response
+
+
+@api_view(['GET'])
+def get_request_metrics_api(request):
+    """
+    Get the request metrics of the process per endpoint, for admins.
+
+    Args:
+        request(Django): Django request parameter.
+
+    Return:
+        Reponse: Average and maximum metrics per endpoint.
+    """
+    if request.method == 'GET':
+        if request.user.user_type.name != constants.ADMIN:
+            response_data = {
+                'status': 'error',
+                'message': 'Only admins can view the request metrics'
+            }
+            return Response(response_data, status=status.HTTP_403_FORBIDDEN)
+
+        response_data = {
+            'status': 'success',
+            'message': 'Request metrics retrieved successfully',
+            'data': endpoint_metrics.snapshot()
+        }
+        return Response(data=response_data, status=status.HTTP_200_OK)
@@ -0,0 +1,925 @@
+"""
+Synthetic data and a reproducible benchmark of the claim and survey apis.
+
+``seed_benchmark_data`` fills the database with clients, applications,
+claims with their cause, what and how assignments and answers, survey
+catalogs and surveys with answers, and assessments. Every level is created
+with ``bulk_create`` in batches. MySQL does not return the ids of a bulk
+insert, so the ids of a batch are read back from the newest rows of the
+table, the seed has to run alone on its database.
+
+``run_benchmarks`` seeds every data size in a transaction, times the key
+apis and the claim report renderer against it and rolls the transaction
+back. S3, Twilio and Google are replaced with local stand-ins for the run,
+so the timings do not depend on the network. The ``seed_benchmark`` and
+``run_benchmark`` management commands use this module.
+
+``compare_record_paths`` compares the DataFrame and the plain record
+versions of the filtering and nesting of small responses, for the
+``benchmark_records`` management command.
+"""
+import contextlib
+import io
+import json
+import os
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+import system_management.constants as constants
+from system_management.models import User, UserType
+from application.api.services import filter_records, nest_children, nest_records
+from application.clients import CALENDAR, TWILIO, clients
+from application.lazy import lazy_module
+from application.models import (
+    Application,
+    ApplicationStatus,
+    ApplicationType,
+    Assessment,
+    Business,
+    Client,
+    ClientIncident,
+    InsuranceProvider
+)
+from application.storage import override_s3_client, s3_file_url
+from claims.api import views as claim_views
+from claims.api.services import claim_taxonomy_cache, get_application_report
+from claims.models import (
+    ApplicationCause,
+    ApplicationHow,
+    ApplicationWhat,
+    AssessmentNote,
+    CauseCategory,
+    Claim,
+    HowCategory,
+    HowQuestion,
+    HowQuestionAnswer,
+    HowQuestionOption,
+    HowQuestionTitle,
+    WhatCategory,
+    WhatQuestion,
+    WhatQuestionAnswer,
+    WhatQuestionOption,
+    WhatQuestionTitle
+)
+from claims.reports import BACKGROUND_DIR, render_claim_report
+from surveys.api import views as survey_views
+from surveys.api.services import survey_catalog_cache
+from surveys.models import (
+    Survey,
+    SurveyAnswer,
+    SurveyApplicationTitle,
+    SurveyCategory,
+    SurveyCategoryType,
+    SurveyQuestion,
+    SurveyQuestionOption
+)
+
+SEED_BATCH_SIZE = 500
+BENCHMARK_PREFIX = 'BENCH'
+BENCHMARK_PASSWORD = 'benchmark'
+
+# Catalog rows per parent, close to the catalogs the admins maintain
+CLAIM_FAN_OUT = {'causes': 4, 'categories': 3, 'titles': 2, 'questions': 5}
+SURVEY_FAN_OUT = {'categories': 3, 'subcategories': 3, 'titles': 3, 'questions': 6}
+OPTIONS_PER_QUESTION = 3
+MAX_CLAIMS_PER_APPLICATION = 3
+ASSESSORS = 5
+
+QUESTION_TYPES = ('text', 'selection', 'checkbox', 'date', 'file')
+SAMPLE_FILE = os.path.join(BACKGROUND_DIR, 'client.png')
+STATUS_NAMES = ('Completed', 'Pending', 'Scheduled')
+
+pd = lazy_module('pandas')
+
+
+def _bulk_create(model, objects):
+    """
+    Create rows in batches and set their ids on every database.
+
+    :param model:
+        Model of the rows.
+    :param objects:
+        Unsaved model instances.
+    :return:
+        The instances with their ids.
+    """
+    model.objects.bulk_create(objects, batch_size=SEED_BATCH_SIZE)
+
+    if objects and objects[0].pk is None:
+        ids = list(model.objects.order_by('-id').values_list(
+            'id', flat=True
+        )[:len(objects)])
+        for instance, pk in zip(objects, reversed(ids)):
+            instance.pk = pk
+
+    return objects
+
+
+def _named(model, name):
+    """
+    Row of a lookup table with the given name, created when missing.
+    """
+    return model.objects.filter(name=name).first() or model.objects.create(name=name)
+
+
+def _benchmark_user(email, user_type_name):
+    """
+    User of the benchmark with the given type, created when missing.
+    """
+    user = User.objects.filter(email=email).first()
+
+    if user is None:
+        user = User.objects.create_user(
+            email=email,
+            first_name='Benchmark',
+            last_name=user_type_name,
+            user_type=_named(UserType, user_type_name),
+            password=BENCHMARK_PASSWORD
+        )
+
+    return user
+
+
+def _question_fields(index):
+    """
+    Fields of the question with the given index, the types take turns.
+    """
+    question_type = QUESTION_TYPES[index % len(QUESTION_TYPES)]
+    return {
+        'question': f'Benchmark question {index + 1}',
+        'question_type': question_type,
+        'is_mandatory': index % 2 == 0,
+        f'has_{question_type}': True
+    }
+
+
+def _seed_questions(titles, questions_per_title, build_question, option_model):
+    """
+    Questions of every title and the options of the choice questions.
+
+    :param titles:
+        Titles the questions belong to.
+    :param questions_per_title:
+        Number of questions of every title.
+    :param build_question:
+        Function of a title and a question index that builds a question.
+    :param option_model:
+        Option model of the questions.
+    :return:
+        Questions and a dict of question id to its option texts.
+    """
+    questions = [
+        build_question(title, index)
+        for title in titles
+        for index in range(questions_per_title)
+    ]
+    questions = _bulk_create(type(questions[0]), questions)
+    options = _bulk_create(option_model, [
+        option_model(option=f'Option {index + 1}', question=question)
+        for question in questions
+        if question.question_type in ('selection', 'checkbox')
+        for index in range(OPTIONS_PER_QUESTION)
+    ])
+
+    question_options = {}
+    for option in options:
+        question_options.setdefault(option.question_id, []).append(option.option)
+
+    return questions, question_options
+
+
+def _answer(question, question_options, index):
+    """
+    Answer text of a question as the apps save it.
+    """
+    if question.question_type == 'file':
+        return s3_file_url(f'benchmark/answer_{question.id}_{index}.png')
+
+    if question.question_type == 'date':
+        return '2024-01-15'
+
+    options = question_options.get(question.id)
+    if options:
+        return options[index % len(options)]
+
+    return f'Benchmark answer {index}'
+
+
+def _seed_claim_taxonomy(application_type):
+    """
+    Causes, what and how categories, titles, questions and options of a type.
+
+    :param application_type:
+        Application type of the causes.
+    :return:
+        Causes, dict of cause id to its what and how categories, dict of
+        what and how category id to their questions, and the question options.
+    """
+    causes = _bulk_create(CauseCategory, [
+        CauseCategory(name=f'Cause {index + 1}', application_type=application_type)
+        for index in range(CLAIM_FAN_OUT['causes'])
+    ])
+    whats = _bulk_create(WhatCategory, [
+        WhatCategory(name=f'{cause.name} what {index + 1}', cause=cause)
+        for cause in causes
+        for index in range(CLAIM_FAN_OUT['categories'])
+    ])
+    hows = _bulk_create(HowCategory, [
+        HowCategory(name=f'{cause.name} how {index + 1}', cause=cause)
+        for cause in causes
+        for index in range(CLAIM_FAN_OUT['categories'])
+    ])
+    what_titles = _bulk_create(WhatQuestionTitle, [
+        WhatQuestionTitle(title=f'{what.name} title {index + 1}', what=what)
+        for what in whats
+        for index in range(CLAIM_FAN_OUT['titles'])
+    ])
+    how_titles = _bulk_create(HowQuestionTitle, [
+        HowQuestionTitle(title=f'{how.name} title {index + 1}', how=how)
+        for how in hows
+        for index in range(CLAIM_FAN_OUT['titles'])
+    ])
+    what_questions, what_options = _seed_questions(
+        what_titles,
+        CLAIM_FAN_OUT['questions'],
+        lambda title, index: WhatQuestion(what_title=title, **_question_fields(index)),
+        WhatQuestionOption
+    )
+    how_questions, how_options = _seed_questions(
+        how_titles,
+        CLAIM_FAN_OUT['questions'],
+        lambda title, index: HowQuestion(how_title=title, **_question_fields(index)),
+        HowQuestionOption
+    )
+
+    cause_categories = {
+        cause.id: (
+            [what for what in whats if what.cause_id == cause.id],
+            [how for how in hows if how.cause_id == cause.id]
+        )
+        for cause in causes
+    }
+    category_questions = {
+        WhatCategory: {},
+        HowCategory: {}
+    }
+    for question in what_questions:
+        category_questions[WhatCategory].setdefault(
+            question.what_title.what_id, []
+        ).append(question)
+    for question in how_questions:
+        category_questions[HowCategory].setdefault(
+            question.how_title.how_id, []
+        ).append(question)
+
+    return causes, cause_categories, category_questions, {**what_options, **how_options}
+
+
+def _seed_survey_catalog(application_type):
+    """
+    Categories, subcategories, titles, questions and options of a survey type.
+
+    :param application_type:
+        Application type of the categories.
+    :return:
+        Dict of category id to its questions and the question options.
+    """
+    categories = _bulk_create(SurveyCategory, [
+        SurveyCategory(name=f'Category {index + 1}', type=application_type)
+        for index in range(SURVEY_FAN_OUT['categories'])
+    ])
+    subcategories = _bulk_create(SurveyCategoryType, [
+        SurveyCategoryType(name=f'{category.name} type {index + 1}', category=category)
+        for category in categories
+        for index in range(SURVEY_FAN_OUT['subcategories'])
+    ])
+    titles = _bulk_create(SurveyApplicationTitle, [
+        SurveyApplicationTitle(name=f'{subcategory.name} title {index + 1}',
+                               subcategory_type=subcategory)
+        for subcategory in subcategories
+        for index in range(SURVEY_FAN_OUT['titles'])
+    ])
+    questions, question_options = _seed_questions(
+        titles,
+        SURVEY_FAN_OUT['questions'],
+        lambda title, index: SurveyQuestion(
+            application_title=title,
+            number=index + 1,
+            **_question_fields(index)
+        ),
+        SurveyQuestionOption
+    )
+
+    category_questions = {}
+    for question in questions:
+        category_questions.setdefault(
+            question.application_title.subcategory_type.category_id, []
+        ).append(question)
+
+    return category_questions, question_options
+
+
+def _seed_claims(applications, application_types, taxonomies, rng):
+    """
+    Claims of the applications with their assignments and answers.
+
+    :return:
+        The claims and the number of what and how answers.
+    """
+    claims = _bulk_create(Claim, [
+        Claim(application=application, application_type=application_type)
+        for application, application_type in zip(applications, application_types)
+        for _ in range(rng.randint(1, MAX_CLAIMS_PER_APPLICATION))
+    ])
+
+    causes = []
+    whats = []
+    hows = []
+    what_answers = []
+    how_answers = []
+
+    for claim in claims:
+        cause_list, cause_categories, category_questions, question_options = \
+            taxonomies[claim.application_type_id]
+        cause = rng.choice(cause_list)
+        what = rng.choice(cause_categories[cause.id][0])
+        how = rng.choice(cause_categories[cause.id][1])
+
+        causes.append(ApplicationCause(claim=claim, cause=cause))
+        whats.append(ApplicationWhat(claim=claim, what=what))
+        hows.append(ApplicationHow(claim=claim, how=how))
+        what_answers.extend(
+            WhatQuestionAnswer(
+                claim=claim,
+                question=question,
+                answer=_answer(question, question_options, index)
+            )
+            for index, question in enumerate(category_questions[WhatCategory][what.id])
+        )
+        how_answers.extend(
+            HowQuestionAnswer(
+                claim=claim,
+                question=question,
+                answer=_answer(question, question_options, index)
+            )
+            for index, question in enumerate(category_questions[HowCategory][how.id])
+        )
+
+    _bulk_create(ApplicationCause, causes)
+    _bulk_create(ApplicationWhat, whats)
+    _bulk_create(ApplicationHow, hows)
+    _bulk_create(WhatQuestionAnswer, what_answers)
+    _bulk_create(HowQuestionAnswer, how_answers)
+
+    return claims, len(what_answers), len(how_answers)
+
+
+def _seed_surveys(applications, application_types, catalogs, rng):
+    """
+    Surveys of the applications with the answers of one category each.
+
+    :return:
+        The surveys and the number of answers.
+    """
+    surveys = _bulk_create(Survey, [
+        Survey(application=application, application_type=application_type)
+        for application, application_type in zip(applications, application_types)
+    ])
+
+    answers = []
+
+    for survey in surveys:
+        category_questions, question_options = catalogs[survey.application_type_id]
+        questions = category_questions[rng.choice(list(category_questions))]
+        answers.extend(
+            SurveyAnswer(
+                survey=survey,
+                question=question,
+                category_id=question.application_title.subcategory_type.category_id,
+                subcategory_type_id=question.application_title.subcategory_type_id,
+                application_title_id=question.application_title_id,
+                answer=_answer(question, question_options, index)
+            )
+            for index, question in enumerate(questions)
+        )
+
+    _bulk_create(SurveyAnswer, answers)
+
+    return surveys, len(answers)
+
+
+@transaction.atomic
+def seed_benchmark_data(applications, seed=0):
+    """
+    Create synthetic applications with claims, surveys and assessments.
+
+    Half of the applications are claims and half are surveys, every run
+    adds a new catalog, so runs with the same seed produce the same data.
+
+    :param applications:
+        Number of applications, and clients, to create.
+    :param seed:
+        Seed of the random choices.
+    :return:
+        Dict with the number of created rows per model and the ids of a
+        claim, its application and a survey application to benchmark.
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    run = now.strftime('%Y%m%d%H%M%S')
+
+    admin = _benchmark_user('benchmark.admin@example.com', constants.ADMIN)
+    assessors = [
+        _benchmark_user(f'benchmark.assessor{index}@example.com', constants.ASSESSOR)
+        for index in range(ASSESSORS)
+    ]
+    statuses = [
+        _named(ApplicationStatus, name)
+        for name in (constants.PENDING, constants.SCHEDULED, constants.COMPLETED)
+    ]
+    application_types = [
+        _named(ApplicationType, name)
+        for name in (constants.PERSONAL, constants.BUSINESS)
+    ]
+    insurers = _bulk_create(InsuranceProvider, [
+        InsuranceProvider(
+            insurance_name=f'Benchmark Insurer {index + 1}',
+            contact_no='0000000000',
+            email=f'insurer{index + 1}@example.com'
+        )
+        for index in range(3)
+    ])
+
+    taxonomies = {
+        application_type.id: _seed_claim_taxonomy(application_type)
+        for application_type in application_types
+    }
+    catalogs = {
+        application_type.id: _seed_survey_catalog(application_type)
+        for application_type in application_types
+    }
+
+    clients_list = _bulk_create(Client, [
+        Client(
+            first_name=f'Client {index + 1}',
+            last_name='Benchmark',
+            email=f'client{index + 1}@example.com',
+            id_number=f'{index:013d}',
+            phone_number='0000000000',
+            policy_no=f'{BENCHMARK_PREFIX}-{run}-{index + 1}',
+            location=f'{index % 90 - 45}.0,{index % 180 - 90}.0',
+            insurer=insurers[index % len(insurers)]
+        )
+        for index in range(applications)
+    ])
+    application_list = _bulk_create(Application, [
+        Application(
+            user=admin,
+            assessor=None if index % 6 == 0 else assessors[index % ASSESSORS],
+            application_status=statuses[index % len(statuses)],
+            client=client,
+            date_assigned=None if index % 6 == 0 else now
+        )
+        for index, client in enumerate(clients_list)
+    ])
+    types = [application_types[index % 2] for index in range(applications)]
+
+    _bulk_create(ClientIncident, [
+        ClientIncident(
+            client=client,
+            date_of_incident=now - timedelta(days=index % 60),
+            city='Johannesburg',
+            street_address=f'{index + 1} Main Road',
+            province='Gauteng',
+            postal_code='2000'
+        )
+        for index, client in enumerate(clients_list[::2])
+    ])
+    _bulk_create(Business, [
+        Business(
+            client=client,
+            business_name=f'Business {index + 1}',
+            business_email=f'business{index + 1}@example.com',
+            reg_number='2000/000000/07',
+            vat_number='4000000000',
+            phone_no='0000000000'
+        )
+        for index, client in enumerate(clients_list)
+        if types[index].name == constants.BUSINESS
+    ])
+
+    claims, what_answers, how_answers = _seed_claims(
+        application_list[::2], types[::2], taxonomies, rng
+    )
+    surveys, survey_answers = _seed_surveys(
+        application_list[1::2], types[1::2], catalogs, rng
+    )
+
+    assessments = _bulk_create(Assessment, [
+        Assessment(
+            application=application,
+            message='Benchmark assessment',
+            scheduled_date_time=now + timedelta(days=rng.randint(-30, 30)),
+            end_date_time=now + timedelta(hours=1),
+            event_id=f'benchmark{application.id}',
+            summary=f'Assessment {application.id}',
+            video_link='',
+            client_location=application.client.location
+        )
+        for application in application_list
+        if application.application_status_id != statuses[0].id
+    ])
+    assessment_by_application = {
+        assessment.application_id: assessment for assessment in assessments
+    }
+    notes = _bulk_create(AssessmentNote, [
+        AssessmentNote(
+            assessment=assessment_by_application[claim.application_id],
+            claim=claim,
+            note='Benchmark note',
+            file=s3_file_url(f'benchmark/note_{claim.id}.png')
+        )
+        for claim in claims
+        if claim.application_id in assessment_by_application
+    ])
+
+    claim_taxonomy_cache.invalidate()
+    survey_catalog_cache.invalidate()
+
+    sample_claim = claims[0] if claims else None
+
+    return {
+        'counts': {
+            'clients': len(clients_list),
+            'applications': len(application_list),
+            'claims': len(claims),
+            'surveys': len(surveys),
+            'assessments': len(assessments),
+            'assessment_notes': len(notes),
+            'what_answers': what_answers,
+            'how_answers': how_answers,
+            'survey_answers': survey_answers
+        },
+        'claim_id': sample_claim.id if sample_claim else None,
+        'claim_application_id': sample_claim.application_id if sample_claim else None,
+        'survey_application_id': surveys[0].application_id if surveys else None,
+        'admin_id': admin.id
+    }
+
+
+class LocalS3Client:
+    """
+    In memory stand-in of the S3 client for benchmarks.
+
+    Presigned urls point to a local image, so the report renderer draws the
+    answer and note pictures without downloading them.
+    """
+    # pylint: disable=invalid-name,unused-argument
+
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[Key] = Body
+
+    def get_object(self, Bucket, Key, **kwargs):
+        return {'Body': io.BytesIO(self.objects[Key])}
+
+    def generate_presigned_url(self, ClientMethod, Params=None, ExpiresIn=None):
+        return SAMPLE_FILE
+
+
+class OfflineClient:
+    """
+    Stand-in of a Twilio or Google client that fails instead of calling out.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __getattr__(self, attribute):
+        raise RuntimeError(f"The {self.name} client is not available in benchmarks")
+
+
+@contextlib.contextmanager
+def local_integrations():
+    """
+    Replace S3, Twilio and Google with local stand-ins.
+    """
+    with override_s3_client(LocalS3Client()), \
+            clients.override(TWILIO, OfflineClient(TWILIO)), \
+            clients.override(CALENDAR, OfflineClient(CALENDAR)):
+        yield
+
+
+def _saved_answers(answer_model, claim_id):
+    """
+    Saved what or how answers of a claim as save_claim_questions_api takes them.
+    """
+    return [
+        {
+            'question_id': answer['question_id'],
+            'question_type': answer['question__question_type'],
+            'answer': f"{answer['answer']} updated"
+        }
+        for answer in answer_model.objects.filter(claim_id=claim_id).values(
+            'question_id',
+            'question__question_type',
+            'answer'
+        )
+    ]
+
+
+def benchmark_endpoints(sample):
+    """
+    Apis of the benchmark with the request method and body.
+
+    :param sample:
+        Ids returned by seed_benchmark_data.
+    :return:
+        List of name, view, method and body.
+    """
+    return [
+        ('get_all_claims_api', claim_views.get_all_claims_api, 'GET', None),
+        ('get_claim_info_api', claim_views.get_claim_info_api, 'GET', None),
+        (
+            'generate_report_claim_api',
+            claim_views.generate_report_claim_api,
+            'POST',
+            {'application_id': sample['claim_application_id']}
+        ),
+        (
+            'generate_report_api',
+            survey_views.generate_report_api,
+            'GET',
+            {'application_id': sample['survey_application_id']}
+        ),
+        ('get_survey_overview_api', survey_views.get_survey_overview_api, 'GET', None),
+        (
+            'save_claim_questions_api',
+            claim_views.save_claim_questions_api,
+            'POST',
+            {
+                'claim_id': sample['claim_id'],
+                'what_answers': _saved_answers(WhatQuestionAnswer, sample['claim_id']),
+                'how_answers': _saved_answers(HowQuestionAnswer, sample['claim_id'])
+            }
+        )
+    ]
+
+
+def _timings(runs):
+    """
+    Summary of the timings of repeated runs in milliseconds.
+    """
+    return {
+        'first_ms': round(runs[0], 2),
+        'median_ms': round(statistics.median(runs), 2),
+        'max_ms': round(max(runs), 2)
+    }
+
+
+def time_endpoint(view, method, body, user, repeat):
+    """
+    Time an api view called without the middleware.
+
+    The first run is reported apart from the median because it fills the
+    catalog caches.
+
+    :param view:
+        Api view.
+    :param method:
+        Request method.
+    :param body:
+        Json body of the request or None.
+    :param user:
+        User the request is authenticated as.
+    :param repeat:
+        Number of runs.
+    :return:
+        Dict with the status, queries and size of the last response and the
+        timings.
+    """
+    factory = APIRequestFactory()
+    runs = []
+
+    for _ in range(repeat):
+        request = factory.generic(
+            method,
+            '/benchmark/',
+            json.dumps(body) if body is not None else '',
+            content_type=constants.JSON_APPLICATION
+        )
+        force_authenticate(request, user=user)
+
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            response = view(request)
+            response.render()
+            runs.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'status': response.status_code,
+        'queries': len(queries),
+        'response_bytes': len(response.content),
+        **_timings(runs)
+    }
+
+
+def time_claim_report(application_id, repeat):
+    """
+    Time the claim report renderer with the report data of an application.
+
+    :param application_id:
+        Application id.
+    :param repeat:
+        Number of runs.
+    :return:
+        Dict with the size of the report and the timings.
+    """
+    report = get_application_report(application_id)
+    runs = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        content = render_claim_report(report)
+        runs.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'pdf_bytes': len(content),
+        **_timings(runs)
+    }
+
+
+def run_benchmarks(sizes, repeat=5, seed=0):
+    """
+    Time the apis and the claim report renderer at several data sizes.
+
+    Every size is seeded in a transaction that is rolled back afterwards, so
+    the database is left as it was.
+
+    :param sizes:
+        Numbers of applications to benchmark with.
+    :param repeat:
+        Runs per api and data size.
+    :param seed:
+        Seed of the synthetic data.
+    :return:
+        Json serializable results.
+    """
+    results = {
+        'date': timezone.now().isoformat(),
+        'database': connection.vendor,
+        'seed': seed,
+        'repeat': repeat,
+        'sizes': []
+    }
+
+    with local_integrations():
+        for size in sizes:
+            with transaction.atomic():
+                start = time.perf_counter()
+                sample = seed_benchmark_data(size, seed=seed)
+                seed_ms = (time.perf_counter() - start) * 1000
+                user = User.objects.get(id=sample['admin_id'])
+
+                results['sizes'].append({
+                    'applications': size,
+                    'seed_ms': round(seed_ms, 2),
+                    'counts': sample['counts'],
+                    'endpoints': {
+                        name: time_endpoint(view, method, body, user, repeat)
+                        for name, view, method, body in benchmark_endpoints(sample)
+                    },
+                    'renderers': {
+                        'render_claim_report': time_claim_report(
+                            sample['claim_application_id'], repeat
+                        )
+                    }
+                })
+
+                transaction.set_rollback(True)
+
+            claim_taxonomy_cache.invalidate()
+            survey_catalog_cache.invalidate()
+
+    return results
+
+
+def _pandas_status_tabs(applications):
+    df_applications = pd.DataFrame(applications)
+    return [
+        df_applications[
+            df_applications['application_status__name'] == status_name
+        ].to_dict('records')
+        for status_name in STATUS_NAMES
+    ]
+
+
+def _records_status_tabs(applications):
+    return [
+        filter_records(applications, application_status__name=status_name)
+        for status_name in STATUS_NAMES
+    ]
+
+
+def _pandas_nested_types(application_types, categories):
+    df_types = pd.DataFrame(application_types)
+    df_types['categories'] = nest_children(
+        df_types, 'id', pd.DataFrame(categories), 'type_id'
+    )
+    return df_types.to_dict('records')
+
+
+def _records_nested_types(application_types, categories):
+    return nest_records(
+        [dict(application_type) for application_type in application_types],
+        'id',
+        categories,
+        'type_id',
+        'categories'
+    )
+
+
+def _measure(func, args, repeat):
+    """
+    Median time and peak traced memory of a function.
+
+    :return:
+        Dict with the median milliseconds and the peak KiB allocated by one
+        call.
+    """
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        runs.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'p50_ms': round(statistics.median(runs), 3),
+        'peak_kib': round(peak / 1024, 1)
+    }
+
+
+def compare_record_paths(sizes, repeat=200):
+    """
+    Time the DataFrame and plain record versions of small response assembly.
+
+    The status tabs of the client claims filter applications on their
+    status and the survey overview nests the categories under the
+    application types, as the views do.
+
+    :param sizes:
+        Numbers of records to compare with.
+    :param repeat:
+        Runs per version and size.
+    :return:
+        Json serializable results per operation and size.
+    """
+    results = {'status_tabs': {}, 'nested_types': {}}
+
+    for size in sizes:
+        applications = [
+            {
+                'id': index,
+                'application_status__name': STATUS_NAMES[index % len(STATUS_NAMES)],
+                'client__first_name': f'Client {index}',
+                'date_created': '2024-01-15T10:00:00Z'
+            }
+            for index in range(size)
+        ]
+        application_types = [
+            {'id': index, 'name': f'Type {index}', 'tab_name': f'Type_{index}'}
+            for index in range(max(1, size // 10))
+        ]
+        categories = [
+            {'id': index, 'name': f'Category {index}', 'type_id': index % len(application_types),
+             'types': []}
+            for index in range(size)
+        ]
+
+        results['status_tabs'][size] = {
+            'pandas': _measure(_pandas_status_tabs, (applications,), repeat),
+            'records': _measure(_records_status_tabs, (applications,), repeat)
+        }
+        results['nested_types'][size] = {
+            'pandas': _measure(_pandas_nested_types, (application_types, categories), repeat),
+            'records': _measure(_records_nested_types, (application_types, categories), repeat)
+        }
+
+    return results
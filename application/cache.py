@@ -0,0 +1,130 @@
+"""
+Versioned caches for catalog data that only changes when an admin edits it.
+
+Every cache has a version number that is bumped when the catalog changes.
+Entries are kept in the memory of the process together with the version
+they were built for, and an entry built for an older version is rebuilt on
+the next read. The version itself is stored in Django's cache framework so
+all workers see an invalidation when a shared cache backend is configured.
+With the default local memory backend each process keeps its own version,
+so entries also expire after ``CATALOG_CACHE_TIMEOUT`` seconds.
+"""
+import copy
+import functools
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+class VersionedCache:
+    """
+    Process local cache of compiled catalog data with a shared version.
+    """
+
+    def __init__(self, name):
+        """
+        :param name:
+            Name of the catalog, used in the version key.
+        """
+        self.name = name
+        self.version_key = f"catalog_version:{name}"
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @property
+    def _backend(self):
+        return caches[getattr(settings, 'CATALOG_CACHE_ALIAS', 'default')]
+
+    @property
+    def _timeout(self):
+        return getattr(settings, 'CATALOG_CACHE_TIMEOUT', 300)
+
+    def version(self):
+        """
+        Current version of the catalog.
+
+        :return:
+            Monotonically increasing version number.
+        """
+        version = self._backend.get(self.version_key)
+
+        if version is None:
+            # Start from the clock so a version lost from the cache backend
+            # never goes back to a number an older entry was built for.
+            self._backend.add(self.version_key, int(time.time() * 1000), None)
+            version = self._backend.get(self.version_key)
+
+        return version
+
+    def invalidate(self):
+        """
+        Bump the catalog version so every entry is rebuilt on the next read.
+
+        :return:
+            New version number.
+        """
+        try:
+            version = self._backend.incr(self.version_key)
+        except ValueError:
+            version = int(time.time() * 1000)
+            self._backend.set(self.version_key, version, None)
+
+        with self._lock:
+            self._entries.clear()
+
+        return version
+
+    def get_or_build(self, key, builder):
+        """
+        Return the cached value for the current version or build it.
+
+        :param key:
+            Hashable key of the entry in this catalog.
+        :param builder:
+            Function without arguments that builds the value.
+
+        :return:
+            Copy of the cached value, safe for the caller to change.
+        """
+        version = self.version()
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None and entry[0] == version and entry[1] > now:
+            return copy.deepcopy(entry[2])
+
+        value = builder()
+
+        with self._lock:
+            self._entries[key] = (version, now + self._timeout, value)
+
+        return copy.deepcopy(value)
+
+
+def invalidates(*versioned_caches):
+    """
+    Decorate an api view that changes a catalog to invalidate its caches.
+
+    The caches are invalidated after the view has run, also when it failed,
+    so an entry built while the change was being written is never kept.
+
+    :param versioned_caches:
+        Caches that the view changes.
+
+    :return:
+        View decorator.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                return view(*args, **kwargs)
+            finally:
+                for versioned_cache in versioned_caches:
+                    versioned_cache.invalidate()
+        return wrapper
+    return decorator
@@ -0,0 +1,171 @@
+"""
+Process wide registry of the Google Calendar and Twilio clients.
+
+Loading the service account, building the calendar api from its discovery
+document and creating a Twilio client are slow, and every client opens its
+own connection pool. The registry creates every client on first use and
+hands the same instance out afterwards. The Twilio client is shared by the
+whole process. A calendar service is kept per thread, because its httplib2
+connection is not thread safe, and every service shares the credentials,
+which google-auth only refreshes when the token expired. The client
+libraries themselves are imported by the factories, on first use.
+
+Tests replace a client with ``clients.override``::
+
+    with clients.override(TWILIO, FakeTwilioClient()):
+        ...
+"""
+import contextlib
+import os
+import threading
+
+from decouple import config
+from django.conf import settings
+
+SCOPES = [
+    'https://www.googleapis.com/auth/calendar',
+    'https://www.googleapis.com/auth/calendar.events'
+]
+PATH = str(os.path.join(settings.BASE_DIR, "acorn-377214-72e9ef25960f.json")).replace('\\', '/')
+SERVICE_ACCOUNT_FILE = PATH
+CALENDAR_ID = 'c_fcac2d5608ba437916879de91dc0a7d83ce4ade9588' \
+              '05ebd569c267035c92dc0@group.calendar.google.com'
+CALENDAR_SUBJECT = 'info@acornfintechplatform.co.za'
+
+GOOGLE_CREDENTIALS = 'google_credentials'
+CALENDAR = 'calendar'
+TWILIO = 'twilio'
+
+
+class ClientRegistry:
+    """
+    Lazily created clients, shared by the process or kept per thread.
+    """
+
+    def __init__(self):
+        self._factories = {}
+        self._clients = {}
+        self._overrides = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def register(self, name, factory, per_thread=False):
+        """
+        Register the function that creates a client.
+
+        :param name:
+            Client name.
+        :param factory:
+            Function without arguments that creates the client.
+        :param per_thread:
+            Create a client for every thread instead of one for the process.
+        """
+        self._factories[name] = (factory, per_thread)
+
+    def get(self, name):
+        """
+        Client with the given name, created on first use.
+
+        :param name:
+            Client name.
+        :return:
+            Client instance.
+        """
+        if name in self._overrides:
+            return self._overrides[name]
+
+        factory, per_thread = self._factories[name]
+
+        if per_thread:
+            clients = self._local.__dict__.setdefault('clients', {})
+            if name not in clients:
+                clients[name] = factory()
+            return clients[name]
+
+        if name not in self._clients:
+            with self._lock:
+                if name not in self._clients:
+                    self._clients[name] = factory()
+
+        return self._clients[name]
+
+    @contextlib.contextmanager
+    def override(self, name, client):
+        """
+        Hand out the given client instead of the registered one, for tests.
+
+        :param name:
+            Client name.
+        :param client:
+            Client to use, normally a local fake.
+        """
+        previous = self._overrides.get(name)
+        self._overrides[name] = client
+        try:
+            yield client
+        finally:
+            if previous is None:
+                self._overrides.pop(name, None)
+            else:
+                self._overrides[name] = previous
+
+    def reset(self):
+        """
+        Drop the created clients so they are created again on next use.
+        """
+        with self._lock:
+            self._clients.clear()
+        self._local.__dict__.pop('clients', None)
+
+
+clients = ClientRegistry()
+
+
+def _google_credentials():
+    from google.oauth2 import service_account  # pylint: disable=import-outside-toplevel
+
+    credentials = service_account.Credentials.from_service_account_file(
+        SERVICE_ACCOUNT_FILE, scopes=SCOPES)
+    return credentials.with_subject(CALENDAR_SUBJECT)
+
+
+def _calendar_service():
+    from googleapiclient.discovery import build  # pylint: disable=import-outside-toplevel
+
+    return build(
+        'calendar',
+        'v3',
+        credentials=clients.get(GOOGLE_CREDENTIALS),
+        cache_discovery=False
+    )
+
+
+def _twilio_client():
+    from twilio.rest import Client as CL  # pylint: disable=import-outside-toplevel
+
+    return CL(config('ACCOUNT_SID'), config('AUTH_TOKEN'))
+
+
+clients.register(GOOGLE_CREDENTIALS, _google_credentials)
+clients.register(CALENDAR, _calendar_service, per_thread=True)
+clients.register(TWILIO, _twilio_client)
+
+
+def get_calendar_service():
+    """
+    Google Calendar service of the current thread.
+
+    :return:
+        Google calendar api resource.
+    """
+    return clients.get(CALENDAR)
+
+
+def get_twilio_client():
+    """
+    Twilio client of the process.
+
+    :return:
+        Twilio rest client.
+    """
+    return clients.get(TWILIO)
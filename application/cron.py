@@ -2,61 +2,95 @@
 cron.py file used for the crontab actions for the Google calendar.
 
 """
-import os
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from django.conf import settings
-from application.models import Application
+from application.clients import CALENDAR_ID, get_calendar_service
+from application.lazy import lazy_module
 from application.models import Assessment
 
+google_errors = lazy_module('googleapiclient.errors')
 
-SCOPES = [
-    'https://www.googleapis.com/auth/calendar',
-    'https://www.googleapis.com/auth/calendar.events'
-]
-PATH = str(os.path.join(settings.BASE_DIR, "acorn-377214-72e9ef25960f.json")).replace('\\', '/')
-SERVICE_ACCOUNT_FILE = PATH
-CALENDAR_ID = 'c_fcac2d5608ba437916879de91dc0a7d83ce4ade9588' \
-              '05ebd569c267035c92dc0@group.calendar.google.com'
+
+# Google accepts up to 50 calls in one batch request for the calendar api
+EVENT_BATCH_SIZE = 50
 
 
 def my_cron_job():
     """
     Cron job for the collection of the Google meeting information.
+
+    The pending assessments are read once, their events are fetched in
+    batch requests over the shared calendar service and the video links are saved
+    with one bulk update. A run is skipped while the previous one is still
+    busy by the CRONTAB_LOCK_JOBS lock of django_crontab.
     """
-    complete_applications_ids = Application.objects.filter(
-        application_status_id=3).values_list('id', flat=True)
-
-    id_list = Assessment.objects.filter(application_id__in=complete_applications_ids,
-                                        video_link="", event_id__isnull=False
-                                        ).values_list('application_id', flat=True)
-    if id_list:
-        [get_video_attachment_link(application_id) for application_id in id_list]
-        return None
-    else:
+    assessments = list(Assessment.objects.filter(
+        application__application_status_id=3,
+        video_link="",
+        event_id__isnull=False
+    ).exclude(
+        event_id=""
+    ).only('id', 'event_id', 'video_link'))
+
+    if not assessments:
         return None
 
+    service = get_calendar_service()
+
+    video_links = get_video_attachment_links(
+        service,
+        list({assessment.event_id for assessment in assessments})
+    )
+
+    linked_assessments = []
+    for assessment in assessments:
+        video_link = video_links.get(assessment.event_id)
+        if video_link:
+            assessment.video_link = video_link
+            linked_assessments.append(assessment)
+
+    Assessment.objects.bulk_update(linked_assessments, ['video_link'])
 
-def get_video_attachment_link(application_id):
+    return None
+
+
+def get_video_attachment_links(service, event_ids):
     """
-    Get the video attachment of the assigned Google meeting.
+    Get the video attachments of the assigned Google meetings.
+
+    Events that cannot be fetched or have no attachment are left out.
+
+    :param service:
+        Google calendar service.
+    :param event_ids:
+        Google calendar event ids.
+    :return:
+        Event id to the file url of its video attachment.
     """
-    assessment = Assessment.objects.get(application_id=application_id)
+    video_links = {}
 
-    credentials = service_account.Credentials.from_service_account_file(
-        SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-    delegated_credentials = credentials.with_subject('info@acornfintechplatform.co.za')
+    for start in range(0, len(event_ids), EVENT_BATCH_SIZE):
+        batch_event_ids = event_ids[start:start + EVENT_BATCH_SIZE]
 
-    try:
-        service = build('calendar', 'v3', credentials=delegated_credentials)
-        event = service.events().get(calendarId=CALENDAR_ID, eventId=assessment.event_id).execute()
+        def save_video_link(request_id, event, exception, batch_event_ids=batch_event_ids):
+            if exception is not None:
+                return
+            try:
+                video_links[batch_event_ids[int(request_id)]] = event['attachments'][0]['fileUrl']
+            except (KeyError, IndexError):
+                return
+
+        batch = service.new_batch_http_request(callback=save_video_link)
+        for index, event_id in enumerate(batch_event_ids):
+            batch.add(
+                service.events().get(
+                    calendarId=CALENDAR_ID,
+                    eventId=event_id,
+                    fields='id,attachments(fileUrl)'
+                ),
+                request_id=str(index)
+            )
         try:
-            assessment.video_link = event['attachments'][0]['fileUrl']
-            assessment.save()
-        except KeyError:
-            assessment.video_link = ""
-            assessment.save()
-        return None
-    except HttpError:
-        return None
\ No newline at end of file
+            batch.execute()
+        except google_errors.HttpError:
+            continue
+
+    return video_links
@@ -0,0 +1,352 @@
+"""
+Streamed CSV and Parquet exports of the application data for analysis.
+
+The rows are read in keyset chunks ordered by id, every chunk is a
+``values()`` query of at most EXPORT_CHUNK_SIZE rows after the last id of
+the previous chunk. The MySQL driver buffers a whole result set even for
+``QuerySet.iterator``, so the chunks keep memory to one chunk on every
+database. Every chunk is written out before the next one is read, so an
+export of any size runs in constant memory. The exports are used by the
+``export_data`` management command and ``export_data_api``.
+"""
+import csv
+import io
+
+from django.conf import settings
+from django.db.models import Q
+
+from application.models import Application, Assessment
+from claims.models import Claim, HowQuestionAnswer, WhatQuestionAnswer
+from surveys.models import Survey, SurveyAnswer
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet'
+}
+
+# Model, exported fields, path to the application and path to the
+# application type of every dataset. Datasets without an application type
+# are filtered on the claims and surveys of their application.
+EXPORT_DATASETS = {
+    'applications': (
+        Application,
+        (
+            'id',
+            'date_created',
+            'date_modified',
+            'date_assigned',
+            'application_status__name',
+            'assessor_id',
+            'client_id',
+            'client__insurer__insurance_name'
+        ),
+        '',
+        None
+    ),
+    'claims': (
+        Claim,
+        (
+            'id',
+            'application_id',
+            'application_type_id',
+            'application_type__name'
+        ),
+        'application',
+        'application_type_id'
+    ),
+    'how_answers': (
+        HowQuestionAnswer,
+        (
+            'id',
+            'claim_id',
+            'claim__application_id',
+            'question_id',
+            'question__question',
+            'question__question_type',
+            'answer',
+            'date_created',
+            'date_modified'
+        ),
+        'claim__application',
+        'claim__application_type_id'
+    ),
+    'what_answers': (
+        WhatQuestionAnswer,
+        (
+            'id',
+            'claim_id',
+            'claim__application_id',
+            'question_id',
+            'question__question',
+            'question__question_type',
+            'answer',
+            'date_created',
+            'date_modified'
+        ),
+        'claim__application',
+        'claim__application_type_id'
+    ),
+    'survey_answers': (
+        SurveyAnswer,
+        (
+            'id',
+            'survey_id',
+            'survey__application_id',
+            'question_id',
+            'question__question',
+            'question__question_type',
+            'category_id',
+            'subcategory_type_id',
+            'application_title_id',
+            'answer',
+            'date_created',
+            'date_modified'
+        ),
+        'survey__application',
+        'survey__application_type_id'
+    ),
+    'assessments': (
+        Assessment,
+        (
+            'id',
+            'application_id',
+            'scheduled_date_time',
+            'end_date_time',
+            'summary',
+            'client_location'
+        ),
+        'application',
+        None
+    )
+}
+
+
+def _lookup(path, field):
+    """
+    Lookup of a field of the application of a dataset.
+
+    :param path:
+        Path of the dataset model to the application, empty for applications.
+    :param field:
+        Field of the application.
+    :return:
+        Query lookup.
+    """
+    return f"{path}__{field}" if path else field
+
+
+def export_queryset(dataset, filters):
+    """
+    Rows of a dataset filtered on the date created and type of their application.
+
+    :param dataset:
+        Name of the dataset in EXPORT_DATASETS.
+    :param filters:
+        Optional date_from, date_to and application_type_id.
+    :return:
+        Values queryset ordered by id.
+    """
+    model, fields, application_path, type_field = EXPORT_DATASETS[dataset]
+    queryset = model.objects.all()
+
+    date_from = filters.get('date_from')
+    if date_from:
+        queryset = queryset.filter(
+            **{_lookup(application_path, 'date_created__date__gte'): date_from}
+        )
+
+    date_to = filters.get('date_to')
+    if date_to:
+        queryset = queryset.filter(
+            **{_lookup(application_path, 'date_created__date__lte'): date_to}
+        )
+
+    application_type_id = filters.get('application_type_id')
+    if application_type_id and type_field:
+        queryset = queryset.filter(**{type_field: application_type_id})
+    elif application_type_id:
+        application_id = _lookup(application_path, 'id__in')
+        queryset = queryset.filter(
+            Q(**{application_id: Claim.objects.filter(
+                application_type_id=application_type_id
+            ).values('application_id')})
+            | Q(**{application_id: Survey.objects.filter(
+                application_type_id=application_type_id
+            ).values('application_id')})
+        )
+
+    return queryset.values(*fields).order_by('id')
+
+
+def iter_export_chunks(dataset, filters, chunk_size=None):
+    """
+    Rows of a dataset in chunks of consecutive ids.
+
+    :param dataset:
+        Name of the dataset in EXPORT_DATASETS.
+    :param filters:
+        Optional date_from, date_to and application_type_id.
+    :param chunk_size:
+        Rows per chunk, defaults to EXPORT_CHUNK_SIZE.
+    :return:
+        Generator of lists of row dicts.
+    """
+    chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+    queryset = export_queryset(dataset, filters)
+    last_id = None
+
+    while True:
+        chunk_queryset = queryset if last_id is None else queryset.filter(id__gt=last_id)
+        rows = list(chunk_queryset[:chunk_size])
+
+        if not rows:
+            return
+
+        yield rows
+        last_id = rows[-1]['id']
+
+
+def iter_csv(dataset, filters, chunk_size=None):
+    """
+    Dataset as CSV, one chunk of rows at a time.
+
+    :param dataset:
+        Name of the dataset in EXPORT_DATASETS.
+    :param filters:
+        Optional date_from, date_to and application_type_id.
+    :param chunk_size:
+        Rows per chunk, defaults to EXPORT_CHUNK_SIZE.
+    :return:
+        Generator of UTF-8 encoded CSV bytes, starting with the header.
+    """
+    fields = EXPORT_DATASETS[dataset][1]
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields)
+    writer.writeheader()
+
+    for rows in iter_export_chunks(dataset, filters, chunk_size):
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write only file that hands out what was written since the last drain.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        """
+        Bytes written since the last drain.
+        """
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _parquet_schema(dataset):
+    """
+    Arrow schema of a dataset from the fields of its model.
+
+    :param dataset:
+        Name of the dataset in EXPORT_DATASETS.
+    :return:
+        pyarrow schema.
+    """
+    import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+    model, fields, _, _ = EXPORT_DATASETS[dataset]
+    types = {
+        'AutoField': pa.int64(),
+        'BigAutoField': pa.int64(),
+        'IntegerField': pa.int64(),
+        'ForeignKey': pa.int64(),
+        'OneToOneField': pa.int64(),
+        'BooleanField': pa.bool_(),
+        'DateField': pa.date32(),
+        'DateTimeField': pa.timestamp('us', tz=settings.TIME_ZONE)
+    }
+    columns = []
+
+    for field_path in fields:
+        field_model = model
+        *relations, name = field_path.split('__')
+        for relation in relations:
+            field_model = field_model._meta.get_field(relation).related_model
+
+        field = field_model._meta.get_field(name)
+        columns.append(pa.field(field_path, types.get(field.get_internal_type(), pa.string())))
+
+    return pa.schema(columns)
+
+
+def iter_parquet(dataset, filters, chunk_size=None):
+    """
+    Dataset as Parquet, one row group per chunk of rows.
+
+    :param dataset:
+        Name of the dataset in EXPORT_DATASETS.
+    :param filters:
+        Optional date_from, date_to and application_type_id.
+    :param chunk_size:
+        Rows per chunk, defaults to EXPORT_CHUNK_SIZE.
+    :return:
+        Generator of the Parquet file in parts.
+    """
+    import pyarrow as pa  # pylint: disable=import-outside-toplevel
+    import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+
+    schema = _parquet_schema(dataset)
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+
+    try:
+        for rows in iter_export_chunks(dataset, filters, chunk_size):
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+
+    yield sink.drain()
+
+
+def iter_export(dataset, export_format, filters, chunk_size=None):
+    """
+    Dataset in the requested format.
+
+    :param dataset:
+        Name of the dataset in EXPORT_DATASETS.
+    :param export_format:
+        'csv' or 'parquet'.
+    :param filters:
+        Optional date_from, date_to and application_type_id.
+    :param chunk_size:
+        Rows per chunk, defaults to EXPORT_CHUNK_SIZE.
+    :return:
+        Generator of the export file in parts.
+    """
+    if export_format == 'parquet':
+        return iter_parquet(dataset, filters, chunk_size)
+
+    return iter_csv(dataset, filters, chunk_size)
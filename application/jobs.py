@@ -0,0 +1,227 @@
+"""
+Persistent queue of background jobs for slow calls to external services.
+
+The api views enqueue a job and answer straight away with its id, the
+``run_jobs`` management command runs the jobs and the status of a job is
+polled with ``get_job_status_api``. Jobs are rows of the BackgroundJob
+table, so the queue runs on MySQL or SQLite without a broker.
+
+A job is claimed with a conditional update instead of a row lock, only the
+worker whose update changed the row runs it. A failed job is retried with an
+exponential backoff until it has used its attempts, and a running job whose
+lock expired, because its worker died, is claimed again. A long job calls
+``report_job_progress`` between its steps, which shows its progress in the
+job status and extends its lock.
+"""
+import logging
+import threading
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from application.models import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+JOB_HANDLERS = {}
+
+_running = threading.local()
+
+
+class PermanentJobError(Exception):
+    """Error of a job that fails the same way on every attempt."""
+
+
+def job_handler(name):
+    """
+    Register the function that runs the jobs with the given name.
+
+    The handler is called with the payload of the job as keyword arguments
+    and returns the result of the job as a json serializable value.
+
+    :param name:
+        Job name.
+    :return:
+        Function decorator.
+    """
+    def decorator(func):
+        JOB_HANDLERS[name] = func
+        return func
+    return decorator
+
+
+def enqueue_job(name, payload, idempotency_key=None, max_attempts=None, user=None):
+    """
+    Add a job to the queue.
+
+    A job with the same idempotency key is returned instead of adding a new
+    one, a failed job with the key is queued again.
+
+    :param name:
+        Job name of a registered handler.
+    :param payload:
+        Json serializable keyword arguments of the handler.
+    :param idempotency_key:
+        Key of the operation, the same operation is queued only once.
+    :param max_attempts:
+        Attempts before the job fails, defaults to JOB_MAX_ATTEMPTS.
+    :param user:
+        User who queued the job, only the user and admins may see its status.
+    :return:
+        Background job.
+    """
+    defaults = {
+        'name': name,
+        'payload': payload,
+        'max_attempts': max_attempts or settings.JOB_MAX_ATTEMPTS,
+        'user': user,
+    }
+
+    if idempotency_key is None:
+        return BackgroundJob.objects.create(**defaults)
+
+    job, created = BackgroundJob.objects.get_or_create(
+        idempotency_key=idempotency_key,
+        defaults=defaults
+    )
+
+    if not created and job.status == BackgroundJob.FAILED:
+        job.payload = payload
+        job.status = BackgroundJob.PENDING
+        job.attempts = 0
+        job.run_after = timezone.now()
+        job.last_error = ''
+        job.save()
+
+    return job
+
+
+def _runnable_jobs(now):
+    """
+    Filter of the jobs a worker may claim.
+
+    :param now:
+        Current time.
+    :return:
+        Query filter.
+    """
+    return (
+        Q(status=BackgroundJob.PENDING, run_after__lte=now)
+        | Q(status=BackgroundJob.RUNNING, locked_until__lt=now)
+    )
+
+
+def claim_next_job():
+    """
+    Claim the next job that is due.
+
+    :return:
+        Claimed background job or None when no job is due.
+    """
+    now = timezone.now()
+    job_ids = BackgroundJob.objects.filter(
+        _runnable_jobs(now)
+    ).order_by('run_after', 'id').values_list('id', flat=True)[:10]
+
+    for job_id in job_ids:
+        claimed = BackgroundJob.objects.filter(
+            _runnable_jobs(now),
+            id=job_id
+        ).update(
+            status=BackgroundJob.RUNNING,
+            locked_until=now + timedelta(seconds=settings.JOB_LOCK_TIMEOUT),
+            attempts=F('attempts') + 1,
+            date_modified=now
+        )
+
+        if claimed:
+            return BackgroundJob.objects.get(id=job_id)
+
+    return None
+
+
+def retry_delay(attempts):
+    """
+    Backoff before the next attempt of a failed job.
+
+    :param attempts:
+        Attempts the job has used.
+    :return:
+        Delay as a timedelta.
+    """
+    seconds = settings.JOB_RETRY_BACKOFF * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, settings.JOB_RETRY_BACKOFF_MAX))
+
+
+def report_job_progress(progress):
+    """
+    Save the progress of the running job and extend its lock.
+
+    The progress is the result of the job until the job finishes. Nothing is
+    saved when the handler is not run by run_job.
+
+    :param progress:
+        Json serializable progress of the job.
+    """
+    job = getattr(_running, 'job', None)
+
+    if job is None:
+        return
+
+    now = timezone.now()
+    BackgroundJob.objects.filter(id=job.id).update(
+        result=progress,
+        locked_until=now + timedelta(seconds=settings.JOB_LOCK_TIMEOUT),
+        date_modified=now
+    )
+
+
+def run_job(job):
+    """
+    Run a claimed job and save its outcome.
+
+    :param job:
+        Background job claimed with claim_next_job.
+    :return:
+        Background job with its new status.
+    """
+    handler = JOB_HANDLERS.get(job.name)
+    _running.job = job
+
+    try:
+        if handler is None:
+            raise PermanentJobError(f"No handler is registered for {job.name} jobs")
+
+        job.result = handler(**job.payload)
+
+    except Exception as error:  # pylint: disable=broad-except
+        logger.warning("Background job %s failed: %s", job, error)
+        job.last_error = traceback.format_exc()
+
+        if isinstance(error, PermanentJobError) or job.attempts >= job.max_attempts:
+            job.status = BackgroundJob.FAILED
+        else:
+            job.status = BackgroundJob.PENDING
+            job.run_after = timezone.now() + retry_delay(job.attempts)
+
+    else:
+        job.status = BackgroundJob.SUCCEEDED
+        job.last_error = ''
+
+    finally:
+        _running.job = None
+
+    job.locked_until = None
+    job.save(update_fields=[
+        'status',
+        'result',
+        'last_error',
+        'run_after',
+        'locked_until',
+        'date_modified'
+    ])
+
+    return job
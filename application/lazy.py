@@ -0,0 +1,69 @@
+"""
+Modules imported on first use instead of when the project starts.
+
+pandas, ReportLab, Twilio and the Google api client take long to import,
+and importing the url configuration used to import them all, so every
+worker and every management command paid for them, even the commands that
+never use them. A module that only uses one of them in its functions takes
+a proxy instead of importing it::
+
+    pd = lazy_module('pandas')
+
+The proxy imports the module on the first attribute access and hands out
+its attributes afterwards. Names only used inside a function are imported
+in that function. ``IMPORT_BUDGET_MODULES`` lists the modules that must
+not be imported on startup and ``IMPORT_TIME_BUDGET`` the seconds the
+startup may take, the import budget test checks both.
+"""
+import importlib
+
+IMPORT_BUDGET_MODULES = (
+    'pandas',
+    'reportlab',
+    'PIL',
+    'pypdf',
+    'twilio',
+    'googleapiclient',
+    'google.oauth2'
+)
+
+# Seconds to set up Django and load the url configuration in a new process
+IMPORT_TIME_BUDGET = 3.0
+
+
+class LazyModule:
+    """
+    Proxy of a module that is imported on first attribute access.
+    """
+
+    def __init__(self, name):
+        """
+        :param name:
+            Full name of the module.
+        """
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<lazy module {self._name}, {state}>"
+
+
+def lazy_module(name):
+    """
+    Proxy of a module, imported when one of its attributes is first used.
+
+    :param name:
+        Full name of the module.
+    :return:
+        LazyModule of the module.
+    """
+    return LazyModule(name)
@@ -0,0 +1,44 @@
+"""
+Create command for the comparison of DataFrame and plain record assembly
+"""
+import json
+from django.core.management.base import BaseCommand
+from application.benchmark import compare_record_paths
+
+
+class Command(BaseCommand):
+    help = 'Compare the latency and memory of DataFrame and plain record assembly of small responses'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            type=int,
+            nargs='+',
+            default=[10, 50, 200, 1000],
+            help='Numbers of records to compare with'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=200,
+            help='Runs per version and size'
+        )
+        parser.add_argument(
+            '--output',
+            help='File the json results are written to'
+        )
+
+    def handle(self, *args, **options):
+        results = compare_record_paths(options['sizes'], repeat=options['repeat'])
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as output:
+                json.dump(results, output, indent=2)
+
+        for operation, sizes in results.items():
+            for size, versions in sizes.items():
+                for version, measured in versions.items():
+                    self.stdout.write(
+                        f"{operation:<14} {size:>6} {version:<8} "
+                        f"{measured['p50_ms']:>9.3f} ms {measured['peak_kib']:>9.1f} KiB"
+                    )
@@ -0,0 +1,72 @@
+"""
+Create command for the streamed data exports
+"""
+import sys
+from datetime import date
+from django.core.management.base import BaseCommand
+from application.data_export import EXPORT_DATASETS, EXPORT_FORMATS, iter_export
+
+
+class Command(BaseCommand):
+    help = 'Export a dataset of the applications as CSV or Parquet in constant memory'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'dataset',
+            choices=list(EXPORT_DATASETS),
+            help='Dataset to export'
+        )
+        parser.add_argument(
+            '--format',
+            dest='export_format',
+            choices=list(EXPORT_FORMATS),
+            default='csv',
+            help='Format of the export'
+        )
+        parser.add_argument(
+            '--date-from',
+            type=date.fromisoformat,
+            help='First date the applications were created, YYYY-MM-DD'
+        )
+        parser.add_argument(
+            '--date-to',
+            type=date.fromisoformat,
+            help='Last date the applications were created, YYYY-MM-DD'
+        )
+        parser.add_argument(
+            '--application-type-id',
+            type=int,
+            help='Export the applications of this application type only'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            help='Rows read per query, defaults to EXPORT_CHUNK_SIZE'
+        )
+        parser.add_argument(
+            '--output',
+            help='File the export is written to, standard output when left out'
+        )
+
+    def handle(self, *args, **options):
+        filters = {
+            'date_from': options['date_from'],
+            'date_to': options['date_to'],
+            'application_type_id': options['application_type_id']
+        }
+        parts = iter_export(
+            options['dataset'],
+            options['export_format'],
+            filters,
+            chunk_size=options['chunk_size']
+        )
+
+        if options['output']:
+            with open(options['output'], 'wb') as output:
+                for part in parts:
+                    output.write(part)
+            return
+
+        for part in parts:
+            sys.stdout.buffer.write(part)
+        sys.stdout.buffer.flush()
@@ -0,0 +1,124 @@
+"""
+Create command for the query plans of the hot answer and listing lookups
+"""
+import statistics
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from application.models import Application, Assessment
+from claims.models import (
+    ApplicationCause,
+    ApplicationHow,
+    ApplicationWhat,
+    HowQuestionAnswer,
+    WhatQuestionAnswer
+)
+from surveys.models import SurveyAnswer
+
+
+def answer_lookup(model, owner_field):
+    """
+    Answers of the questions of one claim or survey, as the answer upserts read them.
+    """
+    sample = model.objects.values(owner_field).order_by('-id').first()
+    if sample is None:
+        return None
+
+    question_ids = list(model.objects.filter(
+        **{owner_field: sample[owner_field]}
+    ).values_list('question_id', flat=True)[:20])
+
+    return model.objects.filter(
+        **{owner_field: sample[owner_field], 'question_id__in': question_ids}
+    )
+
+
+def status_listing():
+    """
+    Applications of an assessor with a status, as the claim and survey listings read them.
+    """
+    sample = Application.objects.exclude(assessor=None).values(
+        'application_status_id',
+        'assessor_id'
+    ).order_by('-id').first()
+    if sample is None:
+        return None
+
+    return Application.objects.filter(**sample).order_by('-id')
+
+
+def scheduled_assessments():
+    """
+    Assessments scheduled in the coming week, as the calendar reads them.
+    """
+    now = timezone.now()
+    return Assessment.objects.filter(
+        scheduled_date_time__range=(now, now + timedelta(days=7))
+    ).order_by('scheduled_date_time')
+
+
+def claim_category(model):
+    """
+    Category of one claim, as the claim info and category updates read it.
+    """
+    sample = model.objects.values('claim_id').order_by('-id').first()
+    if sample is None:
+        return None
+
+    return model.objects.filter(claim_id=sample['claim_id'])
+
+
+HOT_QUERIES = {
+    'how_answers': lambda: answer_lookup(HowQuestionAnswer, 'claim_id'),
+    'what_answers': lambda: answer_lookup(WhatQuestionAnswer, 'claim_id'),
+    'survey_answers': lambda: answer_lookup(SurveyAnswer, 'survey_id'),
+    'status_listing': status_listing,
+    'scheduled_assessments': scheduled_assessments,
+    'application_cause': lambda: claim_category(ApplicationCause),
+    'application_how': lambda: claim_category(ApplicationHow),
+    'application_what': lambda: claim_category(ApplicationWhat),
+}
+
+
+class Command(BaseCommand):
+    help = 'Print the query plan and timing of the hot answer and listing lookups'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'queries',
+            nargs='*',
+            help=f"Lookups to explain, all of them when left out: {', '.join(HOT_QUERIES)}"
+        )
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=50,
+            help='Times every lookup is run for its timing'
+        )
+
+    def handle(self, *args, **options):
+        unknown = set(options['queries']) - set(HOT_QUERIES)
+        if unknown:
+            raise CommandError(f"Unknown lookups: {', '.join(sorted(unknown))}")
+
+        for name in options['queries'] or HOT_QUERIES:
+            queryset = HOT_QUERIES[name]()
+
+            if queryset is None:
+                self.stdout.write(f"{name}: no rows to sample, seed the database first")
+                continue
+
+            timings = []
+            for _ in range(options['runs']):
+                start = time.perf_counter()
+                list(queryset.all())
+                timings.append((time.perf_counter() - start) * 1000)
+
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(str(queryset.query))
+            self.stdout.write(queryset.explain())
+            self.stdout.write(
+                f"median {statistics.median(timings):.2f} ms, "
+                f"max {max(timings):.2f} ms over {options['runs']} runs\n"
+            )
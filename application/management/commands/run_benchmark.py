@@ -0,0 +1,58 @@
+"""
+Create command for the benchmark of the claim and survey apis
+"""
+import json
+from django.core.management.base import BaseCommand, CommandError
+from application.benchmark import run_benchmarks
+
+
+class Command(BaseCommand):
+    help = 'Time the key claim and survey apis and the claim report at several data sizes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            type=int,
+            nargs='+',
+            default=[100, 1000, 5000],
+            help='Numbers of applications to benchmark with'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Runs per api and data size'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Seed of the synthetic data'
+        )
+        parser.add_argument(
+            '--output',
+            default='benchmark.json',
+            help='File the json results are written to'
+        )
+
+    def handle(self, *args, **options):
+        if min(options['sizes']) < 2:
+            raise CommandError('Benchmark with at least two applications, a claim and a survey')
+
+        results = run_benchmarks(
+            options['sizes'],
+            repeat=options['repeat'],
+            seed=options['seed']
+        )
+
+        with open(options['output'], 'w', encoding='utf-8') as output:
+            json.dump(results, output, indent=2)
+
+        for size in results['sizes']:
+            for name, timing in {**size['endpoints'], **size['renderers']}.items():
+                self.stdout.write(
+                    f"{size['applications']:>7} {name:<28} "
+                    f"{timing['median_ms']:>10.2f} ms {timing.get('queries', ''):>5}"
+                )
+
+        self.stdout.write(f"Results written to {options['output']}")
@@ -0,0 +1,41 @@
+"""
+Create command for the background job worker
+"""
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from application.jobs import claim_next_job, run_job
+import application.tasks  # pylint: disable=unused-import
+import claims.tasks  # pylint: disable=unused-import
+
+
+class Command(BaseCommand):
+    help = 'Run the queued background jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Stop when no job is due instead of waiting for new jobs'
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=settings.JOB_POLL_INTERVAL,
+            help='Seconds to wait before looking for due jobs again'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            job = claim_next_job()
+
+            if job is None:
+                if options['once']:
+                    return
+                time.sleep(options['sleep'])
+                continue
+
+            job = run_job(job)
+            self.stdout.write(f"{job.name} job {job.id} {job.status}")
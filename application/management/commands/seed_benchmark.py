@@ -0,0 +1,31 @@
+"""
+Create command for the synthetic benchmark data
+"""
+from django.core.management.base import BaseCommand, CommandError
+from application.benchmark import seed_benchmark_data
+
+
+class Command(BaseCommand):
+    help = 'Create synthetic clients, applications, claims, surveys and assessments in bulk'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'applications',
+            type=int,
+            help='Number of applications, and clients, to create'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Seed of the random choices, the same seed creates the same data'
+        )
+
+    def handle(self, *args, **options):
+        if options['applications'] < 1:
+            raise CommandError('Create at least one application')
+
+        seeded = seed_benchmark_data(options['applications'], seed=options['seed'])
+
+        for name, count in seeded['counts'].items():
+            self.stdout.write(f"{name}: {count}")
@@ -0,0 +1,309 @@
+"""
+Per request metrics of the views and per view query budgets.
+
+``RequestMetricsMiddleware`` records for every request the number of SQL
+queries and their time, the time spent assembling data with pandas, the
+number and time of outbound HTTP calls to S3, Twilio and Google, and the
+size of the response. The metrics are logged per request on the
+``application.metrics`` logger and added up per url name in the process,
+``get_request_metrics_api`` returns the totals.
+
+The pandas time is measured by the service functions decorated with
+``measured('pandas')``, without the queries and HTTP calls they make.
+
+``query_budget`` declares the most queries a view may run. A view over its
+budget logs a warning, or raises QueryBudgetExceeded with
+QUERY_BUDGET_STRICT, which is on for the test runner so a regression fails
+the tests.
+"""
+import contextlib
+import contextvars
+import functools
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_current = contextvars.ContextVar('request_metrics', default=None)
+_http_timing_lock = threading.Lock()
+_http_timing_installed = False
+
+
+class QueryBudgetExceeded(Exception):
+    """A view ran more SQL queries than its budget."""
+
+
+class RequestMetrics:
+    """
+    Metrics of one request.
+    """
+    FIELDS = (
+        'queries',
+        'db_ms',
+        'pandas_ms',
+        'http_calls',
+        'http_ms',
+        'response_bytes',
+        'total_ms'
+    )
+
+    def __init__(self):
+        self.values = dict.fromkeys(self.FIELDS, 0)
+        self.active_sections = set()
+
+    def add(self, field, value):
+        """
+        Add to a metric of the request.
+
+        :param field:
+            Metric name.
+        :param value:
+            Amount to add.
+        """
+        self.values[field] += value
+
+    def __str__(self):
+        return ' '.join(
+            f"{field}={round(value, 2)}" for field, value in self.values.items()
+        )
+
+
+class EndpointMetrics:
+    """
+    Metrics of the requests of the process added up per url name.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(self, name, metrics):
+        """
+        Add the metrics of a request to its endpoint.
+
+        :param name:
+            Url name of the request.
+        :param metrics:
+            RequestMetrics of the request.
+        """
+        with self._lock:
+            endpoint = self._endpoints.setdefault(name, {
+                'requests': 0,
+                'total': dict.fromkeys(RequestMetrics.FIELDS, 0),
+                'max': dict.fromkeys(RequestMetrics.FIELDS, 0)
+            })
+            endpoint['requests'] += 1
+            for field, value in metrics.values.items():
+                endpoint['total'][field] += value
+                endpoint['max'][field] = max(endpoint['max'][field], value)
+
+    def snapshot(self):
+        """
+        Average and maximum of every metric per endpoint.
+
+        :return:
+            Dict of url name to the number of requests and the averages and
+            maximums of the metrics, the endpoint with most queries first.
+        """
+        with self._lock:
+            endpoints = {
+                name: {
+                    'requests': endpoint['requests'],
+                    'average': {
+                        field: round(total / endpoint['requests'], 2)
+                        for field, total in endpoint['total'].items()
+                    },
+                    'max': {
+                        field: round(value, 2)
+                        for field, value in endpoint['max'].items()
+                    }
+                }
+                for name, endpoint in self._endpoints.items()
+            }
+
+        return dict(sorted(
+            endpoints.items(),
+            key=lambda item: item[1]['average']['queries'],
+            reverse=True
+        ))
+
+    def reset(self):
+        """
+        Forget the recorded requests.
+        """
+        with self._lock:
+            self._endpoints.clear()
+
+
+endpoint_metrics = EndpointMetrics()
+
+
+@contextlib.contextmanager
+def measure(section):
+    """
+    Time a section of the current request, such as pandas assembly.
+
+    Only the outermost section of a name is timed, so nested service
+    functions are not counted twice. The queries and HTTP calls made in
+    the section are left out of its time.
+
+    :param section:
+        Name of the section, 'pandas' or 'http'.
+    """
+    metrics = _current.get()
+
+    if metrics is None or section in metrics.active_sections:
+        yield
+        return
+
+    metrics.active_sections.add(section)
+    excluded_ms = metrics.values['db_ms'] + metrics.values['http_ms']
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        metrics.active_sections.discard(section)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        if section == 'http':
+            metrics.add('http_calls', 1)
+            metrics.add('http_ms', elapsed_ms)
+        else:
+            excluded_ms = metrics.values['db_ms'] + metrics.values['http_ms'] - excluded_ms
+            metrics.add(f"{section}_ms", max(elapsed_ms - excluded_ms, 0))
+
+
+def measured(section):
+    """
+    Time every call of a function as a section of the current request.
+
+    :param section:
+        Name of the section.
+    :return:
+        Function decorator.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with measure(section):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _record_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper that counts and times the queries of a request.
+    """
+    metrics = _current.get()
+    start = time.perf_counter()
+
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        if metrics is not None:
+            metrics.add('queries', 1)
+            metrics.add('db_ms', (time.perf_counter() - start) * 1000)
+
+
+def install_http_timing():
+    """
+    Time the outbound HTTP calls of the requests.
+
+    boto3 and Twilio send their calls through urllib3 and the Google api
+    client through httplib2, both are wrapped once per process.
+    """
+    global _http_timing_installed
+
+    with _http_timing_lock:
+        if _http_timing_installed:
+            return
+
+        import httplib2  # pylint: disable=import-outside-toplevel
+        from urllib3.connectionpool import HTTPConnectionPool  # pylint: disable=import-outside-toplevel
+
+        HTTPConnectionPool.urlopen = measured('http')(HTTPConnectionPool.urlopen)
+        httplib2.Http.request = measured('http')(httplib2.Http.request)
+        _http_timing_installed = True
+
+
+class RequestMetricsMiddleware:
+    """
+    Record the metrics of every request, enabled with REQUEST_METRICS.
+    """
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        install_http_timing()
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+
+        try:
+            with contextlib.ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_record_query))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+
+        metrics.add('total_ms', (time.perf_counter() - start) * 1000)
+        if not response.streaming:
+            metrics.add('response_bytes', len(response.content))
+
+        match = request.resolver_match
+        name = match.view_name if match else 'unresolved'
+        endpoint_metrics.record(name, metrics)
+        logger.info("%s %s %s", request.method, name, metrics)
+
+        return response
+
+
+def query_budget(max_queries):
+    """
+    Declare the most SQL queries a view may run.
+
+    :param max_queries:
+        Query budget of the view.
+    :return:
+        View decorator, used below api_view.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            queries = []
+
+            def count_query(execute, sql, params, many, context):
+                queries.append(sql)
+                return execute(sql, params, many, context)
+
+            with contextlib.ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(count_query))
+                response = view(*args, **kwargs)
+
+            if len(queries) > max_queries:
+                message = (
+                    f"{view.__name__} ran {len(queries)} queries, "
+                    f"its budget is {max_queries}"
+                )
+                if settings.QUERY_BUDGET_STRICT:
+                    raise QueryBudgetExceeded(message)
+                logger.warning(message)
+
+            return response
+
+        wrapper.query_budget = max_queries
+        return wrapper
+    return decorator
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.3 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0009_backgroundjob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['application_status', 'assessor'], name='app_status_assessor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assessment',
+            index=models.Index(fields=['scheduled_date_time'], name='assessment_scheduled_idx'),
+        ),
+    ]
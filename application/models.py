@@ -2,6 +2,7 @@
 Models for Assessment app containing the application overview and notes.
 """
 from django.db import models
+from django.utils import timezone
 from system_management.models import User
 
 
@@ -92,6 +93,9 @@ class Application(models.Model):
         """Metaclass for application"""
         verbose_name = "Application"
         verbose_name_plural = "Applications"
+        indexes = [
+            models.Index(fields=['application_status', 'assessor'], name='app_status_assessor_idx'),
+        ]
 
     def __str__(self):
         """Return the application type"""
@@ -180,6 +184,9 @@ class Assessment(models.Model):
         """Metaclass for assessment"""
         verbose_name = "Assessment"
         verbose_name_plural = "Assessments"
+        indexes = [
+            models.Index(fields=['scheduled_date_time'], name='assessment_scheduled_idx'),
+        ]
 
     def __str__(self):
         """Return the assessment message"""
@@ -221,3 +228,46 @@ class TwilioRecording(models.Model):
     def __str__(self):
         """Return the recording sid"""
         return str(self.recording_sid)
+
+
+class BackgroundJob(models.Model):
+    """Job for a slow call to an external service, run by the run_jobs worker"""
+    PENDING = 'pending'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    STATUS_CHOICES = (
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (SUCCEEDED, 'Succeeded'),
+        (FAILED, 'Failed'),
+    )
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    idempotency_key = models.CharField(max_length=250, unique=True, null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    date_created = models.DateTimeField(auto_now_add=True)
+    date_modified = models.DateTimeField(auto_now=True)
+
+    # Foreign  key(s) to the background job model
+    user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True,
+                             related_name='background_jobs')
+
+    class Meta:
+        """Metaclass for background job"""
+        verbose_name = "Background Job"
+        verbose_name_plural = "Background Jobs"
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='job_status_run_after_idx'),
+        ]
+
+    def __str__(self):
+        """Return the job name and id"""
+        return f"{self.name} {self.id}"
@@ -0,0 +1,476 @@
+"""
+Shared S3 client, concurrent uploads, streamed copies, generated files and
+cached presigned urls of application files.
+
+The files users upload go through upload_to_s3 of system_management, which
+names their objects, the uploads only run it for several files at once.
+
+Creating a boto3 client is slow and every client opens its own connection
+pool, so the process keeps one client with a connection pool sized for the
+upload workers. boto3 clients are thread safe and the client is shared by
+all requests and worker threads of the process.
+"""
+import base64
+import contextlib
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from system_management.amazons3 import open_s3_file, upload_to_s3
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """
+    Process wide S3 client with a pooled connection.
+
+    :return:
+        boto3 S3 client.
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = boto3.client(
+                    's3',
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                    config=Config(
+                        max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                        retries={'max_attempts': 3, 'mode': 'standard'}
+                    )
+                )
+
+    return _client
+
+
+@contextlib.contextmanager
+def override_s3_client(client):
+    """
+    Hand out the given client instead of the shared one, for local runs.
+
+    :param client:
+        Client to use, normally an in memory fake.
+    """
+    global _client
+
+    previous = _client
+    _client = client
+    try:
+        yield client
+    finally:
+        _client = previous
+
+
+def s3_file_url(file_path):
+    """
+    Public url of an object in the storage bucket.
+
+    :param file_path:
+        Key of the object.
+    :return:
+        Url saved with the answers.
+    """
+    return f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.amazonaws.com/{file_path}"
+
+
+def save_s3_file(content, file_path, content_type=None):
+    """
+    Save generated content, such as a rendered report, as an object.
+
+    :param content:
+        Content of the file as bytes.
+    :param file_path:
+        Key of the object.
+    :param content_type:
+        Content type of the object.
+    :return:
+        Url of the saved file.
+    """
+    extra_args = {'ContentType': content_type} if content_type else {}
+    get_s3_client().put_object(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+        Key=file_path,
+        Body=content,
+        **extra_args
+    )
+    return s3_file_url(file_path)
+
+
+def read_s3_file(file_path):
+    """
+    Content of an object in the storage bucket.
+
+    :param file_path:
+        Key of the object.
+    :return:
+        Content of the file as bytes.
+    """
+    response = get_s3_client().get_object(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+        Key=file_path
+    )
+    return response['Body'].read()
+
+
+def save_s3_local_file(local_path, file_path, content_type=None):
+    """
+    Save a generated file from disk as an object, in parts when it is large.
+
+    :param local_path:
+        Path of the file on disk.
+    :param file_path:
+        Key of the object.
+    :param content_type:
+        Content type of the object.
+    :return:
+        Url of the saved file.
+    """
+    extra_args = {'ContentType': content_type} if content_type else {}
+    get_s3_client().upload_file(
+        local_path,
+        settings.AWS_STORAGE_BUCKET_NAME,
+        file_path,
+        ExtraArgs=extra_args,
+        Config=TransferConfig(
+            multipart_threshold=settings.S3_MULTIPART_THRESHOLD,
+            multipart_chunksize=settings.S3_MULTIPART_THRESHOLD
+        )
+    )
+    return s3_file_url(file_path)
+
+
+def iter_s3_file(file_path, chunk_size=1024 * 1024):
+    """
+    Content of an object in chunks, for streamed responses of large files.
+
+    :param file_path:
+        Key of the object.
+    :param chunk_size:
+        Size of the chunks.
+    :return:
+        Generator of chunks as bytes.
+    """
+    response = get_s3_client().get_object(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+        Key=file_path
+    )
+    try:
+        yield from response['Body'].iter_chunks(chunk_size=chunk_size)
+    finally:
+        response['Body'].close()
+
+
+def _upload_file(file, file_path):
+    """
+    Upload one file with upload_to_s3, which names the object and its url.
+
+    :param file:
+        Uploaded file.
+    :param file_path:
+        Path of the file, as upload_to_s3 takes it.
+    :return:
+        Upload result of the file.
+    """
+    if file is None:
+        return {
+            'file_path': file_path,
+            'status': 'error',
+            'message': 'File was not uploaded with the request'
+        }
+
+    try:
+        file.seek(0)
+        file_url = upload_to_s3(file, file_path)
+    except Exception as error:  # pylint: disable=broad-except
+        return {
+            'file_path': file_path,
+            'status': 'error',
+            'message': str(error)
+        }
+
+    if not file_url:
+        return {
+            'file_path': file_path,
+            'status': 'error',
+            'message': 'File could not be uploaded'
+        }
+
+    return {
+        'file_path': file_path,
+        'status': 'success',
+        'url': file_url
+    }
+
+
+def upload_files_to_s3(uploads):
+    """
+    Upload the files of a submission at the same time.
+
+    Every file is uploaded with upload_to_s3, so the objects are named and
+    linked as for the other uploads of the company. The uploads run on a
+    bounded thread pool, so a submission takes about as long as its slowest
+    file.
+
+    :param uploads:
+        List of (file, file_path) pairs.
+    :return:
+        Upload result of every file in the order of the uploads, with a status
+        and the url of the file or an error message.
+    """
+    if not uploads:
+        return []
+
+    max_workers = min(settings.S3_UPLOAD_WORKERS, len(uploads))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda upload: _upload_file(upload[0], upload[1]),
+            uploads
+        ))
+
+
+def _signing_window():
+    """
+    Expiry bucket of the current time.
+
+    A presigned url is reused for the rest of the bucket it was signed in,
+    the bucket is a quarter of the url expiry so a reused url always has at
+    least three quarters of its lifetime left.
+
+    :return:
+        Bucket number and the seconds left in the bucket.
+    """
+    window = max(1, settings.PRESIGNED_URL_EXPIRY // 4)
+    now = time.time()
+    bucket = int(now // window)
+    return bucket, max(1, int((bucket + 1) * window - now))
+
+
+def presign_file_urls(file_urls):
+    """
+    Presigned urls of stored files, signed once per expiry bucket.
+
+    Urls already signed in the current bucket come from the cache in one
+    read, the rest are signed in the same call and cached together. Files
+    of the storage bucket are signed with the shared client and any other
+    value is opened with open_s3_file.
+
+    :param file_urls:
+        Urls of the files as saved with the answers and notes.
+    :return:
+        Presigned urls in the order of file_urls.
+    """
+    bucket, timeout = _signing_window()
+    cache_keys = {
+        file_url: f"presigned_url:{bucket}:{hashlib.sha1(str(file_url).encode()).hexdigest()}"
+        for file_url in set(file_urls)
+    }
+    cached_urls = cache.get_many(list(cache_keys.values()))
+
+    signed_urls = {}
+    new_urls = {}
+    bucket_url = s3_file_url('')
+
+    for file_url, cache_key in cache_keys.items():
+        if cache_key in cached_urls:
+            signed_urls[file_url] = cached_urls[cache_key]
+            continue
+
+        if isinstance(file_url, str) and file_url.startswith(bucket_url):
+            signed_url = get_s3_client().generate_presigned_url(
+                'get_object',
+                Params={
+                    'Bucket': settings.AWS_STORAGE_BUCKET_NAME,
+                    'Key': file_url[len(bucket_url):]
+                },
+                ExpiresIn=settings.PRESIGNED_URL_EXPIRY
+            )
+        else:
+            signed_url = open_s3_file(file_url)
+
+        signed_urls[file_url] = signed_url
+        new_urls[cache_key] = signed_url
+
+    if new_urls:
+        cache.set_many(new_urls, timeout)
+
+    return [signed_urls[file_url] for file_url in file_urls]
+
+
+def presign_file_url(file_url):
+    """
+    Presigned url of a stored file, see presign_file_urls.
+
+    :param file_url:
+        Url of the file as saved with the answer or note.
+    :return:
+        Presigned url.
+    """
+    return presign_file_urls([file_url])[0]
+
+
+# S3 refuses parts smaller than 5 MB, except for the last part of an upload.
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+def _read_parts(source_url, auth, part_size):
+    """
+    Read a url in parts, resuming with a range request when the stream breaks.
+
+    :param source_url:
+        Url of the file.
+    :param auth:
+        Basic auth of the url, or None.
+    :param part_size:
+        Size of every part but the last one.
+    :return:
+        Generator of parts as bytes.
+    """
+    offset = 0
+    failures = 0
+
+    while True:
+        headers = {'Range': f'bytes={offset}-'} if offset else {}
+        buffer = bytearray()
+
+        try:
+            with requests.get(
+                    source_url,
+                    auth=auth,
+                    headers=headers,
+                    stream=True,
+                    timeout=settings.S3_STREAM_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                if offset and response.status_code != 206:
+                    raise IOError(f"{source_url} cannot resume at byte {offset}")
+
+                for data in response.iter_content(chunk_size=1024 * 1024):
+                    buffer.extend(data)
+                    while len(buffer) >= part_size:
+                        part = bytes(buffer[:part_size])
+                        del buffer[:part_size]
+                        yield part
+                        offset += len(part)
+
+            if buffer:
+                yield bytes(buffer)
+            return
+
+        except requests.RequestException:
+            failures += 1
+            if failures > settings.S3_PART_RETRIES:
+                raise
+
+
+def _upload_part(client, file_path, upload_id, part_number, part):
+    """
+    Upload one part, again when S3 refuses it or the connection fails.
+
+    :param client:
+        S3 client.
+    :param file_path:
+        Key of the object.
+    :param upload_id:
+        Multipart upload id.
+    :param part_number:
+        Number of the part, from 1.
+    :param part:
+        Content of the part.
+    :return:
+        ETag of the part.
+    """
+    content_md5 = base64.b64encode(hashlib.md5(part).digest()).decode()
+
+    for attempt in range(settings.S3_PART_RETRIES + 1):
+        try:
+            return client.upload_part(
+                Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                Key=file_path,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=part,
+                ContentMD5=content_md5
+            )['ETag']
+        except (BotoCoreError, ClientError):
+            if attempt == settings.S3_PART_RETRIES:
+                raise
+
+    return None
+
+
+def stream_url_to_s3(source_url, file_path, auth=None, content_type=None):
+    """
+    Copy a file from a url to S3 without holding the whole file in memory.
+
+    The file is read and uploaded as a multipart upload in parts of
+    S3_STREAM_PART_SIZE, so memory stays at about one part. A broken
+    download resumes from the start of the current part, a failed part is
+    uploaded again, and the ETag of the finished object is checked against
+    the md5 of the parts that were read. The upload is aborted on any error.
+
+    :param source_url:
+        Url of the file.
+    :param file_path:
+        Key of the object.
+    :param auth:
+        Basic auth of the url, or None.
+    :param content_type:
+        Content type of the object.
+    :return:
+        Url of the uploaded file.
+    """
+    client = get_s3_client()
+    bucket = settings.AWS_STORAGE_BUCKET_NAME
+    part_size = max(settings.S3_STREAM_PART_SIZE, MIN_PART_SIZE)
+    extra_args = {'ContentType': content_type} if content_type else {}
+
+    upload_id = client.create_multipart_upload(
+        Bucket=bucket,
+        Key=file_path,
+        **extra_args
+    )['UploadId']
+
+    try:
+        parts = []
+        part_digests = []
+
+        for part_number, part in enumerate(_read_parts(source_url, auth, part_size), start=1):
+            part_digests.append(hashlib.md5(part).digest())
+            parts.append({
+                'PartNumber': part_number,
+                'ETag': _upload_part(client, file_path, upload_id, part_number, part)
+            })
+
+        if not parts:
+            raise IOError(f"{source_url} is empty")
+
+        response = client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=file_path,
+            UploadId=upload_id,
+            MultipartUpload={'Parts': parts}
+        )
+
+    except Exception:
+        client.abort_multipart_upload(Bucket=bucket, Key=file_path, UploadId=upload_id)
+        raise
+
+    checksum = f'"{hashlib.md5(b"".join(part_digests)).hexdigest()}-{len(parts)}"'
+    if response['ETag'] != checksum:
+        client.delete_object(Bucket=bucket, Key=file_path)
+        raise IOError(f"Checksum of {file_path} does not match the downloaded file")
+
+    return s3_file_url(file_path)
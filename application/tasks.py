@@ -0,0 +1,142 @@
+"""
+Background job handlers for the calls to Twilio and Google Calendar.
+
+The handlers are registered by name with ``job_handler`` and run by the
+``run_jobs`` management command, see ``application.jobs``.
+"""
+from decouple import config
+
+import system_management.constants as constants
+from application.clients import CALENDAR_ID, get_calendar_service, get_twilio_client
+from application.jobs import job_handler, PermanentJobError
+from application.lazy import lazy_module
+from application.storage import stream_url_to_s3
+from application.models import Assessment, TwilioRoom, TwilioRecording
+
+CREATE_TWILIO_ROOM = 'create_twilio_room'
+RECORDING_TO_S3 = 'recording_to_s3'
+INSERT_CALENDAR_EVENT = 'insert_calendar_event'
+
+twilio_exceptions = lazy_module('twilio.base.exceptions')
+
+
+class RecordingNotReady(Exception):
+    """The room has no completed recording yet, the job is retried."""
+
+
+@job_handler(CREATE_TWILIO_ROOM)
+def create_twilio_room(assessment_id, room_name):
+    """
+    Create the Twilio video room of an assessment.
+
+    A room with the name that is still open is looked up and saved instead.
+
+    :param assessment_id:
+        Assessment id.
+    :param room_name:
+        Unique name of the room.
+    :return:
+        Room sid and name.
+    """
+    client = get_twilio_client()
+
+    try:
+        room = client.video.v1.rooms.create(
+            record_participants_on_connect=True,
+            type='group',
+            unique_name=room_name
+        )
+    except twilio_exceptions.TwilioRestException as error:
+        if 'room exists' not in str(error).lower():
+            raise
+        room = client.video.v1.rooms(room_name).fetch()
+
+    TwilioRoom.objects.update_or_create(
+        assessment_id=assessment_id,
+        defaults={
+            "room_sid": room.sid,
+            "room_name": room_name,
+            "room_status": constants.ACTIVE
+        }
+    )
+
+    return {'room_sid': room.sid, 'room_name': room_name}
+
+
+@job_handler(RECORDING_TO_S3)
+def recording_to_s3(room_id):
+    """
+    Copy the completed recording of a Twilio room to S3.
+
+    :param room_id:
+        Twilio room id.
+    :return:
+        Recording sid and url.
+    """
+    try:
+        twilio_room = TwilioRoom.objects.select_related('assessment').get(id=room_id)
+    except TwilioRoom.DoesNotExist as error:
+        raise PermanentJobError('Room not found') from error
+
+    client = get_twilio_client()
+    recordings = client.video \
+           .v1 \
+           .rooms(twilio_room.room_sid) \
+           .recordings \
+           .list(limit=20)
+
+    recording_sid = ''
+
+    for recording in recordings:
+        if recording.status == 'completed':
+            recording_sid = recording.sid
+
+    if recording_sid == '':
+        raise RecordingNotReady(f'Room {twilio_room.room_sid} has no completed recording')
+
+    chosen_recording = client.video.recordings(recording_sid).fetch()
+    file_name = f'assessment_{twilio_room.assessment.id}/recordings/recording_{recording_sid}.mp4'
+    file_path = stream_url_to_s3(
+        chosen_recording.links['media'],
+        file_name,
+        auth=(config('ACCOUNT_SID'), config('AUTH_TOKEN')),
+        content_type='video/mp4'
+    )
+
+    TwilioRecording.objects.update_or_create(
+        twilio_room_id=twilio_room.id,
+        defaults={
+            'recording_sid': recording_sid,
+            'recording_url': file_path
+        }
+    )
+
+    return {'recording_sid': recording_sid, 'recording_url': file_path}
+
+
+@job_handler(INSERT_CALENDAR_EVENT)
+def insert_calendar_event(assessment_id, event):
+    """
+    Insert the Google Calendar event of an assessment.
+
+    :param assessment_id:
+        Assessment id.
+    :param event:
+        Body of the calendar event.
+    :return:
+        Event id and summary.
+    """
+    service = get_calendar_service()
+
+    event = service.events().insert(
+        calendarId=CALENDAR_ID,
+        conferenceDataVersion=1,
+        body=event
+    ).execute()
+
+    Assessment.objects.filter(id=assessment_id).update(
+        event_id=event['id'],
+        summary=event['summary']
+    )
+
+    return {'event_id': event['id'], 'summary': event['summary']}
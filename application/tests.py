@@ -1,3 +1,366 @@
-from django.test import TestCase
+"""
+Application test cases.
+"""
+import csv
+import io
+import subprocess
+import sys
+import threading
+from types import SimpleNamespace
+from unittest import mock
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+import system_management.constants as constants
+from system_management.models import User, UserType
+from application.api.services import filter_records, nest_records
+from application.benchmark import seed_benchmark_data
+from application.clients import TWILIO, ClientRegistry, clients
+from application.data_export import iter_csv, iter_export_chunks
+from application.lazy import IMPORT_BUDGET_MODULES, IMPORT_TIME_BUDGET
+from application.jobs import (
+    JOB_HANDLERS,
+    claim_next_job,
+    enqueue_job,
+    job_handler,
+    run_job
+)
+from application.metrics import (
+    EndpointMetrics,
+    QueryBudgetExceeded,
+    RequestMetrics,
+    query_budget
+)
+from application.models import (
+    Application,
+    ApplicationStatus,
+    Assessment,
+    BackgroundJob,
+    Client,
+    TwilioRoom
+)
+from application.tasks import CREATE_TWILIO_ROOM, RECORDING_TO_S3, twilio_exceptions
+from claims.models import Claim
 
-# Create your tests here.
+
+@override_settings(JOB_MAX_ATTEMPTS=2, JOB_RETRY_BACKOFF=30)
+class BackgroundJobTestCase(TestCase):
+    """
+    Jobs are queued once per idempotency key, retried and then failed.
+    """
+
+    def setUp(self):
+        self.calls = []
+
+        @job_handler('test_job')
+        def test_job(value):
+            self.calls.append(value)
+            if value == 'fail':
+                raise ValueError('failed')
+            return {'value': value}
+
+    def tearDown(self):
+        JOB_HANDLERS.pop('test_job', None)
+
+    def test_idempotency_key(self):
+        job = enqueue_job('test_job', {'value': 'a'}, idempotency_key='key')
+        same_job = enqueue_job('test_job', {'value': 'a'}, idempotency_key='key')
+
+        self.assertEqual(job.id, same_job.id)
+        self.assertEqual(BackgroundJob.objects.count(), 1)
+
+    def test_run_job(self):
+        job = enqueue_job('test_job', {'value': 'a'})
+
+        job = run_job(claim_next_job())
+
+        self.assertEqual(job.status, BackgroundJob.SUCCEEDED)
+        self.assertEqual(job.result, {'value': 'a'})
+        self.assertIsNone(claim_next_job())
+
+    def test_retry_then_fail(self):
+        job = enqueue_job('test_job', {'value': 'fail'})
+
+        job = run_job(claim_next_job())
+        self.assertEqual(job.status, BackgroundJob.PENDING)
+        self.assertGreater(job.run_after, timezone.now())
+        self.assertIsNone(claim_next_job())
+
+        BackgroundJob.objects.filter(id=job.id).update(run_after=timezone.now())
+        job = run_job(claim_next_job())
+
+        self.assertEqual(job.status, BackgroundJob.FAILED)
+        self.assertEqual(job.attempts, 2)
+        self.assertEqual(self.calls, ['fail', 'fail'])
+
+
+@override_settings(JOB_MAX_ATTEMPTS=2, JOB_RETRY_BACKOFF=30)
+class TwilioJobsTestCase(TestCase):
+    """
+    The Twilio jobs retry until Twilio has what they need.
+    """
+
+    def setUp(self):
+        seed_benchmark_data(2, seed=1)
+        self.assessment = Assessment.objects.first()
+        self.twilio = mock.MagicMock()
+
+    def run_next_job(self):
+        with clients.override(TWILIO, self.twilio):
+            return run_job(claim_next_job())
+
+    def test_room_exists(self):
+        rooms = self.twilio.video.v1.rooms
+        rooms.create.side_effect = twilio_exceptions.TwilioRestException(
+            400,
+            '/Rooms',
+            'Room exists'
+        )
+        rooms.return_value.fetch.return_value = SimpleNamespace(sid='RM2')
+        enqueue_job(
+            CREATE_TWILIO_ROOM,
+            {'assessment_id': self.assessment.id, 'room_name': 'room'},
+            idempotency_key=f'{CREATE_TWILIO_ROOM}:{self.assessment.id}'
+        )
+
+        job = self.run_next_job()
+
+        self.assertEqual(job.status, BackgroundJob.SUCCEEDED)
+        rooms.assert_called_with('room')
+        self.assertTrue(TwilioRoom.objects.filter(
+            assessment=self.assessment,
+            room_sid='RM2'
+        ).exists())
+
+    def test_recording_not_ready(self):
+        room = TwilioRoom.objects.create(
+            assessment=self.assessment,
+            room_name='room',
+            room_sid='RM1',
+            room_status=constants.ACTIVE
+        )
+        self.twilio.video.v1.rooms.return_value.recordings.list.return_value = [
+            SimpleNamespace(sid='RT1', status='processing')
+        ]
+        key = f'{RECORDING_TO_S3}:{room.room_sid}'
+        job = enqueue_job(RECORDING_TO_S3, {'room_id': room.id}, idempotency_key=key)
+
+        job = self.run_next_job()
+        self.assertEqual(job.status, BackgroundJob.PENDING)
+
+        BackgroundJob.objects.filter(id=job.id).update(run_after=timezone.now())
+        job = self.run_next_job()
+        self.assertEqual(job.status, BackgroundJob.FAILED)
+
+        job = enqueue_job(RECORDING_TO_S3, {'room_id': room.id}, idempotency_key=key)
+        self.assertEqual(job.status, BackgroundJob.PENDING)
+
+
+class ClientRegistryTestCase(SimpleTestCase):
+    """
+    Clients are created once per process or thread and can be replaced.
+    """
+
+    def setUp(self):
+        self.registry = ClientRegistry()
+        self.registry.register('shared', object)
+        self.registry.register('local', object, per_thread=True)
+
+    def get_in_thread(self, name):
+        clients = []
+        thread = threading.Thread(target=lambda: clients.append(self.registry.get(name)))
+        thread.start()
+        thread.join()
+        return clients[0]
+
+    def test_shared_client(self):
+        client = self.registry.get('shared')
+
+        self.assertIs(self.registry.get('shared'), client)
+        self.assertIs(self.get_in_thread('shared'), client)
+
+    def test_per_thread_client(self):
+        client = self.registry.get('local')
+
+        self.assertIs(self.registry.get('local'), client)
+        self.assertIsNot(self.get_in_thread('local'), client)
+
+    def test_override(self):
+        client = self.registry.get('shared')
+        fake = object()
+
+        with self.registry.override('shared', fake):
+            self.assertIs(self.registry.get('shared'), fake)
+
+        self.assertIs(self.registry.get('shared'), client)
+
+
+class DataExportTestCase(TestCase):
+    """
+    Exports read the rows in chunks of consecutive ids.
+    """
+
+    def setUp(self):
+        user = User.objects.create_user(
+            email='admin@example.com',
+            first_name='Test',
+            last_name='Admin',
+            user_type=UserType.objects.create(name=constants.ADMIN),
+            password='password'
+        )
+        status = ApplicationStatus.objects.create(name='Pending')
+        self.applications = [
+            Application.objects.create(
+                user=user,
+                application_status=status,
+                client=Client.objects.create(
+                    first_name=f'Client {index}',
+                    last_name='Test',
+                    email=f'client{index}@example.com',
+                    id_number='0000000000000',
+                    phone_number='0000000000',
+                    policy_no=f'POL{index}'
+                )
+            )
+            for index in range(3)
+        ]
+
+    def test_chunks(self):
+        chunks = list(iter_export_chunks('applications', {}, chunk_size=2))
+
+        self.assertEqual([len(rows) for rows in chunks], [2, 1])
+        self.assertEqual(
+            [row['id'] for rows in chunks for row in rows],
+            [application.id for application in self.applications]
+        )
+
+    def test_csv(self):
+        content = b''.join(iter_csv('applications', {}, chunk_size=2)).decode()
+        rows = list(csv.DictReader(io.StringIO(content)))
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]['application_status__name'], 'Pending')
+
+
+class QueryBudgetTestCase(TestCase):
+    """
+    Views over their query budget fail in strict mode and warn otherwise.
+    """
+
+    def setUp(self):
+        @query_budget(1)
+        def view():
+            return [UserType.objects.count(), UserType.objects.count()]
+
+        self.view = view
+
+    @override_settings(QUERY_BUDGET_STRICT=True)
+    def test_strict(self):
+        with self.assertRaises(QueryBudgetExceeded):
+            self.view()
+
+    @override_settings(QUERY_BUDGET_STRICT=False)
+    def test_warning(self):
+        with self.assertLogs('application.metrics', level='WARNING'):
+            self.assertEqual(self.view(), [0, 0])
+
+
+class EndpointMetricsTestCase(SimpleTestCase):
+    """
+    Request metrics are averaged per endpoint.
+    """
+
+    def test_snapshot(self):
+        endpoints = EndpointMetrics()
+
+        for queries in (2, 4):
+            metrics = RequestMetrics()
+            metrics.add('queries', queries)
+            endpoints.record('get_all_claims_api', metrics)
+
+        snapshot = endpoints.snapshot()['get_all_claims_api']
+
+        self.assertEqual(snapshot['requests'], 2)
+        self.assertEqual(snapshot['average']['queries'], 3)
+        self.assertEqual(snapshot['max']['queries'], 4)
+
+
+class SeedBenchmarkTestCase(TestCase):
+    """
+    The benchmark seed creates linked rows on every database.
+    """
+
+    def test_seed(self):
+        seeded = seed_benchmark_data(6, seed=1)
+        counts = seeded['counts']
+
+        self.assertEqual(counts['applications'], 6)
+        self.assertEqual(counts['surveys'], 3)
+        self.assertEqual(counts['assessments'], Assessment.objects.count())
+        self.assertGreater(counts['what_answers'], 0)
+        self.assertGreater(counts['survey_answers'], 0)
+        self.assertTrue(Claim.objects.filter(
+            id=seeded['claim_id'],
+            application_id=seeded['claim_application_id'],
+            applicationcause__isnull=False
+        ).exists())
+
+
+class ImportBudgetTestCase(SimpleTestCase):
+    """
+    Starting the project does not import the heavy libraries.
+    """
+
+    def test_startup_imports(self):
+        script = (
+            "import sys, time\n"
+            "start = time.perf_counter()\n"
+            "import django\n"
+            "django.setup()\n"
+            "from django.urls import get_resolver\n"
+            "get_resolver().url_patterns\n"
+            "print(time.perf_counter() - start)\n"
+            f"print(','.join(name for name in {IMPORT_BUDGET_MODULES!r} if name in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', script],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        seconds, loaded = result.stdout.splitlines()[-2:]
+
+        self.assertEqual(loaded, '')
+        self.assertLess(float(seconds), IMPORT_TIME_BUDGET)
+
+
+class RecordsTestCase(SimpleTestCase):
+    """
+    Plain record helpers give the same records as the DataFrame versions.
+    """
+
+    def test_filter_records(self):
+        records = [
+            {'id': 1, 'status': 'Pending'},
+            {'id': 2, 'status': 'Completed'},
+            {'id': 3, 'status': 'Pending'}
+        ]
+
+        self.assertEqual(
+            [record['id'] for record in filter_records(records, status='Pending')],
+            [1, 3]
+        )
+
+    def test_nest_records(self):
+        parents = [{'id': 1}, {'id': 2}]
+        children = [
+            {'id': 10, 'parent_id': 2},
+            {'id': 11, 'parent_id': None},
+            {'id': 12, 'parent_id': 2}
+        ]
+
+        nest_records(parents, 'id', children, 'parent_id', 'children')
+
+        self.assertEqual(parents[0]['children'], [])
+        self.assertEqual([child['id'] for child in parents[1]['children']], [10, 12])
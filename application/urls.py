@@ -25,6 +25,7 @@ urlpatterns = [
         name="change_application_status"),
 
     path('event_calendar/', views.event_calendar, name="event_calendar"),
+    path('calendar_events/', views.calendar_events, name="calendar_events"),
     path('create_room/', views.create_room, name="create_room"),
     path('get_assessments/', views.get_assessments, name="get_assessments"),
     path('get_assessment_info/', views.get_assessment_info, name="get_assessment_info"),
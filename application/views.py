@@ -11,46 +11,26 @@ The views file contains the following views:
 """
 import json
 import pathlib
-import os
 import uuid
-from django.utils.timezone import make_aware
-from datetime import datetime
-import googleapiclient
+from django.utils.timezone import make_aware, localdate
+from datetime import datetime, timedelta
 import threading
 from dateutil.parser import parse
 
+from django.conf import settings
 from django.http import JsonResponse
 from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
 from django.shortcuts import render, redirect
-from django.conf import settings
-from google.auth.transport.requests import Request
-from google.oauth2 import service_account
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 
 from system_management.decorators import check_token_in_session
-from system_management.general_func_classes import host_url, api_connection, _send_email_thread
+from system_management.general_func_classes import host_url, _send_email_thread
+from application.dispatch import dispatch_api
+from application.api.services import month_grid_window, month_window, records_etag
+from application.clients import get_calendar_service
 import system_management.constants as constants
 from system_management.amazons3 import upload_to_s3
 
-PATH = str(os.path.join(settings.BASE_DIR, "acorn-377214-72e9ef25960f.json")).replace('\\', '/')
-SERVICE_ACCOUNT_FILE = PATH
-
-SCOPES = [
-    'https://www.googleapis.com/auth/calendar',
-    'https://www.googleapis.com/auth/calendar.events'
-]
-
-CALENDAR_ID = 'c_fcac2d5608ba437916879de91dc0a7d83ce4ade9588' \
-              '05ebd569c267035c92dc0@group.calendar.google.com'
-
-credentials = service_account.Credentials.from_service_account_file(
-    SERVICE_ACCOUNT_FILE,
-    scopes=SCOPES
-)
-
 
 @check_token_in_session
 def join_meeting(request, assessment_id):
@@ -70,7 +50,7 @@ def join_meeting(request, assessment_id):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, headers=headers, data=payload)
+        response_data = dispatch_api(method="POST", url=url, headers=headers, data=payload)
         return JsonResponse(response_data, safe=False)
 
     if request.method == "GET":
@@ -102,7 +82,7 @@ def insurance_providers(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="GET", url=url, data=payload, headers=headers)
+        response_data = dispatch_api(method="GET", url=url, data=payload, headers=headers)
 
         context = {
             "providers": response_data.get('data'),
@@ -141,7 +121,7 @@ def add_insurance_provider(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload, headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload, headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -179,7 +159,7 @@ def edit_insurance_provider(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload, headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload, headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -211,7 +191,7 @@ def del_insurance_provider(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload, headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload, headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -237,7 +217,7 @@ def edit_assessment_note_file(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="GET", url=url, data=payload, headers=headers)
+        response_data = dispatch_api(method="GET", url=url, data=payload, headers=headers)
 
         file_name_obj = response_data.get('data').get('note')
 
@@ -249,7 +229,7 @@ def edit_assessment_note_file(request):
             'file': file_url
         })
 
-        response_data = api_connection(method="POST", url=url, data=payload, headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload, headers=headers)
 
         return JsonResponse(data=response_data, safe=False)
 
@@ -301,25 +281,13 @@ def save_note_object(description, file, claim_id, url, headers, assessment_id):
         'description': description,
         'file': file_url
     })
-    api_connection(method="POST", url=url, data=payload, headers=headers)
+    dispatch_api(method="POST", url=url, data=payload, headers=headers)
     return None
 
 
 def build_service():
-    credentials = None
-    if os.path.exists('token.json'):
-        credentials = Credentials.from_authorized_user_file('token.json', SCOPES)
-    if not credentials or not credentials.valid:
-        if credentials and credentials.expired and credentials.refresh_token:
-            credentials.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                'credentials.json', SCOPES)
-            credentials = flow.run_local_server(port=0)
-        with open('token.json', 'w') as token:
-            token.write(credentials.to_json())
-    service = googleapiclient.discovery.build('calendar', 'v3', credentials=credentials)
-    return service
+    """Google calendar service of the service account, shared by the thread."""
+    return get_calendar_service()
 
 
 @check_token_in_session
@@ -349,7 +317,7 @@ def schedule_assessment(request):
             'assessor_id': request.session.get('user_id')
         })
 
-        response_data = api_connection(
+        response_data = dispatch_api(
             method="GET",
             url=url,
             data=payload,
@@ -381,111 +349,60 @@ def schedule_assessment(request):
         )
         ))
 
-        credentials = service_account.Credentials.from_service_account_file(
-            SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-        delegated_credentials = credentials.with_subject('info@acornfintechplatform.co.za')
-
         try:
-            service = build('calendar', 'v3', credentials=delegated_credentials)
+            attendees = [
+                {
+                    "id": client['id'],
+                    "displayName": f"{client['first_name']} {client['last_name']}",
+                    "email": client['email'],
+                },
+            ]
 
             if assessor:
-                event = (
-                    service.events()
-                    .insert(
-                        calendarId=CALENDAR_ID,
-                        conferenceDataVersion=1,
-                        body={
-                            'summary': f'Assessment {str(application["id"])}',
-                            'location': 'Online',
-                            'visibility': 'public',
-                            'description': description,
-                            'start': {
-                                'dateTime': parse(start_date).isoformat(),
-                                'timeZone': 'Africa/Johannesburg',
-                            },
-                            'end': {
-                                'dateTime': parse(end_date).isoformat(),
-                                'timeZone': 'Africa/Johannesburg',
-                            },
-
-                            'reminders': {
-                                'useDefault': False,
-                                'overrides': [
-                                    {'method': 'email', 'minutes': 24 * 60},
-                                    {'method': 'popup', 'minutes': 10},
-                                ],
-                            },
-                            "attendees": [
-                                {
-                                    "id": assessor['id'],
-                                    "displayName": f"{assessor['first_name']} {assessor['last_name']}",
-                                    "email": assessor['email'],
-                                },
-                                {
-                                    "id": client['id'],
-                                    "displayName": f"{client['first_name']} {client['last_name']}",
-                                    "email": client['email'],
-                                },
-                            ],
-                        },
-                    )
-                    .execute()
-                )
-            else:
-                event = (
-                    service.events()
-                    .insert(
-                        calendarId=CALENDAR_ID,
-                        conferenceDataVersion=1,
-                        body={
-                            'summary': f'Assessment {str(application["id"])}',
-                            'location': 'Online',
-                            'visibility': 'public',
-                            'description': description,
-                            'start': {
-                                'dateTime': parse(start_date).isoformat(),
-                                'timeZone': 'Africa/Johannesburg',
-                            },
-                            'end': {
-                                'dateTime': parse(end_date).isoformat(),
-                                'timeZone': 'Africa/Johannesburg',
-                            },
-
-                            'reminders': {
-                                'useDefault': False,
-                                'overrides': [
-                                    {'method': 'email', 'minutes': 24 * 60},
-                                    {'method': 'popup', 'minutes': 10},
-                                ],
-                            },
-                            "attendees": [
-                                {
-                                    "id": client['id'],
-                                    "displayName": f"{client['first_name']} {client['last_name']}",
-                                    "email": client['email'],
-                                },
-                            ],
-                        },
-                    )
-                    .execute()
-                )
+                attendees.insert(0, {
+                    "id": assessor['id'],
+                    "displayName": f"{assessor['first_name']} {assessor['last_name']}",
+                    "email": assessor['email'],
+                })
 
-            event_summary = event['summary']
-            event_id = event['id']
-            end_time = event['end']['dateTime']
+            # The calendar event is inserted by the run_jobs worker, the
+            # assessment is saved with the event id once it exists.
+            event = {
+                'summary': f'Assessment {str(application["id"])}',
+                'location': 'Online',
+                'visibility': 'public',
+                'description': description,
+                'start': {
+                    'dateTime': parse(start_date).isoformat(),
+                    'timeZone': 'Africa/Johannesburg',
+                },
+                'end': {
+                    'dateTime': parse(end_date).isoformat(),
+                    'timeZone': 'Africa/Johannesburg',
+                },
+
+                'reminders': {
+                    'useDefault': False,
+                    'overrides': [
+                        {'method': 'email', 'minutes': 24 * 60},
+                        {'method': 'popup', 'minutes': 10},
+                    ],
+                },
+                "attendees": attendees,
+            }
 
             payload = json.dumps({
                 "application_id": application['id'],
                 "description": description,
                 "start_date": start_date,
-                "end_time": end_time,
-                "event_summary": event_summary,
-                "event_id": event_id,
+                "end_time": event['end']['dateTime'],
+                "event_summary": event['summary'],
+                "event": event,
             })
 
             url = f"{host_url(request)}{reverse('create_assessment_api')}"
 
-            response_data = api_connection(
+            response_data = dispatch_api(
                 method="POST",
                 url=url,
                 data=payload,
@@ -534,7 +451,7 @@ def schedule_assessment(request):
                 payload = json.dumps({
                     "assessment_id": assessment_id
                 })
-                response_data = api_connection(
+                response_data = dispatch_api(
                     method="POST",
                     url=url,
                     data=payload,
@@ -608,7 +525,7 @@ def complete_status(request, application_id):
 
         })
 
-        response_data = api_connection(method="POST", data=payload, url=url, headers=headers)
+        response_data = dispatch_api(method="POST", data=payload, url=url, headers=headers)
         response_status = response_data.get('status')
         if response_status == 'success':
             return redirect('manage_application', application_id=application_id)
@@ -642,7 +559,7 @@ def change_application_status(request):
 
         })
 
-        response_data = api_connection(method="POST", data=payload, url=url, headers=headers)
+        response_data = dispatch_api(method="POST", data=payload, url=url, headers=headers)
         return JsonResponse(data=response_data, safe=False)
 
 
@@ -651,22 +568,45 @@ def event_calendar(request):
     """
     Events for application assessments.
 
+    With CALENDAR_MONTH_WINDOW on, only the full weeks of the month grid are
+    loaded. The month is passed as ``?month=YYYY-MM`` and defaults to the
+    current month, and the calendar template must load the other months with
+    calendar_events or link to previous_month and next_month. Without it
+    every assessment of the user is loaded, as the calendar template expects.
+
     :param request:
         Django rest framework
     :return:
         Status of api call.
     """
     if request.method == 'GET':
-        url = f"{host_url(request)}{reverse('event_calendar_api')}"
-        payload = json.dumps({
+        try:
+            month = datetime.strptime(request.GET.get('month', ''), '%Y-%m')
+        except ValueError:
+            month = localdate()
+        start, end = month_window(month.year, month.month)
+        grid_start, grid_end = month_grid_window(
+            month.year,
+            month.month,
+            settings.CALENDAR_FIRST_WEEKDAY
+        )
+
+        data = {
             'user_id': request.session.get('user_id')
-        })
+        }
+
+        if settings.CALENDAR_MONTH_WINDOW:
+            data['start'] = grid_start.isoformat()
+            data['end'] = grid_end.isoformat()
+
+        url = f"{host_url(request)}{reverse('event_calendar_api')}"
+        payload = json.dumps(data)
         headers = {
             'Content-Type': 'application/json',
             'Authorization': f'Token {request.session.get("token")}'
         }
 
-        response_data = api_connection(method="GET", url=url, headers=headers, data=payload)
+        response_data = dispatch_api(method="GET", url=url, headers=headers, data=payload)
         status = response_data.get('status')
 
         context = {}
@@ -676,7 +616,48 @@ def event_calendar(request):
             context = {
                 'events': events
             }
+
+        context.update({
+            'month': start.strftime('%Y-%m'),
+            'previous_month': (start - timedelta(days=1)).strftime('%Y-%m'),
+            'next_month': end.strftime('%Y-%m')
+        })
         return render(request, 'assessment/calendar.html', context)
+
+
+@check_token_in_session
+def calendar_events(request):
+    """
+    Calendar events in the window the calendar shows.
+
+    The calendar passes the window as ``?start=...&end=...`` when it changes
+    month and revalidates the events it has with the ETag of the response.
+
+    :param request:
+        Django rest framework
+    :return:
+        Status of api call.
+    """
+    if request.method == 'GET':
+        url = f"{host_url(request)}{reverse('calendar_events_api')}"
+        payload = json.dumps({
+            'start': request.GET.get('start'),
+            'end': request.GET.get('end')
+        })
+        headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Token {request.session.get("token")}'
+        }
+
+        response_data = dispatch_api(method="GET", url=url, headers=headers, data=payload)
+        response = JsonResponse(response_data, safe=True)
+
+        if response_data.get('status') != 'success':
+            return response
+
+        response['ETag'] = records_etag(response_data)
+        patch_cache_control(response, private=True, no_cache=True)
+        return get_conditional_response(request, etag=response['ETag'], response=response)
     
     
 
@@ -693,7 +674,7 @@ def create_room(request):
             'Content-Type': 'application/json',
             'Authorization': f'Token {token}'
         }
-        response_data = api_connection(method="POST", url=url, headers=headers, data=payload)
+        response_data = dispatch_api(method="POST", url=url, headers=headers, data=payload)
 
         return JsonResponse(response_data, safe=True)
 
@@ -720,7 +701,7 @@ def video_conference(request, assessment_id):
             'Content-Type': 'application/json',
             'Authorization': f'Token {token}'
         }
-        response_data = api_connection(method="GET", url=url, headers=headers, data=payload)
+        response_data = dispatch_api(method="GET", url=url, headers=headers, data=payload)
         status = response_data.get('status')
         context = {}
 
@@ -757,7 +738,7 @@ def get_assessments(request):
             'Authorization': f'Token {request.session.get("token")}'
         }
 
-        response_data = api_connection(method="GET", url=url, headers=headers, data=payload)
+        response_data = dispatch_api(method="GET", url=url, headers=headers, data=payload)
         return JsonResponse(response_data, safe=True)
 
 
@@ -782,7 +763,7 @@ def get_assessment_info(request):
             'Authorization': f'Token {request.session.get("token")}'
         }
 
-        response_data = api_connection(method="GET", url=url, headers=headers, data=payload)
+        response_data = dispatch_api(method="GET", url=url, headers=headers, data=payload)
         return JsonResponse(response_data, safe=True)
 
 
@@ -808,7 +789,7 @@ def get_event_token(request):
             'Authorization': f'Token {request.session.get("token")}'
         }
 
-        response_data = api_connection(method="GET", url=url, headers=headers, data=payload)
+        response_data = dispatch_api(method="GET", url=url, headers=headers, data=payload)
         return JsonResponse(response_data, safe=True)
 
 
@@ -833,7 +814,7 @@ def mark_event_complete(request):
             'Authorization': f'Token {request.session.get("token")}'
         }
 
-        response_data = api_connection(method="POST", url=url, headers=headers, data=payload)
+        response_data = dispatch_api(method="POST", url=url, headers=headers, data=payload)
         return JsonResponse(response_data, safe=True)
 
 
@@ -857,5 +838,5 @@ def video_complete_status(request, twilio_room_id):
             'Authorization': f'Token {request.session.get("token")}'
         }
 
-        response_data = api_connection(method="POST", url=url, headers=headers, data=payload)
+        response_data = dispatch_api(method="POST", url=url, headers=headers, data=payload)
         return render(request, 'assessment/video_complete_status.html', response_data)
@@ -1460,6 +1460,69 @@ class GenerateReportClaimSerializer(BaseFormSerializer):
     )
 
 
+class ExportReportsSerializer(BaseFormSerializer):
+    """
+    Serializer for the applications and format of a bulk report export.
+    """
+    application_ids = serializers.ListField(
+        required=False,
+        read_only=False,
+        write_only=False,
+        allow_empty=False,
+        child=serializers.IntegerField()
+    )
+    insurer_id = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        read_only=False,
+        write_only=False
+    )
+    status = serializers.CharField(
+        max_length=250,
+        required=False,
+        allow_null=True,
+        allow_blank=True,
+        read_only=False,
+        write_only=False,
+        error_messages={
+            'max_length': 'The status field must be less than 250 characters.'
+        }
+    )
+    date_from = serializers.DateField(
+        required=False,
+        allow_null=True,
+        read_only=False,
+        write_only=False
+    )
+    date_to = serializers.DateField(
+        required=False,
+        allow_null=True,
+        read_only=False,
+        write_only=False
+    )
+    export_format = serializers.ChoiceField(
+        choices=['zip', 'pdf'],
+        required=False,
+        default='zip',
+        read_only=False,
+        write_only=False,
+        error_messages={
+            'invalid_choice': 'The export format must be zip or pdf.'
+        }
+    )
+
+    def validate(self, attrs):
+        """
+        Require the application ids or at least one filter.
+        """
+        filters = ('application_ids', 'insurer_id', 'status', 'date_from', 'date_to')
+        if not any(attrs.get(field) for field in filters):
+            raise serializers.ValidationError(
+                'The application ids or an insurer, status or date filter is required.'
+            )
+        return attrs
+
+
 class ApplicationClaimModelSerializer(serializers.ModelSerializer):
     """
     Application claim model serializer.
@@ -2,12 +2,24 @@
 """
 Additional functions for claim api that link data together.
 """
-import pandas as pd
+from __future__ import annotations
+import json
+from application.lazy import lazy_module
 from claims.api.serializers import (
     AssessmentModelSerializer,
+    ApplicationClaimModelSerializer,
+    ApplicationTypeModelSerializer,
     CauseCategoryModelSerializer,
     HowCategoryModelSerializer,
-    WhatCategoryModelSerializer
+    WhatCategoryModelSerializer,
+    HowQuestionTitleModelSerializer,
+    HowQuestionModelSerializer,
+    HowQuestionOptionModelSerializer,
+    HowQuestionAnswerModelSerializer,
+    WhatQuestionTitleModelSerializer,
+    WhatQuestionModelSerializer,
+    WhatQuestionOptionModelSerializer,
+    WhatQuestionAnswerModelSerializer
 )
 from claims.models import (
     WhatCategory,
@@ -27,14 +39,28 @@ from claims.models import (
     WhatQuestionAnswer,
     Claim
 )
-from system_management.amazons3 import(
-    open_s3_file
+from application.storage import (
+    presign_file_url,
+    presign_file_urls
 )
 from application.models import (
-    Assessment
+    Application,
+    Assessment,
+    ApplicationType
 )
+from application.api.renderers import ORJSONRenderer
+from application.api.services import (
+    group_records,
+    nest_children
+)
+from application.cache import VersionedCache
+from application.metrics import measured
+
+pd = lazy_module('pandas')
+claim_taxonomy_cache = VersionedCache('claim_taxonomy')
 
 
+@measured('pandas')
 def application_link_data(df_types: pd.DataFrame) -> pd.DataFrame:
     """
     Application Type Categories and questions
@@ -82,28 +108,15 @@ def application_link_data(df_types: pd.DataFrame) -> pd.DataFrame:
             )
             if what_categories.exists():
                 df_what = get_what_question_title(df_what)
-                df_cause['what_category'] = df_cause['id'].apply(
-                    lambda cause_id:
-                    df_what.loc[
-                        df_what['cause_id'] == cause_id
-                    ].to_dict('records')
-                )
+                df_cause['what_category'] = nest_children(df_cause, 'id', df_what, 'cause_id')
 
             df_how = pd.DataFrame(how_categories)
             if how_categories.exists():
                 df_how = get_how_question_title(df_how)
-                df_cause['how_category'] = df_cause['id'].apply(
-                    lambda cause_id:
-                    df_how.loc[
-                        df_how['cause_id'] == cause_id
-                    ].to_dict('records')
-                )
+                df_cause['how_category'] = nest_children(df_cause, 'id', df_how, 'cause_id')
         
-            df_types['categories'] = df_types['id'].apply(
-                lambda type_id:
-                df_cause.loc[
-                    df_cause['application_type_id'] == type_id
-                ].to_dict('records')
+            df_types['categories'] = nest_children(
+                df_types, 'id', df_cause, 'application_type_id'
             )
         
     return df_types
@@ -135,12 +148,7 @@ def get_what_question_title(df_what: pd.DataFrame) -> pd.DataFrame:
     if question_titles.exists():
         df_titles = get_what_questions_link(df_titles)
 
-        df_what['titles'] = df_what['id'].apply(
-            lambda what_id:
-            df_titles.loc[
-                df_titles['what_id'] == what_id
-            ].to_dict('records')
-        )
+        df_what['titles'] = nest_children(df_what, 'id', df_titles, 'what_id')
 
     return df_what
 
@@ -184,17 +192,13 @@ def get_what_questions_link(df_titles: pd.DataFrame) -> pd.DataFrame:
     )
 
     if question.exists(): 
+        option_groups = group_records(options, 'question_id')
         df_question['options'] = df_question['id'].apply(
             lambda question_id:
-            list(options.filter(question_id = question_id))
+            option_groups.get(question_id, [])
         )
     
-        df_titles['questions'] = df_titles['id'].apply(
-            lambda what_title_id:
-            df_question.loc[
-                df_question['what_title_id'] == what_title_id
-            ].to_dict('records')
-        )
+        df_titles['questions'] = nest_children(df_titles, 'id', df_question, 'what_title_id')
 
     return df_titles
 
@@ -225,12 +229,7 @@ def get_how_question_title(df_how: pd.DataFrame) -> pd.DataFrame:
     if question_titles.exists():
         df_titles = get_how_questions_link(df_titles)
 
-        df_how['titles'] = df_how['id'].apply(
-            lambda how_id:
-            df_titles.loc[
-                df_titles['how_id'] == how_id
-            ].to_dict('records')
-        )
+        df_how['titles'] = nest_children(df_how, 'id', df_titles, 'how_id')
 
     return df_how
 
@@ -274,21 +273,18 @@ def get_how_questions_link(df_titles: pd.DataFrame) -> pd.DataFrame:
     )
 
     if question.exists(): 
+        option_groups = group_records(options, 'question_id')
         df_question['options'] = df_question['id'].apply(
             lambda question_id:
-            list(options.filter(question_id = question_id))
+            option_groups.get(question_id, [])
         )
     
-        df_titles['questions'] = df_titles['id'].apply(
-            lambda how_title_id:
-            df_question.loc[
-                df_question['how_title_id'] == how_title_id
-            ].to_dict('records')
-        )
+        df_titles['questions'] = nest_children(df_titles, 'id', df_question, 'how_title_id')
 
     return df_titles
 
 
+@measured('pandas')
 def get_claim_info_service(df_claim: pd.DataFrame) -> pd.DataFrame:
     """
     Claim info service for linked data to a claim
@@ -315,10 +311,12 @@ def get_claim_info_service(df_claim: pd.DataFrame) -> pd.DataFrame:
         application_cause = '',
         questions = ''
     )
+    how_first = how.first()
+    how_claim_ids = set(how.values_list('claim_id', flat=True))
     df_claim['application_how'] = df_claim['id'].apply(
         lambda claim_id:
-        how.first()
-        if how.filter(claim_id = claim_id).exists()
+        how_first
+        if claim_id in how_claim_ids
         else
         ''
     )
@@ -331,10 +329,12 @@ def get_claim_info_service(df_claim: pd.DataFrame) -> pd.DataFrame:
         claim_id__in = claim_id_list
     )
 
+    what_first = what.first()
+    what_claim_ids = set(what.values_list('claim_id', flat=True))
     df_claim['application_what'] = df_claim['id'].apply(
         lambda claim_id:
-        what.first()
-        if what.filter(claim_id = claim_id).exists()
+        what_first
+        if claim_id in what_claim_ids
         else
         ''
     )
@@ -347,10 +347,12 @@ def get_claim_info_service(df_claim: pd.DataFrame) -> pd.DataFrame:
         claim_id__in = claim_id_list
     )
     
+    cause_first = cause.first()
+    cause_claim_ids = set(cause.values_list('claim_id', flat=True))
     df_claim['application_cause'] = df_claim['id'].apply(
         lambda claim_id:
-        cause.first()
-        if cause.filter(claim_id = claim_id).exists()
+        cause_first
+        if claim_id in cause_claim_ids
         else
         ''
     )
@@ -386,58 +388,56 @@ def get_claim_details(df_claim: pd.DataFrame) -> pd.DataFrame:
             
     what_questions =  get_claim_detail_what(claim_id_list, what_category)
     how_questions =  get_claim_detail_how(claim_id_list, how_category)
+
+    what_claim_ids = set(what_category.values_list('claim_id', flat=True))
+    how_claim_ids = set(how_category.values_list('claim_id', flat=True))
+    no_details = {
+        'what_questions':'',
+        'how_questions':''
+    }
+
+    if not what_questions.empty:
+        what_details = what_questions.loc[
+            what_questions['what_id'] == what_category.first()['what_id']
+        ].to_dict('records')
+
+    if not how_questions.empty:
+        how_details = how_questions.loc[
+            how_questions['how_id'] == how_category.first()['how_id']
+        ].to_dict('records')
     
     if not what_questions.empty and how_questions.empty:
         df_claim['details'] = df_claim['id'].apply(
             lambda claim_id:
             {
-                'what_questions':what_questions.loc[
-                    what_questions['what_id'] == what_category.first()['what_id']
-                ].to_dict('records'),
+                'what_questions':list(what_details),
                 'how_questions':''
             }
-            if what_category.filter(claim_id = claim_id).exists()
+            if claim_id in what_claim_ids
             else
-            {
-                'what_questions':'',
-                'how_questions':''
-            }
+            dict(no_details)
         )
     elif what_questions.empty and not how_questions.empty:
         df_claim['details'] = df_claim['id'].apply(
             lambda claim_id:
             {
                 'what_questions':'',
-                'how_questions':how_questions.loc[
-                    how_questions['how_id'] == how_category.first()['how_id']
-                ].to_dict('records')
+                'how_questions':list(how_details)
             }
-            if how_category.filter(claim_id = claim_id).exists()
+            if claim_id in how_claim_ids
             else
-            {
-                'what_questions':'',
-                'how_questions':''
-            }
+            dict(no_details)
         )
     elif not what_questions.empty and not how_questions.empty:    
         df_claim['details'] = df_claim['id'].apply(
             lambda claim_id:
             {
-                'what_questions':what_questions.loc[
-                    what_questions['what_id'] == what_category.first()['what_id']
-                ].to_dict('records'),
-
-                'how_questions':how_questions.loc[
-                    how_questions['how_id'] == how_category.first()['how_id']
-                ].to_dict('records')
+                'what_questions':list(what_details),
+                'how_questions':list(how_details)
             }
-            if how_category.filter(claim_id = claim_id).exists() and \
-                what_category.filter(claim_id = claim_id).exists()
+            if claim_id in how_claim_ids and claim_id in what_claim_ids
             else
-            {
-                'what_questions':'',
-                'how_questions':''
-            }
+            dict(no_details)
         )
     return df_claim
 
@@ -521,11 +521,8 @@ def get_claim_detail_what(claim_id_list, what_category) -> pd.DataFrame:
                     ,axis=1   
                 )
 
-                df_what_titles['questions'] = df_what_titles['id'].apply(
-                    lambda title_id:
-                    df_questions.loc[
-                        df_questions['what_title_id'] == title_id
-                    ].to_dict('records')
+                df_what_titles['questions'] = nest_children(
+                    df_what_titles, 'id', df_questions, 'what_title_id'
                 )
 
             what_questions = df_what_titles
@@ -613,11 +610,8 @@ def get_claim_detail_how(claim_id_list, how_category) -> pd.DataFrame:
                     ,axis=1   
                 )
                     
-                df_how_titles['questions'] = df_how_titles['id'].apply(
-                    lambda title_id:
-                    df_questions.loc[
-                        df_questions['how_title_id'] == title_id
-                    ].to_dict('records')
+                df_how_titles['questions'] = nest_children(
+                    df_how_titles, 'id', df_questions, 'how_title_id'
                 )
 
             how_questions = df_how_titles
@@ -657,7 +651,7 @@ def assign_how_question(row, how_options, how_answers):
     if how_answers.exists():
         answer_list = list(how_answers.values('id', 'answer'))
         if row['question_type'] == 'file':
-            answer_list[0]['answer'] = open_s3_file(answer_list[0]['answer'])
+            answer_list[0]['answer'] = presign_file_url(answer_list[0]['answer'])
         elif row['question_type'] == 'date':
             answer_list[0]['answer'] = str(answer_list[0]['answer']).replace('T', ' ')
         row['answer'] = answer_list
@@ -696,7 +690,7 @@ def assign_what_question(row, what_options, what_answers):
     if what_answers.exists():
         answer_list = list(what_answers.values('id', 'answer'))
         if row['question_type'] == 'file':
-            answer_list[0]['answer'] = open_s3_file(answer_list[0]['answer'])
+            answer_list[0]['answer'] = presign_file_url(answer_list[0]['answer'])
         elif row['question_type'] == 'date':
             answer_list[0]['answer'] = str(answer_list[0]['answer']).replace('T', ' ')
         row['answer'] = answer_list
@@ -732,19 +726,15 @@ def get_claim_notes(df_claim: pd.DataFrame) -> pd.DataFrame:
     )
 
     if not df_assessment_note.empty:
-        df_assessment_note['file'] = df_assessment_note['file'].apply(
-            lambda file: open_s3_file(file)
-        )
-        df_claim['notes'] = df_claim['id'].apply(
-            lambda claim_id:
-            df_assessment_note.loc[
-                df_assessment_note['claim_id'] == claim_id
-            ].to_dict('records')
+        df_assessment_note['file'] = presign_file_urls(
+            df_assessment_note['file'].values.tolist()
         )
+        df_claim['notes'] = nest_children(df_claim, 'id', df_assessment_note, 'claim_id')
 
     return df_claim
 
 
+@measured('pandas')
 def get_preview_report_info(df_application: pd.DataFrame) -> pd.DataFrame:
     """
     Preview data for application claims and their info
@@ -782,11 +772,8 @@ def get_preview_report_info(df_application: pd.DataFrame) -> pd.DataFrame:
     )
 
     if assessment.exists():
-        df_application['assessment'] = df_application['id'].apply(
-            lambda application_id:
-            df_assessment.loc[
-                df_assessment['application_id'] == application_id
-            ].to_dict('records')
+        df_application['assessment'] = nest_children(
+            df_application, 'id', df_assessment, 'application_id'
         )
     
     claims = Claim.objects.values(
@@ -801,15 +788,73 @@ def get_preview_report_info(df_application: pd.DataFrame) -> pd.DataFrame:
     df_claims = pd.DataFrame(claims)
     df_claims = get_claim_info_service(df_claims)
     if not df_claims.empty:
-        df_application['claims'] = df_application['id'].apply(
-            lambda application_id:
-            df_claims.loc[
-                df_claims['application_id'] == application_id
-            ].to_dict('records')
+        df_application['claims'] = nest_children(
+            df_application, 'id', df_claims, 'application_id'
         )
     return df_application
 
 
+def get_application_report(application_id: int):
+    """
+    Report data of an application with its assessment, claims and notes
+
+    Args:
+        application_id (int): application id
+
+    Returns:
+        dict: report data as the api returns it, or None when the application
+        does not exist
+    """
+    application = Application.objects.filter(id=application_id)
+    if not application.exists():
+        return None
+
+    app_serializer = ApplicationClaimModelSerializer(instance=application, many=True)
+    df_application = pd.DataFrame(app_serializer.data)
+    df_application = get_preview_report_info(df_application)
+    report = df_application.to_dict('records')[0]
+
+    return json.loads(ORJSONRenderer().render(report))
+
+
+def filter_report_applications(filters: dict) -> list:
+    """
+    Claim applications of a bulk report export
+
+    Args:
+        filters (dict): application_ids or optional insurer_id, status,
+        date_from and date_to of the date created
+
+    Returns:
+        list: application ids in ascending order
+    """
+    applications = Application.objects.filter(
+        id__in=Claim.objects.values('application_id')
+    )
+
+    application_ids = filters.get('application_ids')
+    if application_ids:
+        applications = applications.filter(id__in=application_ids)
+
+    insurer_id = filters.get('insurer_id')
+    if insurer_id:
+        applications = applications.filter(client__insurer_id=insurer_id)
+
+    application_status = filters.get('status')
+    if application_status:
+        applications = applications.filter(application_status__name=application_status)
+
+    date_from = filters.get('date_from')
+    if date_from:
+        applications = applications.filter(date_created__date__gte=date_from)
+
+    date_to = filters.get('date_to')
+    if date_to:
+        applications = applications.filter(date_created__date__lte=date_to)
+
+    return list(applications.order_by('id').values_list('id', flat=True))
+
+
 def get_claim_categories(df_claim: pd.DataFrame):
     """
     Get categories selected for the claim
@@ -830,45 +875,203 @@ def get_claim_categories(df_claim: pd.DataFrame):
         claim_id = claim_id
     )
     
-    causes = CauseCategory.objects.filter(
-        application_type_id = application_type_id
+    cause_data = claim_taxonomy_cache.get_or_build(
+        ('cause_categories', application_type_id),
+        lambda: list(CauseCategoryModelSerializer(
+            CauseCategory.objects.filter(application_type_id = application_type_id),
+            many=True
+        ).data)
     )
-    cause_serializer = CauseCategoryModelSerializer(causes, many=True)
     
     if not cause.exists():
-        df_cause = pd.DataFrame(cause_serializer.data)
-        df_cause_ids = df_cause['id'].values.tolist()
-        what_categories = WhatCategory.objects.filter(
-            cause_id__in = df_cause_ids
-        )
-        what_seriaizer = WhatCategoryModelSerializer(what_categories, many=True)
+        df_cause = pd.DataFrame(cause_data)
+        cause_ids = tuple(df_cause['id'].values.tolist())
+    else:
+        cause_ids = (cause.first()['cause_id'],)
 
-        how_categories = HowCategory.objects.filter(
-            cause_id__in = df_cause_ids
-        )
+    sub_categories = claim_taxonomy_cache.get_or_build(
+        ('cause_sub_categories', cause_ids),
+        lambda: get_cause_sub_categories(cause_ids)
+    )
+
+    categories = {
+        'cause_categories': cause_data,
+        'what_categories': sub_categories['what_categories'],
+        'how_categories': sub_categories['how_categories']
+    }
+    return categories
+
+
+def get_cause_sub_categories(cause_ids: tuple) -> dict:
+    """
+    What and how categories of the cause categories
 
-        how_serializer = HowCategoryModelSerializer(how_categories, many=True)
-        categories = {
-            'cause_categories': cause_serializer.data,
-            'what_categories': what_seriaizer.data,
-            'how_categories': how_serializer.data
-        }
-        return categories
+    Args:
+        cause_ids (tuple): cause category ids
 
+    Returns:
+        dict: what and how categories
+    """
     what_categories = WhatCategory.objects.filter(
-        cause_id = cause.first()['cause_id']
+        cause_id__in = cause_ids
     )
     what_seriaizer = WhatCategoryModelSerializer(what_categories, many=True)
 
     how_categories = HowCategory.objects.filter(
-        cause_id = cause.first()['cause_id']
+        cause_id__in = cause_ids
     )
-
     how_serializer = HowCategoryModelSerializer(how_categories, many=True)
 
-    categories = {
-        'cause_categories': cause_serializer.data,
-        'what_categories': what_seriaizer.data,
-        'how_categories': how_serializer.data
+    return {
+        'what_categories': list(what_seriaizer.data),
+        'how_categories': list(how_serializer.data)
     }
-    return categories
+
+
+def get_all_claim_categories() -> dict:
+    """
+    All claim categories and application types
+
+    Returns:
+        dict: how, what and cause categories and the application types
+    """
+    how_serializer = HowCategoryModelSerializer(HowCategory.objects.all(), many=True)
+    what_serializer = WhatCategoryModelSerializer(WhatCategory.objects.all(), many=True)
+    cause_serializer = CauseCategoryModelSerializer(CauseCategory.objects.all(), many=True)
+    type_serializer = ApplicationTypeModelSerializer(ApplicationType.objects.all(), many=True)
+
+    return {
+        'how_categories': list(how_serializer.data),
+        'what_categories': list(what_serializer.data),
+        'cause_categories': list(cause_serializer.data),
+        'application_types': list(type_serializer.data)
+    }
+
+
+def get_application_type_categories(application_type_id: int):
+    """
+    Category tree with questions for an application type
+
+    Args:
+        application_type_id (int): application type id
+
+    Returns:
+        dict: application type with its categories or None when it does not exist
+    """
+    application_type = ApplicationType.objects.filter(id=application_type_id).values(
+        'id',
+        'name'
+    )
+
+    if not application_type.exists():
+        return None
+
+    df_types = pd.DataFrame(application_type)
+    return application_link_data(df_types).to_dict('records')[0]
+
+
+CATEGORY_QUESTION_MODELS = {
+    'how': {
+        'category': HowCategory,
+        'title': (HowQuestionTitle, HowQuestionTitleModelSerializer, 'how_id'),
+        'question': (HowQuestion, HowQuestionModelSerializer, 'how_title_id'),
+        'option': (HowQuestionOption, HowQuestionOptionModelSerializer),
+        'answer': (HowQuestionAnswer, HowQuestionAnswerModelSerializer)
+    },
+    'what': {
+        'category': WhatCategory,
+        'title': (WhatQuestionTitle, WhatQuestionTitleModelSerializer, 'what_id'),
+        'question': (WhatQuestion, WhatQuestionModelSerializer, 'what_title_id'),
+        'option': (WhatQuestionOption, WhatQuestionOptionModelSerializer),
+        'answer': (WhatQuestionAnswer, WhatQuestionAnswerModelSerializer)
+    }
+}
+
+
+def get_category_question_catalog(category_type: str, category_id: int):
+    """
+    Titles, questions and options of a how or what category without answers
+
+    Args:
+        category_type (str): 'how' or 'what'
+        category_id (int): how or what category id
+
+    Returns:
+        dict: category name, title records and question records with options,
+        or None when the category does not exist
+    """
+    models = CATEGORY_QUESTION_MODELS[category_type]
+    category = models['category'].objects.filter(id=category_id).values('name').first()
+
+    if category is None:
+        return None
+
+    title_model, title_serializer, category_key = models['title']
+    question_titles = title_model.objects.filter(**{category_key: category_id})
+    df_titles = pd.DataFrame(title_serializer(question_titles, many=True).data)
+    questions = []
+
+    if not df_titles.empty:
+        question_model, question_serializer, title_key = models['question']
+        question_list = question_model.objects.filter(
+            **{f'{title_key}__in': df_titles['id'].values.tolist()}
+        )
+        df_questions = pd.DataFrame(question_serializer(question_list, many=True).data)
+
+        if not df_questions.empty:
+            option_model, option_serializer = models['option']
+            options = option_model.objects.filter(
+                question_id__in=df_questions['id'].values.tolist()
+            )
+            df_options = pd.DataFrame(option_serializer(options, many=True).data)
+
+            if not df_options.empty:
+                df_questions['options'] = nest_children(
+                    df_questions, 'id', df_options, 'question_id'
+                )
+
+            questions = df_questions.to_dict('records')
+
+    return {
+        'name': category['name'],
+        'titles': df_titles.to_dict('records'),
+        'questions': questions
+    }
+
+
+def link_category_answers(category_type: str, catalog: dict) -> list:
+    """
+    Merge the current answers onto a cached category question catalog
+
+    Args:
+        category_type (str): 'how' or 'what'
+        catalog (dict): catalog from get_category_question_catalog
+
+    Returns:
+        list: titles with their questions, options and answers
+    """
+    titles = catalog['titles']
+    questions = catalog['questions']
+
+    if not questions:
+        return titles
+
+    answer_model, answer_serializer = CATEGORY_QUESTION_MODELS[category_type]['answer']
+    answers = answer_model.objects.filter(
+        question_id__in=[question['id'] for question in questions]
+    )
+    df_answers = pd.DataFrame(answer_serializer(answers, many=True).data)
+
+    if not df_answers.empty:
+        answer_groups = group_records(df_answers.to_dict('records'), 'question_id')
+        questions = [
+            {**question, 'answers': list(answer_groups.get(question['id'], []))}
+            for question in questions
+        ]
+
+    title_key = CATEGORY_QUESTION_MODELS[category_type]['question'][2]
+    question_groups = group_records(questions, title_key)
+    return [
+        {**title, 'questions': list(question_groups.get(title['id'], []))}
+        for title in titles
+    ]
@@ -1,4 +1,271 @@
 """
 Claims api test cases.
 """
-from django.test import TestCase
+from datetime import datetime
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.timezone import make_aware
+from rest_framework.test import APIClient
+import system_management.constants as constants
+from system_management.models import User, UserType
+from application.models import (
+    Application,
+    ApplicationStatus,
+    ApplicationType,
+    Assessment,
+    BackgroundJob,
+    Client,
+    InsuranceProvider
+)
+from application.benchmark import local_integrations, seed_benchmark_data
+from application.jobs import claim_next_job, enqueue_job, run_job
+from claims.models import Claim
+from claims.reports import report_content_hash
+from claims.tasks import RENDER_CLAIM_REPORT
+
+
+class GetAllClaimsApiTestCase(TestCase):
+    """
+    Query count of the claim listing does not grow with the number of claims.
+    """
+
+    def setUp(self):
+        user_type = UserType.objects.create(name=constants.ASSESSOR)
+        self.user = User.objects.create_user(
+            email='assessor@example.com',
+            first_name='Test',
+            last_name='Assessor',
+            user_type=user_type,
+            password='password'
+        )
+        self.status = ApplicationStatus.objects.create(name='Pending')
+        self.application_type = ApplicationType.objects.create(name='Personal')
+        self.insurer = InsuranceProvider.objects.create(
+            insurance_name='Insurer',
+            contact_no='0000000000',
+            email='insurer@example.com'
+        )
+        self.api_client = APIClient()
+        self.api_client.force_authenticate(user=self.user)
+
+    def create_claims(self, number):
+        """
+        Create claim applications with a client, assessor and assessment.
+        """
+        for index in range(number):
+            client = Client.objects.create(
+                first_name=f'Client {index}',
+                last_name='Test',
+                email=f'client{index}@example.com',
+                id_number='0000000000000',
+                phone_number='0000000000',
+                policy_no=f'POL{index}',
+                insurer=self.insurer
+            )
+            application = Application.objects.create(
+                assessor=self.user,
+                user=self.user,
+                application_status=self.status,
+                client=client,
+                date_assigned=make_aware(datetime.now())
+            )
+            Claim.objects.create(
+                application_type=self.application_type,
+                application=application
+            )
+            if index % 2 == 0:
+                Assessment.objects.create(
+                    application=application,
+                    scheduled_date_time=make_aware(datetime.now()),
+                    end_date_time=make_aware(datetime.now()),
+                    event_id=f'event{index}',
+                    summary=f'Assessment {index}'
+                )
+
+    def count_listing_queries(self):
+        """
+        Request the claim listing and return the number of queries it ran.
+        """
+        with CaptureQueriesContext(connection) as context:
+            response = self.api_client.get(reverse('get_all_claims_api'))
+
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries), response.data['data']
+
+    def test_query_count_is_constant(self):
+        self.create_claims(2)
+        small_count, small_data = self.count_listing_queries()
+
+        self.create_claims(10)
+        large_count, large_data = self.count_listing_queries()
+
+        self.assertEqual(len(small_data), 2)
+        self.assertEqual(len(large_data), 12)
+        self.assertEqual(small_count, large_count)
+
+    def test_listing_fields(self):
+        self.create_claims(2)
+        _, data = self.count_listing_queries()
+
+        scheduled = [row for row in data if row['assessment']]
+        self.assertEqual(len(scheduled), 1)
+        self.assertEqual(data[0]['application_status__name'], 'Pending')
+        self.assertEqual(data[0]['assessor_id__first_name'], 'Test')
+        self.assertEqual(data[0]['client']['insurer']['insurance_name'], 'Insurer')
+
+
+class ReportContentHashTestCase(SimpleTestCase):
+    """
+    Versions of the report data the stored reports are kept by.
+    """
+
+    def report(self, answer='Yes', signature='abc'):
+        return {
+            'id': 1,
+            'claims': [{
+                'id': 2,
+                'notes': [{
+                    'note': 'Damage',
+                    'file': f'https://bucket.s3.amazonaws.com/note.png?X-Amz-Signature={signature}'
+                }],
+                'details': {'how_questions': [{'answer': [{'answer': answer}]}]}
+            }]
+        }
+
+    def test_signature_is_ignored(self):
+        self.assertEqual(
+            report_content_hash(self.report(signature='abc')),
+            report_content_hash(self.report(signature='def'))
+        )
+
+    def test_changed_answer_changes_hash(self):
+        self.assertNotEqual(
+            report_content_hash(self.report(answer='Yes')),
+            report_content_hash(self.report(answer='No'))
+        )
+
+
+class ExportReportsApiTestCase(TestCase):
+    """
+    Applications selected by a bulk report export.
+    """
+
+    def setUp(self):
+        user_type = UserType.objects.create(name=constants.ASSESSOR)
+        self.user = User.objects.create_user(
+            email='assessor@example.com',
+            first_name='Test',
+            last_name='Assessor',
+            user_type=user_type,
+            password='password'
+        )
+        self.status = ApplicationStatus.objects.create(name='Pending')
+        self.application_type = ApplicationType.objects.create(name='Personal')
+        self.api_client = APIClient()
+        self.api_client.force_authenticate(user=self.user)
+
+    def create_application(self, insurer):
+        """
+        Create a claim application of a client of the insurer.
+        """
+        client = Client.objects.create(
+            first_name='Client',
+            last_name='Test',
+            email='client@example.com',
+            id_number='0000000000000',
+            phone_number='0000000000',
+            policy_no='POL',
+            insurer=insurer
+        )
+        application = Application.objects.create(
+            assessor=self.user,
+            user=self.user,
+            application_status=self.status,
+            client=client
+        )
+        Claim.objects.create(
+            application_type=self.application_type,
+            application=application
+        )
+        return application
+
+    def create_insurer(self, name):
+        """
+        Create an insurance provider.
+        """
+        return InsuranceProvider.objects.create(
+            insurance_name=name,
+            contact_no='0000000000',
+            email=f'{name}@example.com'
+        )
+
+    def test_export_is_queued_for_the_insurer(self):
+        insurer = self.create_insurer('insurer')
+        applications = [self.create_application(insurer) for _ in range(2)]
+        self.create_application(self.create_insurer('other'))
+
+        response = self.api_client.post(
+            reverse('export_reports_api'),
+            {'insurer_id': insurer.id},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, 202)
+        job = BackgroundJob.objects.get(id=response.data['data']['id'])
+        self.assertEqual(job.payload['export_format'], 'zip')
+        self.assertEqual(
+            job.payload['application_ids'],
+            [application.id for application in applications]
+        )
+
+    def test_export_status_is_private(self):
+        insurer = self.create_insurer('insurer')
+        self.create_application(insurer)
+        response = self.api_client.post(
+            reverse('export_reports_api'),
+            {'insurer_id': insurer.id},
+            format='json'
+        )
+        job_id = response.data['data']['id']
+        other_client = APIClient()
+        other_client.force_authenticate(user=User.objects.create_user(
+            email='other@example.com',
+            first_name='Other',
+            last_name='Assessor',
+            user_type=self.user.user_type,
+            password='password'
+        ))
+
+        own = self.api_client.get(reverse('get_job_status_api'), {'job_id': job_id})
+        other = other_client.get(reverse('get_job_status_api'), {'job_id': job_id})
+
+        self.assertEqual(own.status_code, 200)
+        self.assertEqual(own.data['data']['user'], self.user.id)
+        self.assertEqual(other.status_code, 404)
+
+    def test_filter_is_required(self):
+        response = self.api_client.post(reverse('export_reports_api'), {}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(BackgroundJob.objects.exists())
+
+
+class RenderReportJobTestCase(TestCase):
+    """
+    A report job only renders the version of the data it was queued for.
+    """
+
+    def test_changed_claim_is_not_rendered(self):
+        application_id = seed_benchmark_data(4, seed=1)['claim_application_id']
+        enqueue_job(
+            RENDER_CLAIM_REPORT,
+            {'application_id': application_id, 'content_hash': 'queued version'}
+        )
+
+        with local_integrations():
+            job = run_job(claim_next_job())
+
+        self.assertEqual(job.status, BackgroundJob.FAILED)
+        self.assertIn('The claim changed', job.last_error)
@@ -25,6 +25,7 @@ urlpatterns = [
          name="get_claim_categories_api"),
 
     path('get_all_claims_api/', views.get_all_claims_api, name="get_all_claims_api"),
+    path('get_claims_count_api/', views.get_claims_count_api, name="get_claims_count_api"),
 
     path('get_all_assessors_api/', views.get_all_assessors_api,
          name="get_all_assessors_api"),
@@ -83,6 +84,8 @@ urlpatterns = [
 
 
     path('generate_report_claim_api/', views.generate_report_claim_api, name="generate_report_claim_api"),
+    path('claim_report_api/', views.claim_report_api, name="claim_report_api"),
+    path('export_reports_api/', views.export_reports_api, name="export_reports_api"),
     path('preview_report_claim_api/', views.preview_report_claim_api, name="preview_report_claim_api"),
     path('get_claim_info_api/', views.get_claim_info_api, name="get_claim_info_api"),
     path('create_sub_claim_api/', views.create_sub_claim_api, name="create_sub_claim_api"),
@@ -3,9 +3,13 @@ Claim api views containing all the api functions
 The following api is stored here:
 
 """
+from __future__ import annotations
 import json
-import pandas as pd
+import uuid
+from application.lazy import lazy_module
 from datetime import datetime
+from django.conf import settings
+from django.db import transaction
 from django.utils.timezone import make_aware
 from rest_framework.response import Response
 from rest_framework import status
@@ -87,7 +91,22 @@ from claims.api.serializers import (
     GenerateReportClaimSerializer,
     ApplicationClaimModelSerializer,
     ClaimModelSerializer,
-    ClaimApplicationSerializer
+    ClaimApplicationSerializer,
+    ExportReportsSerializer
+)
+from application.api.serializers import (
+    ApplicationListingSerializer,
+    BackgroundJobModelSerializer
+)
+from application.cache import invalidates
+from application.jobs import enqueue_job
+from application.metrics import query_budget
+from application.api.services import (
+    filter_listing_applications,
+    paginate_applications,
+    count_applications_by_status,
+    nest_children,
+    save_question_answers
 )
 
 from application.models import (
@@ -96,14 +115,26 @@ from application.models import (
     Business,
     Application,
     ApplicationType,
-    ApplicationStatus
+    ApplicationStatus,
+    BackgroundJob
 )
 from claims.api.services import (
-    application_link_data,
+    claim_taxonomy_cache,
+    get_all_claim_categories,
+    get_application_type_categories,
+    get_category_question_catalog,
+    link_category_answers,
     get_claim_info_service,
     get_preview_report_info,
+    get_application_report,
+    filter_report_applications,
     get_claim_categories
 )
+from claims.reports import report_content_hash
+from claims.tasks import EXPORT_CLAIM_REPORTS, RENDER_CLAIM_REPORT, claim_report_key
+
+
+pd = lazy_module('pandas')
 
 
 @api_view(['GET'])
@@ -121,10 +152,10 @@ def get_claim_application_api(request):
         serializer = ClaimApplicationSerializer(data=body)
 
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -132,10 +163,10 @@ def get_claim_application_api(request):
 
         claim = Claim.objects.filter(id=claim_id)
         if not claim.exists():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': f"Claim with id: {claim_id} does not exist"
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         claim_serializer = ClaimModelSerializer(claim, many=True)
@@ -150,13 +181,13 @@ def get_claim_application_api(request):
 
         type_serializer = ApplicationTypeModelSerializer(application_types, many=True)
 
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': f"Claim data send for claim with id: {claim_id}",
             'data': df_claim.to_dict('records')[0],
             'application_types': type_serializer.data,
             'categories': categories
-        })
+        }
 
         return Response(response_data, status=status.HTTP_200_OK)
 
@@ -175,10 +206,10 @@ def manage_application_api(request):
         body = json.loads(request.body)
         serializer = ManageApplicationSerializer(data=body)
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -188,10 +219,10 @@ def manage_application_api(request):
             application = Application.objects.get(id=application_id)
 
         except Application.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': f"Application with id: {application_id} does not exist"
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         serializer = ApplicationClaimModelSerializer(application)
@@ -205,11 +236,11 @@ def manage_application_api(request):
             "claims": claim_serializer.data
         }
 
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': f"Application data send for application with id: {application_id}",
             'data': data
-        })
+        }
         return Response(response_data, status=status.HTTP_200_OK)
 
 
@@ -224,39 +255,36 @@ def application_type_categories_api(request):
         serializer = ApplicationTypeCategoriesSerializer(data=body)
 
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
         application_type = validated_data.get('application_type')
 
-        application_type = ApplicationType.objects.filter(id=application_type).values(
-            'id',
-            'name'
+        application_type_data = claim_taxonomy_cache.get_or_build(
+            ('application_type_categories', application_type),
+            lambda: get_application_type_categories(application_type)
         )
 
-        if not application_type.exists():
-            data = json.dumps({
+        if application_type_data is None:
+            data = {
                 "status": "error",
                 "message": f"Application type with id: {application_type} not found"
-            })
+            }
             return Response(data=data, status=status.HTTP_404_NOT_FOUND)
 
-        df_types = pd.DataFrame(application_type)
-        application_type_data = application_link_data(df_types)
-
         data = {
-            'claim_info': application_type_data.to_dict('records')[0]
+            'claim_info': application_type_data
         }
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "Retrieve application categories successful.",
             "data": data
-        })
+        }
 
         return Response(data=data, status=status.HTTP_200_OK)
 
@@ -295,11 +323,11 @@ def get_claim_info_api(request):
             'application_types': type_serializer.data
         }
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "Retrieve application categories successful.",
             "data": data,
-        })
+        }
 
         return Response(data=data, status=status.HTTP_200_OK)
 
@@ -319,10 +347,10 @@ def create_sub_claim_api(request):
         serializer = ChangeApplicationTypeSerializer(data=body)
 
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -333,20 +361,20 @@ def create_sub_claim_api(request):
             application = Application.objects.get(id=application_id)
 
         except Application.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': f"Application with id: {application_id} does not exist"
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         try:
             application_type = ApplicationType.objects.get(id=application_type_id)
 
         except ApplicationType.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': f"Application type with id: {application_type_id} does not exist"
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         claim = Claim.objects.create(
@@ -380,11 +408,11 @@ def create_sub_claim_api(request):
             'application_types': type_serializer.data
         }
 
-        response_data = json.dumps({
+        response_data = {
             "status": "success",
             "message": "Sub claim created successfully.",
             "data": data,
-        })
+        }
 
         return Response(data=response_data, status=status.HTTP_200_OK)
 
@@ -405,10 +433,10 @@ def add_claim_client_api(request):
         incident_date = body.get('incident_date')
 
         if incident_date is None:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Incident date is required."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         incident_date = make_aware(datetime.strptime(incident_date, '%Y-%m-%dT%H:%M'))
@@ -451,25 +479,25 @@ def add_claim_client_api(request):
                 client_id=client_id
             )
 
-            data = json.dumps({
+            data = {
                 "status": "success",
                 "message": "Client information added successfully.",
                 "data": client_id
-            })
+            }
             return Response(data=data, status=status.HTTP_200_OK)
 
         else:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
@@ -505,28 +533,29 @@ def add_claim_business_api(request):
                 phone_no=business_phone_number
             )
 
-            data = json.dumps({
+            data = {
                 "status": "success",
                 "message": "Client information added successfully."
-            })
+            }
             return Response(data=data, status=status.HTTP_200_OK)
 
         else:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": str(business_serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def add_what_category_api(request):
     """
     Add what category api.
@@ -541,10 +570,10 @@ def add_what_category_api(request):
         body = json.loads(request.body)
         serializer = AddWhatCategorySerializer(data=body)
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -555,10 +584,10 @@ def add_what_category_api(request):
             cause_object = CauseCategory.objects.get(id=cause_id)
 
         except CauseCategory.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Cause id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         WhatCategory.objects.create(
@@ -569,23 +598,24 @@ def add_what_category_api(request):
         what_objects = WhatCategory.objects.filter(cause_id=cause_id)
         serializer = WhatCategoryModelSerializer(what_objects, many=True)
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "What category added successfully.",
             "data": serializer.data
-        })
+        }
 
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def edit_what_category_api(request):
     """
     Edit what category api.
@@ -601,10 +631,10 @@ def edit_what_category_api(request):
         serializer = EditWhatCategorySerializer(data=body)
 
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -617,20 +647,20 @@ def edit_what_category_api(request):
             what_object = WhatCategory.objects.get(id=what_id)
 
         except WhatCategory.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "What id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         try:
             cause_object = CauseCategory.objects.get(id=cause_id)
 
         except CauseCategory.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Cause id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         what_object.name = category
@@ -640,23 +670,24 @@ def edit_what_category_api(request):
         what_objects = WhatCategory.objects.filter(cause_id=cause_id)
         serializer = WhatCategoryModelSerializer(what_objects, many=True)
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "What category edited successfully.",
             "data": serializer.data
-        })
+        }
 
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def del_what_category_api(request):
     """
     Delete what category api.
@@ -672,20 +703,20 @@ def del_what_category_api(request):
         what_id = body.get('what_id')
 
         if what_id is None:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "What id is required."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         try:
             what_object = WhatCategory.objects.get(id=what_id)
 
         except WhatCategory.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "What id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         cause_id = what_object.cause_id
@@ -694,23 +725,24 @@ def del_what_category_api(request):
         what_objects = WhatCategory.objects.filter(cause_id=cause_id)
         serializer = WhatCategoryModelSerializer(what_objects, many=True)
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "What category deleted successfully.",
             "data": serializer.data
-        })
+        }
 
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def add_how_category_api(request):
     """
     Add how category api.
@@ -725,10 +757,10 @@ def add_how_category_api(request):
         body = json.loads(request.body)
         serializer = AddHowCategorySerializer(data=body)
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -739,10 +771,10 @@ def add_how_category_api(request):
             cause_object = CauseCategory.objects.get(id=cause_id)
 
         except CauseCategory.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Cause id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         HowCategory.objects.create(
@@ -753,22 +785,23 @@ def add_how_category_api(request):
         how_objects = HowCategory.objects.filter(cause_id=cause_object.id)
         serializer = HowCategoryModelSerializer(how_objects, many=True)
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "'How' category added successfully.",
             "data": serializer.data
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def edit_how_category_api(request):
     """
     Edit how category api.
@@ -784,10 +817,10 @@ def edit_how_category_api(request):
         serializer = EditHowCategorySerializer(data=body)
 
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -799,20 +832,20 @@ def edit_how_category_api(request):
             how_object = HowCategory.objects.get(id=how_id)
 
         except HowCategory.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "How id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         try:
             cause_object = CauseCategory.objects.get(id=cause_id)
 
         except CauseCategory.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Cause id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         how_object.name = category
@@ -822,22 +855,23 @@ def edit_how_category_api(request):
         how_objects = HowCategory.objects.filter(cause_id=cause_object.id)
         serializer = HowCategoryModelSerializer(how_objects, many=True)
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "How category edited successfully.",
             "data": serializer.data
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def del_how_category_api(request):
     """
     Delete how category api.
@@ -853,20 +887,20 @@ def del_how_category_api(request):
         how_id = body.get('how_id')
 
         if how_id is None:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "How id is required."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         try:
             how_object = HowCategory.objects.get(id=how_id)
 
         except HowCategory.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "How id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         cause_id = how_object.cause_id
@@ -875,23 +909,24 @@ def del_how_category_api(request):
         how_objects = HowCategory.objects.filter(cause_id=cause_id)
         serializer = HowCategoryModelSerializer(how_objects, many=True)
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "How category deleted successfully.",
             "data": serializer.data
-        })
+        }
 
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def add_cause_category_api(request):
     """
     Add cause category api.
@@ -906,10 +941,10 @@ def add_cause_category_api(request):
         body = json.loads(request.body)
         serializer = AddCauseCategorySerializer(data=body)
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -917,20 +952,20 @@ def add_cause_category_api(request):
         application_type = validated_data.get('application_type')
 
         if CauseCategory.objects.filter(application_type=application_type).exists():
-            data = json.dumps({
+            data = {
                 'status': "error",
                 'message': f"Cause category with name {category} already exists."
-            })
+            }
             return Response(data, status.HTTP_400_BAD_REQUEST)
 
         try:
             application_type_obj = ApplicationType.objects.get(id=application_type)
 
         except ApplicationType.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": f"Application type with id: {application_type} not found",
-            })
+            }
             return Response(data=data, status=status.HTTP_404_NOT_FOUND)
 
         CauseCategory.objects.create(
@@ -943,22 +978,23 @@ def add_cause_category_api(request):
         )
         serializer = CauseCategoryModelSerializer(cause_objects, many=True)
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "'Cause' category added successfully.",
             "data": serializer.data
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def edit_cause_category_api(request):
     """
     Edit cause category api.
@@ -974,10 +1010,10 @@ def edit_cause_category_api(request):
         serializer = EditCauseCategorySerializer(data=body)
 
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -988,10 +1024,10 @@ def edit_cause_category_api(request):
             cause_object = CauseCategory.objects.get(id=cause_id)
 
         except CauseCategory.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Cause id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         cause_object.name = category
@@ -1000,22 +1036,23 @@ def edit_cause_category_api(request):
         cause_objects = CauseCategory.objects.all()
         serializer = CauseCategoryModelSerializer(cause_objects, many=True)
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "Cause category edited successfully.",
             "data": serializer.data
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def del_cause_category_api(request):
     """
     Delete cause category api.
@@ -1031,20 +1068,20 @@ def del_cause_category_api(request):
         cause_id = body.get('cause_id')
 
         if cause_id is None:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Cause id is required."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         try:
             cause_object = CauseCategory.objects.get(id=cause_id)
 
         except CauseCategory.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Cause id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         cause_object.delete()
@@ -1052,19 +1089,19 @@ def del_cause_category_api(request):
         cause_objects = CauseCategory.objects.all()
         serializer = CauseCategoryModelSerializer(cause_objects, many=True)
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "Cause category deleted successfully.",
             "data": serializer.data
-        })
+        }
 
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
@@ -1093,16 +1130,16 @@ def edit_client_application_api(request):
                                                        id_number=id_number,
                                                        phone_number=phone_number
                                                        )
-            response_data = json.dumps({
+            response_data = {
                 "status": "success",
                 "message": "Client application edited successfully."
-            })
+            }
             return Response(data=response_data, status=status.HTTP_201_CREATED)
         else:
-            response_data = json.dumps({
+            response_data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -1132,16 +1169,16 @@ def edit_business_application_api(request):
                                                          phone_no=phone_no
                                                          )
 
-            response_data = json.dumps({
+            response_data = {
                 "status": "success",
                 "message": "Business application edited successfully."
-            })
+            }
             return Response(data=response_data, status=status.HTTP_201_CREATED)
         else:
-            response_data = json.dumps({
+            response_data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -1176,16 +1213,16 @@ def edit_claim_application_api(request):
 
             )
 
-            response_data = json.dumps({
+            response_data = {
                 "status": "success",
                 "message": "Claim application edited successfully."
-            })
+            }
             return Response(data=response_data, status=status.HTTP_201_CREATED)
         else:
-            response_data = json.dumps({
+            response_data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -1201,81 +1238,44 @@ def get_claim_categories_api(request):
         status and message stating success or error.
     """
     if request.method == "GET":
-        application_type = ApplicationType.objects.all()
-
-        try:
-            type_serializer = ApplicationTypeModelSerializer(application_type, many=True)
-
-        except KeyError:
-            data = json.dumps({
-                "status": "error",
-                "message": "Key Error during application type serializer data"
-            })
-            return Response(data=data, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        what_categories = WhatCategory.objects.all()
-
-        try:
-            what_serializer = WhatCategoryModelSerializer(what_categories, many=True)
-
-        except KeyError:
-            data = json.dumps({
-                "status": "error",
-                "message": "Error during how category serializer data"
-            })
-            return Response(data=data, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        how_categories = HowCategory.objects.all()
-
-        try:
-            how_serializer = HowCategoryModelSerializer(how_categories, many=True)
-
-        except KeyError:
-            data = json.dumps({
-                "status": "error",
-                "message": "Error during how category serializer data"
-            })
-            return Response(data=data, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        cause_categories = CauseCategory.objects.all()
-
         try:
-            cause_serializer = CauseCategoryModelSerializer(cause_categories, many=True)
+            data = claim_taxonomy_cache.get_or_build(
+                'claim_categories',
+                get_all_claim_categories
+            )
 
         except KeyError:
-            data = json.dumps({
+            data = {
                 "status": "error",
-                "message": "Error during serializer data"
-            })
+                "message": "Key Error during claim categories serializer data"
+            }
             return Response(data=data, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
         data = {
-            'how_categories': how_serializer.data,
-            'what_categories': what_serializer.data,
-            'cause_categories': cause_serializer.data,
-            'application_types': type_serializer.data
-        }
-
-        data = json.dumps({
             "status": "success",
             "message": "Claim categories retrieved successfully.",
             "data": data
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['GET'])
+@query_budget(5)
 def get_all_claims_api(request):
     """
     Get all claim applications information api
 
+    Optional filters status, assessor_id and application_type_id. When a
+    page_size is sent the applications are returned newest first one page at
+    a time with the cursor of the next page.
+
     :param request:
         Django request parameter
 
@@ -1283,19 +1283,76 @@ def get_all_claims_api(request):
         status and message stating success or error.
     """
     if request.method == "GET":
-        claims_list = Claim.objects.values_list('application_id', flat=True)
+        body = json.loads(request.body) if request.body else request.query_params.dict()
+        serializer = ApplicationListingSerializer(data=body)
+
+        if not serializer.is_valid():
+            response_data = {
+                'status': 'error',
+                'message': str(serializer.errors)
+            }
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+
+        validated_data = serializer.validated_data
+        page_size = validated_data.get('page_size')
+        next_cursor = None
 
-        claim_applications = Application.objects.filter(
-            id__in=claims_list
+        claim_applications = ApplicationClientModelSerializer.setup_eager_loading(
+            filter_listing_applications(Claim.objects.all(), validated_data)
         )
 
+        if page_size:
+            claim_applications, next_cursor = paginate_applications(
+                claim_applications,
+                validated_data.get('cursor'),
+                page_size
+            )
+
         application_model_serializer = ApplicationClientModelSerializer(claim_applications,
                                                                         many=True)
-        response_data = json.dumps({
+        response_data = {
             "status": "success",
             "message": "Claim data retrieved successfully!",
-            "data": application_model_serializer.data
-        })
+            "data": application_model_serializer.data,
+            "next_cursor": next_cursor
+        }
+
+        return Response(response_data, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@query_budget(5)
+def get_claims_count_api(request):
+    """
+    Number of claim applications per status for the tab badges
+
+    :param request:
+        Django request parameter
+
+    :return:
+        status and message stating success or error.
+    """
+    if request.method == "GET":
+        body = json.loads(request.body) if request.body else request.query_params.dict()
+        serializer = ApplicationListingSerializer(data=body)
+
+        if not serializer.is_valid():
+            response_data = {
+                'status': 'error',
+                'message': str(serializer.errors)
+            }
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+
+        claim_applications = filter_listing_applications(
+            Claim.objects.all(),
+            serializer.validated_data
+        )
+
+        response_data = {
+            "status": "success",
+            "message": "Claim counts retrieved successfully!",
+            "data": count_applications_by_status(claim_applications)
+        }
 
         return Response(response_data, status=status.HTTP_200_OK)
 
@@ -1315,11 +1372,11 @@ def get_all_assessors_api(request):
         assessors = User.objects.filter(user_type__name=constants.ASSESSOR)
         serializer = UserModelSerializer(assessors, many=True)
 
-        response_data = json.dumps({
+        response_data = {
             "status": "success",
             "message": "Assessors retrieved successfully!",
             "data": serializer.data
-        })
+        }
 
         return Response(response_data, status=status.HTTP_200_OK)
 
@@ -1341,10 +1398,10 @@ def change_application_type_api(request):
         serializer = ChangeApplicationTypeSerializer(data=body)
 
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Invalid data."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -1355,19 +1412,19 @@ def change_application_type_api(request):
             application = Application.objects.get(id=application_id)
 
         except Application.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Application id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         try:
             application_type_obj = ApplicationType.objects.get(id=application_type)
         except Application.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Application id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         ApplicationWhat.objects.filter(application_id=application_id).delete()
@@ -1377,11 +1434,11 @@ def change_application_type_api(request):
         application.application_type_id = application_type_obj.id
         application.save()
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "Application type changed successfully.",
             "data": application_type_obj.name
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
 
@@ -1402,10 +1459,10 @@ def assign_what_application_api(request):
         serializer = AssignWhatApplicationSerializer(data=body)
 
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Invalid data."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -1416,10 +1473,10 @@ def assign_what_application_api(request):
             application = Claim.objects.get(id=claim_id)
 
         except Claim.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Claim id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         try:
@@ -1427,21 +1484,16 @@ def assign_what_application_api(request):
             what_object = WhatCategory.objects.get(id=what_id)
 
         except WhatCategory.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "What category object id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
-        if not ApplicationWhat.objects.filter(claim_id=application.id).exists():
-            ApplicationWhat.objects.create(
-                claim_id=application.id,
-                what_id=what_object.id
-            )
-        else:
-            ApplicationWhat.objects.filter(claim_id=application.id).update(
-                what_id=what_object.id
-            )
+        ApplicationWhat.objects.update_or_create(
+            claim_id=application.id,
+            defaults={'what_id': what_object.id}
+        )
 
         files = WhatQuestionAnswer.objects.filter(
             question_id__has_file=True,
@@ -1469,12 +1521,12 @@ def assign_what_application_api(request):
 
         questions = df_questions.to_dict('records')
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "What category assigned to application successfully.",
             "data": what_object.name,
             'questions': questions
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
 
@@ -1495,10 +1547,10 @@ def assign_how_application_api(request):
         serializer = AssignHowApplicationSerializer(data=body)
 
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Invalid data."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -1509,10 +1561,10 @@ def assign_how_application_api(request):
             application = Claim.objects.get(id=claim_id)
 
         except Claim.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Claim id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         try:
@@ -1521,24 +1573,16 @@ def assign_how_application_api(request):
 
         except HowCategory.DoesNotExist:
 
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "How category object id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
-        if not ApplicationHow.objects.filter(claim_id=application.id).exists():
-
-            ApplicationHow.objects.create(
-                claim_id=application.id,
-                how_id=how_object.id
-            )
-
-        else:
-
-            ApplicationHow.objects.filter(claim_id=application.id).update(
-                how_id=how_object.id
-            )
+        ApplicationHow.objects.update_or_create(
+            claim_id=application.id,
+            defaults={'how_id': how_object.id}
+        )
 
         files = HowQuestionAnswer.objects.filter(
             question_id__has_file=True,
@@ -1570,12 +1614,12 @@ def assign_how_application_api(request):
 
         questions = df_questions.to_dict('records')
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "How category assigned to application successfully.",
             "data": how_object.name,
             "questions": questions
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
 
@@ -1623,10 +1667,10 @@ def assign_cause_application_api(request):
         serializer = AssignCauseApplicationSerializer(data=body)
 
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -1637,10 +1681,10 @@ def assign_cause_application_api(request):
             application = Claim.objects.get(id=claim_id)
 
         except Claim.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Claim application object does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         try:
@@ -1648,21 +1692,16 @@ def assign_cause_application_api(request):
             cause_object = CauseCategory.objects.get(id=cause_id)
 
         except CauseCategory.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Cause category object id does not exist."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
-        if not ApplicationCause.objects.filter(claim_id=application.id).exists():
-            ApplicationCause.objects.create(
-                claim_id=application.id,
-                cause_id=cause_object.id
-            )
-        else:
-            ApplicationCause.objects.filter(claim_id=application.id).update(
-                cause_id=cause_object.id
-            )
+        ApplicationCause.objects.update_or_create(
+            claim_id=application.id,
+            defaults={'cause_id': cause_object.id}
+        )
 
         ApplicationHow.objects.filter(
             claim_id=application.id
@@ -1700,15 +1739,16 @@ def assign_cause_application_api(request):
             claim_id=application.id
         ).delete()
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "Cause category assigned to application successfully.",
             "data": cause_object.name
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def create_how_title_api(request):
     """
     Create how title api.
@@ -1724,10 +1764,10 @@ def create_how_title_api(request):
         serializer = TitleAddSerializer(data=body)
 
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -1743,16 +1783,17 @@ def create_how_title_api(request):
             'title': title_object.title,
             'how_id': title_object.how_id
         }
-        response_data = json.dumps({
+        response_data = {
             "status": "success",
             "message": "How title created successfully.",
             "data": data
-        })
+        }
 
         return Response(data=response_data, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def create_what_title_api(request):
     """
     Create what title api.
@@ -1768,10 +1809,10 @@ def create_what_title_api(request):
         serializer = TitleAddSerializer(data=body)
 
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -1787,16 +1828,17 @@ def create_what_title_api(request):
             'title': title_object.title,
             'what_id': title_object.what_id
         }
-        response_data = json.dumps({
+        response_data = {
             "status": "success",
             "message": "What title created successfully.",
             "data": data
-        })
+        }
 
         return Response(data=response_data, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def create_question_how_api(request):
     """
     Create question api for how category.
@@ -1847,10 +1889,10 @@ def create_question_how_api(request):
                 has_text = True
 
             else:
-                data = json.dumps({
+                data = {
                     'status': 'error',
                     'message': 'Invalid question type'
-                })
+                }
                 return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
             question_object = HowQuestion.objects.create(
@@ -1888,18 +1930,18 @@ def create_question_how_api(request):
                 'is_mandatory': question_object.is_mandatory,
             }
 
-            data = json.dumps({
+            data = {
                 'status': 'success',
                 'message': 'Question created successfully',
                 'data': data
-            })
+            }
             return Response(data, status=status.HTTP_200_OK)
 
         else:
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(question_serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
     else:
@@ -1911,6 +1953,7 @@ def create_question_how_api(request):
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def create_question_what_api(request):
     """
     Create question api for what category.
@@ -1961,10 +2004,10 @@ def create_question_what_api(request):
                 has_text = True
 
             else:
-                data = json.dumps({
+                data = {
                     'status': 'error',
                     'message': 'Invalid question type'
-                })
+                }
                 return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
             question_object = WhatQuestion.objects.create(
@@ -2002,18 +2045,18 @@ def create_question_what_api(request):
                 'is_mandatory': question_object.is_mandatory,
             }
 
-            data = json.dumps({
+            data = {
                 'status': 'success',
                 'message': 'Question created successfully',
                 'data': data
-            })
+            }
             return Response(data, status=status.HTTP_200_OK)
 
         else:
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(question_serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
     else:
@@ -2039,85 +2082,35 @@ def how_category_questions_api(request):
         serializer = CategoryIdSerializer(data=body)
 
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(serializer.data)
-            })
+            }
             return Response(data, status=status.HTTP_200_OK)
 
         validated_data = serializer.validated_data
         category_id = validated_data.get('category_id')
 
-        try:
-            how_object = HowCategory.objects.get(id=category_id)
+        catalog = claim_taxonomy_cache.get_or_build(
+            ('category_questions', 'how', category_id),
+            lambda: get_category_question_catalog('how', category_id)
+        )
 
-        except HowCategory.DoesNotExist:
-            data = json.dumps({
+        if catalog is None:
+            data = {
                 'status': 'error',
                 'message': 'How category not found.'
-            })
+            }
             return Response(data, status=status.HTTP_404_NOT_FOUND)
 
-        question_titles = HowQuestionTitle.objects.filter(
-            how_id=category_id
-        )
-
-        title_serializer = HowQuestionTitleModelSerializer(question_titles, many=True)
-        df_titles = pd.DataFrame(title_serializer.data)
-
-        if not df_titles.empty:
-            title_ids = df_titles['id'].values.tolist()
-
-            questions = HowQuestion.objects.filter(
-                how_title_id__in=title_ids
-            )
-
-            question_serializer = HowQuestionModelSerializer(questions, many=True)
-            df_questions = pd.DataFrame(question_serializer.data)
-
-            if not df_questions.empty:
-                options = HowQuestionOption.objects.filter(
-                    question_id__in=df_questions['id'].values.tolist()
-                )
+        question_titles = link_category_answers('how', catalog)
 
-                option_serializer = HowQuestionOptionModelSerializer(options, many=True)
-                df_options = pd.DataFrame(option_serializer.data)
-
-                if not df_options.empty:
-                    df_questions['options'] = df_questions.apply(
-                        lambda series:
-                        df_options.loc[
-                            df_options['question_id'] == series['id']
-                            ].to_dict('records'), axis=1)
-
-                answer = HowQuestionAnswer.objects.filter(
-                    question_id__in=df_questions['id'].values.tolist()
-                )
-
-                answer_serializer = HowQuestionAnswerModelSerializer(answer, many=True)
-                df_answers = pd.DataFrame(answer_serializer.data)
-
-                if not df_answers.empty:
-                    df_questions['answers'] = df_questions.apply(
-                        lambda series:
-                        df_answers.loc[
-                            df_answers['question_id'] == series['id']
-                            ].to_dict('records'), axis=1)
-
-                df_titles['questions'] = df_titles.apply(
-                    lambda series:
-                    df_questions.loc[
-                        df_questions['how_title_id'] == series['id']
-                        ].to_dict('records'), axis=1)
-
-        question_titles = df_titles.to_dict('records')
-
-        data = json.dumps({
+        data = {
             'status': 'success',
             'message': 'All questions for how category.',
             'data': question_titles,
-            'how_category': how_object.name
-        })
+            'how_category': catalog['name']
+        }
         return Response(data, status=status.HTTP_200_OK)
 
     else:
@@ -2143,84 +2136,35 @@ def what_category_questions_api(request):
         serializer = CategoryIdSerializer(data=body)
 
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(serializer.data)
-            })
+            }
             return Response(data, status=status.HTTP_200_OK)
 
         validated_data = serializer.validated_data
         category_id = validated_data.get('category_id')
 
-        try:
-            what_object = WhatCategory.objects.get(id=category_id)
-        except WhatCategory.DoesNotExist:
-            data = json.dumps({
+        catalog = claim_taxonomy_cache.get_or_build(
+            ('category_questions', 'what', category_id),
+            lambda: get_category_question_catalog('what', category_id)
+        )
+
+        if catalog is None:
+            data = {
                 'status': 'error',
                 'message': 'What category not found.'
-            })
+            }
             return Response(data, status=status.HTTP_404_NOT_FOUND)
 
-        question_titles = WhatQuestionTitle.objects.filter(
-            what_id=category_id
-        )
-
-        title_serializer = WhatQuestionTitleModelSerializer(question_titles, many=True)
-        df_titles = pd.DataFrame(title_serializer.data)
-
-        if not df_titles.empty:
-
-            title_ids = df_titles['id'].values.tolist()
+        question_titles = link_category_answers('what', catalog)
 
-            questions = WhatQuestion.objects.filter(
-                what_title_id__in=title_ids
-            )
-
-            question_serializer = WhatQuestionModelSerializer(questions, many=True)
-            df_questions = pd.DataFrame(question_serializer.data)
-
-            if not df_questions.empty:
-                options = WhatQuestionOption.objects.filter(
-                    question_id__in=df_questions['id'].values.tolist()
-                )
-
-                option_serializer = WhatQuestionOptionModelSerializer(options, many=True)
-                df_options = pd.DataFrame(option_serializer.data)
-
-                if not df_options.empty:
-                    df_questions['options'] = df_questions.apply(
-                        lambda series:
-                        df_options.loc[
-                            df_options['question_id'] == series['id']
-                            ].to_dict('records'), axis=1)
-
-                answer = WhatQuestionAnswer.objects.filter(
-                    question_id__in=df_questions['id'].values.tolist()
-                )
-                answer_serializer = WhatQuestionAnswerModelSerializer(answer, many=True)
-                df_answers = pd.DataFrame(answer_serializer.data)
-
-                if not df_answers.empty:
-                    df_questions['answers'] = df_questions.apply(
-                        lambda series:
-                        df_answers.loc[
-                            df_answers['question_id'] == series['id']
-                            ].to_dict('records'), axis=1)
-
-                df_titles['questions'] = df_titles.apply(
-                    lambda series:
-                    df_questions.loc[
-                        df_questions['what_title_id'] == series['id']
-                        ].to_dict('records'), axis=1)
-
-        question_titles = df_titles.to_dict('records')
-
-        data = json.dumps({
+        data = {
             'status': 'success',
             'message': 'All questions for what category.',
             'data': question_titles,
-            'what_category': what_object.name
-        })
+            'what_category': catalog['name']
+        }
         return Response(data, status=status.HTTP_200_OK)
 
     else:
@@ -2245,10 +2189,10 @@ def get_claim_questions_api(request):
         body = json.loads(request.body)
         serializer = GetClaimQuestionsSerializer(data=body)
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -2257,24 +2201,24 @@ def get_claim_questions_api(request):
         how_id = validated_data.get('how_id')
 
         if not HowCategory.objects.filter(id=how_id).exists():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': 'How category not found.'
-            })
+            }
             return Response(data, status=status.HTTP_404_NOT_FOUND)
 
         if not WhatCategory.objects.filter(id=what_id).exists():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': 'What category not found.'
-            })
+            }
             return Response(data, status=status.HTTP_404_NOT_FOUND)
 
         if not Application.objects.filter(id=application_id).exists():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': 'Application not found.'
-            })
+            }
             return Response(data, status=status.HTTP_404_NOT_FOUND)
 
         data = {
@@ -2282,11 +2226,11 @@ def get_claim_questions_api(request):
             'how_questions': get_how_questions(how_id, application_id),
         }
 
-        data = json.dumps({
+        data = {
             'status': 'success',
             'message': 'All questions for application.',
             'data': data
-        })
+        }
         return Response(data, status=status.HTTP_200_OK)
 
 
@@ -2332,11 +2276,8 @@ def get_how_questions(category_id, application_id):
             df_options = pd.DataFrame(option_serializer.data)
 
             if not df_options.empty:
-                df_questions['options'] = df_questions['id'].apply(
-                    lambda question_id:
-                    df_options.loc[
-                        df_options['question_id'] == question_id
-                        ].to_dict('records')
+                df_questions['options'] = nest_children(
+                    df_questions, 'id', df_options, 'question_id'
                 )
 
             answer = HowQuestionAnswer.objects.filter(
@@ -2348,18 +2289,12 @@ def get_how_questions(category_id, application_id):
             df_answers = pd.DataFrame(answer_serializer.data)
 
             if not df_answers.empty:
-                df_questions['answers'] = df_questions['id'].apply(
-                    lambda question_id:
-                    df_answers.loc[
-                        df_answers['question_id'] == question_id
-                        ].to_dict('records')
+                df_questions['answers'] = nest_children(
+                    df_questions, 'id', df_answers, 'question_id'
                 )
 
-            df_titles['questions'] = df_titles['id'].apply(
-                lambda title_id:
-                df_questions.loc[
-                    df_questions['how_title_id'] == title_id
-                    ].to_dict('records')
+            df_titles['questions'] = nest_children(
+                df_titles, 'id', df_questions, 'how_title_id'
             )
 
         df_titles = df_titles.loc[
@@ -2412,11 +2347,8 @@ def get_what_questions(category_id, application_id):
             df_options = pd.DataFrame(option_serializer.data)
 
             if not df_options.empty:
-                df_questions['options'] = df_questions['id'].apply(
-                    lambda question_id:
-                    df_options.loc[
-                        df_options['question_id'] == question_id
-                        ].to_dict('records')
+                df_questions['options'] = nest_children(
+                    df_questions, 'id', df_options, 'question_id'
                 )
 
             answer = WhatQuestionAnswer.objects.filter(
@@ -2427,18 +2359,12 @@ def get_what_questions(category_id, application_id):
             df_answers = pd.DataFrame(answer_serializer.data)
 
             if not df_answers.empty:
-                df_questions['answers'] = df_questions['id'].apply(
-                    lambda question_id:
-                    df_answers.loc[
-                        df_answers['question_id'] == question_id
-                        ].to_dict('records')
+                df_questions['answers'] = nest_children(
+                    df_questions, 'id', df_answers, 'question_id'
                 )
 
-            df_titles['questions'] = df_titles['id'].apply(
-                lambda title_id:
-                df_questions.loc[
-                    df_questions['what_title_id'] == title_id
-                    ].to_dict('records')
+            df_titles['questions'] = nest_children(
+                df_titles, 'id', df_questions, 'what_title_id'
             )
 
         df_titles = df_titles.loc[
@@ -2464,10 +2390,10 @@ def save_claim_questions_api(request):
         body = json.loads(request.body)
         serializer = ClaimSaveQuestionSerializer(data=body)
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -2475,217 +2401,65 @@ def save_claim_questions_api(request):
         what_answers = validated_data.get('what_answers')
         how_answers = validated_data.get('how_answers')
 
-        [
-            create_what_question_instance(answer, claim_id)
-            for answer in what_answers
-        ]
-
-        [
-            create_how_question_instance(answer, claim_id)
-            for answer in how_answers
-        ]
+        with transaction.atomic():
+            save_claim_answers(
+                what_answers, claim_id, WhatQuestion, WhatQuestionAnswer
+            )
+            save_claim_answers(
+                how_answers, claim_id, HowQuestion, HowQuestionAnswer
+            )
 
-        data = json.dumps({
+        data = {
             'status': 'success',
             'message': 'Questions saved successfully!'
-        })
+        }
         return Response(data, status=status.HTTP_200_OK)
 
 
-def create_how_question_instance(answer, claim_id):
+def save_claim_answers(answers, claim_id, question_model, answer_model):
     """
-    Create question instance.
+    Save how or what answers of a claim in bulk.
 
-    :param answer:
-        Survey answer.
-    :param application_id:
-        Application id.
+    :param answers:
+        Claim answers.
+    :param claim_id:
+        Claim id.
+    :param question_model:
+        HowQuestion or WhatQuestion.
+    :param answer_model:
+        HowQuestionAnswer or WhatQuestionAnswer.
     :return:
-        Question instance.
+        None
     """
-    question_id = answer['question_id']
-
-    try:
-        question = HowQuestion.objects.get(id=question_id)
-
-    except HowQuestion.DoesNotExist:
+    if not answers:
         return None
 
-    question_type = answer['question_type']
-    answer_field = answer['answer']
+    question_ids = {answer['question_id'] for answer in answers}
+    questions = dict(
+        question_model.objects.filter(
+            id__in=question_ids
+        ).values_list('id', 'has_other_field')
+    )
 
-    if question.has_other_field:
-        survey_answer = HowQuestionAnswer.objects.filter(
-            question_id=question_id,
+    save_question_answers(
+        answers,
+        questions,
+        answer_model.objects.filter(
+            question_id__in=list(questions),
             claim_id=claim_id
-        ).values('id')
-
-        if not survey_answer.exists():
-            HowQuestionAnswer.objects.create(
-                question_id=question.id,
-                claim_id=claim_id,
-                answer=answer_field
-            )
-        elif survey_answer.count() == 1:
-            if question_type == 'other':
-
-                HowQuestionAnswer.objects.create(
-                    question_id=question.id,
-                    claim_id=claim_id,
-                    answer=answer_field
-                )
-
-            else:
-                survey_answer = HowQuestionAnswer.objects.filter(
-                    question_id=question_id,
-                    claim_id=claim_id
-                ).order_by('id').first()
-
-                if survey_answer:
-                    survey_answer.answer = answer_field
-                    survey_answer.save()
-        else:
-            if question_type == 'other':
-                survey_answer = HowQuestionAnswer.objects.filter(
-                    question_id=question_id,
-                    claim_id=claim_id
-                ).order_by('id').last()
-
-                if survey_answer:
-                    survey_answer.answer = answer_field
-                    survey_answer.save()
-            else:
-                survey_answer = HowQuestionAnswer.objects.filter(
-                    question_id=question_id,
-                    claim_id=claim_id
-                ).order_by('id').first()
-
-                if survey_answer:
-                    survey_answer.answer = answer_field
-                    survey_answer.save()
-
-    else:
-        if not HowQuestionAnswer.objects.filter(
-                question_id=question_id,
-                claim_id=claim_id
-        ).exists():
-
-            HowQuestionAnswer.objects.create(
-                question_id=question.id,
-                claim_id=claim_id,
-                answer=answer_field
-            )
-
-        else:
-
-            HowQuestionAnswer.objects.filter(
-                question_id=question_id,
-                claim_id=claim_id
-            ).update(
-                answer=answer_field
-            )
-
-    return None
-
-
-def create_what_question_instance(answer, claim_id):
-    """
-    Create question instance.
-
-    :param answer:
-        Survey answer.
-    :param application_id:
-        Application id.
-    :return:
-        Question instance.
-    """
-    question_id = answer['question_id']
-
-    try:
-        question = WhatQuestion.objects.get(id=question_id)
-
-    except WhatQuestion.DoesNotExist:
-        return None
-
-    question_type = answer['question_type']
-    answer_field = answer['answer']
-
-    if question.has_other_field:
-        survey_answer = WhatQuestionAnswer.objects.filter(
+        ),
+        lambda question_id, answer_field: answer_model(
             question_id=question_id,
-            claim_id=claim_id
-        ).values('id')
-
-        if not survey_answer.exists():
-
-            WhatQuestionAnswer.objects.create(
-                question_id=question.id,
-                claim_id=claim_id,
-                answer=answer_field
-            )
-
-        elif survey_answer.count() == 1:
-            if question_type == 'other':
-
-                WhatQuestionAnswer.objects.create(
-                    question_id=question.id,
-                    claim_id=claim_id,
-                    answer=answer_field
-                )
-            else:
-                survey_answer = WhatQuestionAnswer.objects.filter(
-                    question_id=question_id,
-                    claim_id=claim_id
-                ).order_by('id').first()
-
-                if survey_answer:
-                    survey_answer.answer = answer_field
-                    survey_answer.save()
-        else:
-            if question_type == 'other':
-                survey_answer = WhatQuestionAnswer.objects.filter(
-                    question_id=question_id,
-                    claim_id=claim_id
-                ).order_by('id').last()
-
-                if survey_answer:
-                    survey_answer.answer = answer_field
-                    survey_answer.save()
-            else:
-                survey_answer = WhatQuestionAnswer.objects.filter(
-                    question_id=question_id,
-                    claim_id=claim_id
-                ).order_by('id').first()
-
-                if survey_answer:
-                    survey_answer.answer = answer_field
-                    survey_answer.save()
-
-    else:
-        if not WhatQuestionAnswer.objects.filter(
-                question_id=question_id,
-                claim_id=claim_id
-        ).exists():
-
-            WhatQuestionAnswer.objects.create(
-                question_id=question.id,
-                claim_id=claim_id,
-                answer=answer_field
-            )
-
-        else:
-
-            WhatQuestionAnswer.objects.filter(
-                question_id=question_id,
-                claim_id=claim_id
-            ).update(
-                answer=answer_field
-            )
+            claim_id=claim_id,
+            answer=answer_field
+        )
+    )
 
     return None
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def edit_title_what_api(request):
     """
     Edit title what api.
@@ -2699,10 +2473,10 @@ def edit_title_what_api(request):
         body = json.loads(request.body)
         serializer = EditTitleSerializer(data=body)
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -2713,14 +2487,15 @@ def edit_title_what_api(request):
         title_what.title = title_name
         title_what.save()
 
-        data = json.dumps({
+        data = {
             'status': 'success',
             'message': 'Title what edited successfully!'
-        })
+        }
         return Response(data, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def delete_title_what_api(request):
     """
     Delete title what api.
@@ -2734,10 +2509,10 @@ def delete_title_what_api(request):
         body = json.loads(request.body)
         serializer = DeleteTitleSerializer(data=body)
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -2747,10 +2522,10 @@ def delete_title_what_api(request):
             title_what = WhatQuestionTitle.objects.get(id=title_id)
 
         except WhatQuestionTitle.DoesNotExist:
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': 'Title what does not exist!'
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         questions = WhatQuestion.objects.filter(
@@ -2781,15 +2556,16 @@ def delete_title_what_api(request):
 
         title_what.delete()
 
-        data = json.dumps({
+        data = {
             'status': 'success',
             'message': 'Title what deleted successfully!'
-        })
+        }
 
         return Response(data, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def edit_title_how_api(request):
     """
     Edit title how api.
@@ -2803,10 +2579,10 @@ def edit_title_how_api(request):
         body = json.loads(request.body)
         serializer = EditTitleSerializer(data=body)
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -2817,23 +2593,24 @@ def edit_title_how_api(request):
             title_how = HowQuestionTitle.objects.get(id=title_id)
 
         except HowQuestionTitle.DoesNotExist:
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': 'Title how does not exist!'
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         title_how.title = title_name
         title_how.save()
 
-        data = json.dumps({
+        data = {
             'status': 'success',
             'message': 'Title how edited successfully!'
-        })
+        }
         return Response(data, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def delete_title_how_api(request):
     """
     Delete title how api.
@@ -2847,10 +2624,10 @@ def delete_title_how_api(request):
         body = json.loads(request.body)
         serializer = DeleteTitleSerializer(data=body)
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -2860,10 +2637,10 @@ def delete_title_how_api(request):
             title_how = HowQuestionTitle.objects.get(id=title_id)
 
         except HowQuestionTitle.DoesNotExist:
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': 'Title how does not exist!'
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         questions = HowQuestion.objects.filter(
@@ -2898,15 +2675,16 @@ def delete_title_how_api(request):
 
         title_how.delete()
 
-        data = json.dumps({
+        data = {
             'status': 'success',
             'message': 'Title how deleted successfully!'
-        })
+        }
 
         return Response(data, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def edit_how_question_api(request):
     """
     Edit question api for how category.
@@ -2956,20 +2734,20 @@ def edit_how_question_api(request):
                 has_text = True
 
             else:
-                data = json.dumps({
+                data = {
                     'status': 'error',
                     'message': 'Invalid question type'
-                })
+                }
                 return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
             try:
                 question_object = HowQuestion.objects.get(id=how_question_id)
 
             except HowQuestion.DoesNotExist:
-                data = json.dumps({
+                data = {
                     'status': 'error',
                     'message': 'Question not found'
-                })
+                }
                 return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
             question_object.question = question
@@ -3019,18 +2797,18 @@ def edit_how_question_api(request):
                 'options': options_data
             }
 
-            data = json.dumps({
+            data = {
                 'status': 'success',
                 'message': 'Question created successfully',
                 'data': data
-            })
+            }
             return Response(data, status=status.HTTP_200_OK)
 
         else:
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(question_serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
     else:
@@ -3042,6 +2820,7 @@ def edit_how_question_api(request):
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def edit_what_question_api(request):
     """
     Edit question api for what category.
@@ -3092,20 +2871,20 @@ def edit_what_question_api(request):
                 has_text = True
 
             else:
-                data = json.dumps({
+                data = {
                     'status': 'error',
                     'message': 'Invalid question type'
-                })
+                }
                 return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
             try:
                 question_object = WhatQuestion.objects.get(id=what_question_id)
 
             except WhatQuestion.DoesNotExist:
-                data = json.dumps({
+                data = {
                     'status': 'error',
                     'message': 'Question not found'
-                })
+                }
                 return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
             question_object.question = question
@@ -3155,18 +2934,18 @@ def edit_what_question_api(request):
                 'options': options_data
             }
 
-            data = json.dumps({
+            data = {
                 'status': 'success',
                 'message': 'Question created successfully',
                 'data': data
-            })
+            }
             return Response(data, status=status.HTTP_200_OK)
 
         else:
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(question_serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
     else:
@@ -3178,6 +2957,7 @@ def edit_what_question_api(request):
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def delete_what_question_api(request):
     """
     Delete question api for what category.
@@ -3192,10 +2972,10 @@ def delete_what_question_api(request):
         question_serializer = DeleteQuestionSerializer(data=body)
 
         if not question_serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(question_serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         question_id = question_serializer.validated_data.get('question_id')
@@ -3204,10 +2984,10 @@ def delete_what_question_api(request):
             question_object = WhatQuestion.objects.get(id=question_id)
 
         except WhatQuestion.DoesNotExist:
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': 'Question not found'
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         WhatQuestionOption.objects.filter(
@@ -3230,14 +3010,15 @@ def delete_what_question_api(request):
 
         question_object.delete()
 
-        data = json.dumps({
+        data = {
             'status': 'success',
             'message': 'Question deleted successfully'
-        })
+        }
         return Response(data, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
+@invalidates(claim_taxonomy_cache)
 def delete_how_question_api(request):
     """
     Delete question api for how category.
@@ -3252,10 +3033,10 @@ def delete_how_question_api(request):
         question_serializer = DeleteQuestionSerializer(data=body)
 
         if not question_serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(question_serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         question_id = question_serializer.validated_data.get('question_id')
@@ -3264,10 +3045,10 @@ def delete_how_question_api(request):
             question_object = HowQuestion.objects.get(id=question_id)
 
         except HowQuestion.DoesNotExist:
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': 'Question not found'
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         HowQuestionOption.objects.filter(
@@ -3290,10 +3071,10 @@ def delete_how_question_api(request):
 
         question_object.delete()
 
-        data = json.dumps({
+        data = {
             'status': 'success',
             'message': 'Question deleted successfully'
-        })
+        }
         return Response(data, status=status.HTTP_200_OK)
 
 
@@ -3312,34 +3093,152 @@ def generate_report_claim_api(request):
         report_serializer = GenerateReportClaimSerializer(data=body)
 
         if not report_serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(report_serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         application_id = report_serializer.validated_data.get('application_id')
+        report = get_application_report(application_id)
 
-        application = Application.objects.filter(id=application_id)
-        if not application.exists():
-            response_data = json.dumps({
+        if report is None:
+            response_data = {
                 'status': 'error',
                 'message': f'Application with id: {application_id} does not exists'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
-        app_serializer = ApplicationClaimModelSerializer(instance=application, many=True)
-        df_application = pd.DataFrame(app_serializer.data)
-        df_application = get_preview_report_info(df_application)
-
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': 'Application data retreived',
-            'data': df_application.to_dict('records')[0]
-        })
+            'data': report
+        }
         return Response(response_data, status=status.HTTP_200_OK)
 
 
+@api_view(['POST'])
+def claim_report_api(request):
+    """
+    Queue the rendering of the report of an application.
+
+    The job of a version of the report data is queued once, its result is
+    the key of the stored report, so the report is only rendered again
+    when the claim data changes.
+
+    :param request:
+        Django Request parameter.
+    :return:
+        Report job, with a 202 status while the report is rendered.
+    """
+    if request.method == "POST":
+        body = json.loads(request.body)
+        report_serializer = GenerateReportClaimSerializer(data=body)
+
+        if not report_serializer.is_valid():
+            response_data = {
+                'status': 'error',
+                'message': str(report_serializer.errors)
+            }
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+
+        application_id = report_serializer.validated_data.get('application_id')
+        report = get_application_report(application_id)
+
+        if report is None:
+            response_data = {
+                'status': 'error',
+                'message': f'Application with id: {application_id} does not exists'
+            }
+            return Response(response_data, status=status.HTTP_404_NOT_FOUND)
+
+        content_hash = report_content_hash(report)
+        job = enqueue_job(
+            RENDER_CLAIM_REPORT,
+            {'application_id': application_id, 'content_hash': content_hash},
+            idempotency_key=claim_report_key(application_id, content_hash)
+        )
+        job_serializer = BackgroundJobModelSerializer(job)
+
+        if job.status == BackgroundJob.SUCCEEDED:
+            response_data = {
+                'status': 'success',
+                'message': 'Report generated successfully',
+                'data': job_serializer.data
+            }
+            return Response(response_data, status=status.HTTP_200_OK)
+
+        response_data = {
+            'status': 'success',
+            'message': 'Report is being generated',
+            'data': job_serializer.data
+        }
+        return Response(response_data, status=status.HTTP_202_ACCEPTED)
+
+
+@api_view(['POST'])
+def export_reports_api(request):
+    """
+    Queue a bulk export of the reports of the selected applications.
+
+    The applications are selected when the export is queued, the job
+    renders their reports into one ZIP or merged PDF and its status shows
+    the number of reports done.
+
+    :param request:
+        Django Request parameter.
+    :return:
+        Export job or error.
+    """
+    if request.method == "POST":
+        body = json.loads(request.body)
+        export_serializer = ExportReportsSerializer(data=body)
+
+        if not export_serializer.is_valid():
+            response_data = {
+                'status': 'error',
+                'message': str(export_serializer.errors)
+            }
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+
+        validated_data = export_serializer.validated_data
+        export_format = validated_data.get('export_format')
+        application_ids = filter_report_applications(validated_data)
+
+        if not application_ids:
+            response_data = {
+                'status': 'error',
+                'message': 'No claim applications match the export'
+            }
+            return Response(response_data, status=status.HTTP_404_NOT_FOUND)
+
+        if export_format == 'pdf' and len(application_ids) > settings.REPORT_EXPORT_MAX_MERGED:
+            response_data = {
+                'status': 'error',
+                'message': f'A merged PDF is limited to {settings.REPORT_EXPORT_MAX_MERGED} '
+                           f'applications, export {len(application_ids)} applications as a zip'
+            }
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+
+        job = enqueue_job(
+            EXPORT_CLAIM_REPORTS,
+            {
+                'application_ids': application_ids,
+                'export_format': export_format,
+                'file_path': f"report_exports/{uuid.uuid4().hex}/reports.{export_format}"
+            },
+            user=request.user
+        )
+        job_serializer = BackgroundJobModelSerializer(job)
+
+        response_data = {
+            'status': 'success',
+            'message': f'Export of {len(application_ids)} reports queued',
+            'data': job_serializer.data
+        }
+        return Response(response_data, status=status.HTTP_202_ACCEPTED)
+
+
 @api_view(['POST'])
 def report_single_claim_api(request):
     """
@@ -3355,20 +3254,20 @@ def report_single_claim_api(request):
         report_serializer = ClaimApplicationSerializer(data=body)
 
         if not report_serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(report_serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         claim_id = report_serializer.validated_data.get('claim_id')
 
         claim = Claim.objects.filter(id=claim_id)
         if not claim.exists():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': f"Claim with id: {claim_id} does not exist"
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         application = Application.objects.get(id=claim.first().application_id)
@@ -3383,11 +3282,11 @@ def report_single_claim_api(request):
             'claim': df_claim.to_dict('records')[0]
         }
 
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': 'Application data retreived',
             'data': data
-        })
+        }
         return Response(response_data, status=status.HTTP_200_OK)
 
 
@@ -3406,30 +3305,30 @@ def preview_report_claim_api(request):
         report_serializer = GenerateReportClaimSerializer(data=body)
 
         if not report_serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(report_serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         application_id = report_serializer.validated_data.get('application_id')
         application = Application.objects.filter(id=application_id)
         if not application.exists():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': f'Application with id: {application_id} does not exists'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         app_serializer = ApplicationClaimModelSerializer(instance=application, many=True)
         df_application = pd.DataFrame(app_serializer.data)
         df_application = get_preview_report_info(df_application)
 
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': 'Application data retreived',
             'data': df_application.to_dict('records')[0]
-        })
+        }
         return Response(response_data, status=status.HTTP_200_OK)
 
 
@@ -3450,10 +3349,10 @@ def get_client_claims_api(request):
     if request.method == "GET":
         serializer = UserSerializer(data=request.data)
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -3461,18 +3360,18 @@ def get_client_claims_api(request):
         try:
             client_user = User.objects.get(id = user_id)
         except User.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': f'User with id: {user_id} not found'
-            })
+            }
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
         claims_list = Claim.objects.filter(
             application_id__client_id__email = client_user.email
         ).values_list('application_id', flat=True)
 
-        claim_applications = Application.objects.filter(
-            id__in=claims_list
+        claim_applications = ApplicationClientModelSerializer.setup_eager_loading(
+            Application.objects.filter(id__in=claims_list)
         )
 
         application_model_serializer = ApplicationClientModelSerializer(
@@ -3480,10 +3379,10 @@ def get_client_claims_api(request):
             many=True
         )
 
-        response_data = json.dumps({
+        response_data = {
             "status": "success",
             "message": "Claim data retrieved successfully!",
             "data": application_model_serializer.data
-        })
+        }
 
         return Response(response_data, status=status.HTTP_200_OK)
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+Bulk export of application reports as a ZIP or as one merged PDF.
+
+The reports are rendered by a pool of worker processes with the renderer
+of ``claims.reports``. Every worker writes its report to a temporary
+directory and only a few reports are rendered ahead of the one that is
+added to the export, so the memory of an export does not grow with the
+size of the pack. A ZIP is written to disk report by report. A merged PDF
+is held in memory until it is written, its number of applications is
+limited by REPORT_EXPORT_MAX_MERGED.
+"""
+import collections
+import multiprocessing
+import os
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.db import connections
+
+from claims.api.services import get_application_report
+from claims.reports import render_claim_report
+
+EXPORT_CONTENT_TYPES = {
+    'zip': 'application/zip',
+    'pdf': 'application/pdf'
+}
+
+
+def report_file_name(application_id):
+    """
+    File name of the report of an application.
+
+    :param application_id:
+        Application id.
+    :return:
+        File name.
+    """
+    return f"Assessment-Report-{application_id}.pdf"
+
+
+def _render_report_file(application_id, directory):
+    """
+    Render the report of an application to a file, in a worker process.
+
+    :param application_id:
+        Application id.
+    :param directory:
+        Directory of the rendered reports.
+    :return:
+        Path of the report, or None when the application does not exist.
+    """
+    report = get_application_report(application_id)
+
+    if report is None:
+        return None
+
+    path = os.path.join(directory, report_file_name(application_id))
+    with open(path, 'wb') as report_file:
+        report_file.write(render_claim_report(report))
+
+    return path
+
+
+def _rendered_report(application_id, future):
+    """
+    Outcome of a report rendered by a worker.
+
+    :param application_id:
+        Application id.
+    :param future:
+        Future of the worker.
+    :return:
+        Application id, path of the report or None and an error message.
+    """
+    try:
+        path = future.result()
+    except Exception as error:  # pylint: disable=broad-except
+        return application_id, None, str(error)
+
+    if path is None:
+        return application_id, None, 'Application not found'
+
+    return application_id, path, ''
+
+
+def iter_rendered_reports(application_ids, directory):
+    """
+    Render reports in the worker processes, in the order of the ids.
+
+    :param application_ids:
+        Application ids.
+    :param directory:
+        Directory of the rendered reports.
+    :return:
+        Generator of the application id, the path of the report or None and
+        an error message, for every application.
+    """
+    workers = max(1, settings.REPORT_EXPORT_WORKERS)
+    futures = collections.deque()
+
+    # The workers are forked from this process, they open database
+    # connections of their own instead of sharing the ones of this process.
+    connections.close_all()
+
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('fork')
+    ) as executor:
+        for application_id in application_ids:
+            futures.append((
+                application_id,
+                executor.submit(_render_report_file, application_id, directory)
+            ))
+            if len(futures) >= workers * 2:
+                yield _rendered_report(*futures.popleft())
+
+        while futures:
+            yield _rendered_report(*futures.popleft())
+
+
+def write_report_export(application_ids, export_format, export_path, progress=None):
+    """
+    Render the reports of applications into one ZIP or merged PDF.
+
+    :param application_ids:
+        Application ids in the order of the export.
+    :param export_format:
+        'zip' or 'pdf'.
+    :param export_path:
+        Path the export is written to.
+    :param progress:
+        Function called with the progress after every report, or None.
+    :return:
+        Number of reports and the applications whose report failed.
+    """
+    total = len(application_ids)
+    done = 0
+    failed = []
+    archive = None
+    merged_pdf = None
+
+    if export_format == 'zip':
+        # The reports are compressed PDFs, they are stored as they are.
+        archive = zipfile.ZipFile(export_path, 'w', zipfile.ZIP_STORED)
+    else:
+        from pypdf import PdfWriter  # pylint: disable=import-outside-toplevel
+        merged_pdf = PdfWriter()
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            for application_id, path, error in iter_rendered_reports(application_ids, directory):
+                done += 1
+
+                if path is None:
+                    failed.append({'application_id': application_id, 'message': error})
+                else:
+                    if archive is not None:
+                        archive.write(path, arcname=report_file_name(application_id))
+                    else:
+                        merged_pdf.append(path)
+                    os.remove(path)
+
+                if progress is not None:
+                    progress({'done': done, 'total': total, 'failed': len(failed)})
+
+        if merged_pdf is not None:
+            with open(export_path, 'wb') as export_file:
+                merged_pdf.write(export_file)
+
+    finally:
+        if archive is not None:
+            archive.close()
+
+    return {'done': done, 'total': total, 'failed': failed}
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.3 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+def remove_duplicate_claim_categories(apps, schema_editor):
+    """
+    Keep the newest cause, how and what category of every claim, the views
+    only ever read and update one of them.
+    """
+    for model_name in ('ApplicationCause', 'ApplicationHow', 'ApplicationWhat'):
+        model = apps.get_model('claims', model_name)
+        duplicates = model.objects.values('claim_id').annotate(
+            newest_id=models.Max('id'),
+            total=models.Count('id')
+        ).filter(total__gt=1)
+
+        for duplicate in duplicates:
+            model.objects.filter(
+                claim_id=duplicate['claim_id']
+            ).exclude(
+                id=duplicate['newest_id']
+            ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0002_auto_20230920_1140'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_claim_categories, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='howquestionanswer',
+            index=models.Index(fields=['claim', 'question'], name='how_answer_claim_question_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='whatquestionanswer',
+            index=models.Index(fields=['claim', 'question'], name='what_answer_claim_question_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='applicationcause',
+            constraint=models.UniqueConstraint(fields=['claim'], name='unique_application_cause_claim'),
+        ),
+        migrations.AddConstraint(
+            model_name='applicationhow',
+            constraint=models.UniqueConstraint(fields=['claim'], name='unique_application_how_claim'),
+        ),
+        migrations.AddConstraint(
+            model_name='applicationwhat',
+            constraint=models.UniqueConstraint(fields=['claim'], name='unique_application_what_claim'),
+        ),
+    ]
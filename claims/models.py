@@ -125,6 +125,9 @@ class ApplicationWhat(models.Model):
         """
         verbose_name = "Application What"
         verbose_name_plural = "Application Whats"
+        constraints = [
+            models.UniqueConstraint(fields=['claim'], name='unique_application_what_claim'),
+        ]
 
     def __str__(self):
         """
@@ -146,6 +149,9 @@ class ApplicationHow(models.Model):
         """
         verbose_name = "Application How"
         verbose_name_plural = "Application Hows"
+        constraints = [
+            models.UniqueConstraint(fields=['claim'], name='unique_application_how_claim'),
+        ]
 
     def __str__(self):
         """
@@ -167,6 +173,9 @@ class ApplicationCause(models.Model):
         """
         verbose_name = "Application Cause"
         verbose_name_plural = "Application Causes"
+        constraints = [
+            models.UniqueConstraint(fields=['claim'], name='unique_application_cause_claim'),
+        ]
 
     def __str__(self):
         """
@@ -268,6 +277,9 @@ class HowQuestionAnswer(models.Model):
         """Metaclass for HowAnswers."""
         verbose_name = 'How Answer'
         verbose_name_plural = 'How Answers'
+        indexes = [
+            models.Index(fields=['claim', 'question'], name='how_answer_claim_question_idx'),
+        ]
 
     def __str__(self):
         """String representation of HowAnswers."""
@@ -367,6 +379,9 @@ class WhatQuestionAnswer(models.Model):
         """Metaclass for WhatAnswers."""
         verbose_name = 'What Answer'
         verbose_name_plural = 'What Answers'
+        indexes = [
+            models.Index(fields=['claim', 'question'], name='what_answer_claim_question_idx'),
+        ]
 
     def __str__(self):
         """String representation of WhatAnswers."""
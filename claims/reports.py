@@ -0,0 +1,715 @@
+"""
+ReportLab rendering of the claim application reports.
+
+The reports are drawn from the data of ``get_application_report`` by the
+``render_claim_report`` background job, see ``claims.tasks``. The rendered
+file is stored per version of the report data, the version is the content
+hash of the data.
+
+The full page backgrounds are decoded once per process and reused by every
+report, see ``page_background``.
+"""
+import functools
+import hashlib
+import io
+import json
+import os
+from django.conf import settings
+from application.lazy import lazy_module
+
+pd = lazy_module('pandas')
+
+
+def draw_paragraph(pdf_canvas, msg, x, y, max_width, max_height, message_style):
+    """
+    Draw paragraph on the pdf report.
+    """
+    from reportlab.platypus import Paragraph  # pylint: disable=import-outside-toplevel
+    message = str(msg).replace('\n', '<br />')
+    message = Paragraph(message, style=message_style)
+    _, h = message.wrap(max_width, max_height)
+    message.drawOn(pdf_canvas, x, y - h)
+    return pdf_canvas
+
+
+def paragraph_height(pdf_canvas, msg, max_width, max_height, message_style):
+    """
+    Get the height of the content passed then return the height.
+    """
+    from reportlab.platypus import Paragraph  # pylint: disable=import-outside-toplevel
+    message = str(msg).replace('\n', '<br />')
+    message = Paragraph(message, style=message_style)
+    message.wrapOn(pdf_canvas, max_width, max_height)
+    height = message.height
+    return height
+
+
+BACKGROUND_DIR = os.path.join(settings.BASE_DIR, "system_management", "static", 'images',
+                              'claim')
+
+
+@functools.lru_cache(maxsize=None)
+def page_background(file_name):
+    """
+    Decoded page background, loaded once per process.
+
+    ReportLab decodes an image it is given by path on every report. The
+    background is read once instead and the same reader is drawn by every
+    report of the process. With REPORT_FLATTEN_BACKGROUNDS the transparency
+    is flattened onto the white page, so the report has no soft mask for the
+    page, and with REPORT_BACKGROUND_DPI a larger image is scaled down to the
+    size of an A4 page at that resolution.
+
+    :param file_name:
+        File name of the background in the claim images.
+    :return:
+        ImageReader of the background.
+    """
+    # pylint: disable=import-outside-toplevel
+    from PIL import Image
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import inch
+    from reportlab.lib.utils import ImageReader
+
+    image = Image.open(os.path.join(BACKGROUND_DIR, file_name))
+    image.load()
+
+    if settings.REPORT_FLATTEN_BACKGROUNDS and image.mode in ('RGBA', 'LA', 'P'):
+        image = image.convert('RGBA')
+        flat_image = Image.new('RGB', image.size, (255, 255, 255))
+        flat_image.paste(image, mask=image.getchannel('A'))
+        image = flat_image
+
+    if settings.REPORT_BACKGROUND_DPI:
+        size = (
+            round(A4[0] / inch * settings.REPORT_BACKGROUND_DPI),
+            round(A4[1] / inch * settings.REPORT_BACKGROUND_DPI)
+        )
+        if image.width > size[0] or image.height > size[1]:
+            image = image.resize(size, Image.LANCZOS)
+
+    return ImageReader(image)
+
+
+def _without_signatures(value):
+    """
+    Report data with the query string of every url left out.
+
+    :param value:
+        Report data or a value in it.
+    :return:
+        Value with unsigned urls.
+    """
+    if isinstance(value, dict):
+        return {key: _without_signatures(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [_without_signatures(item) for item in value]
+
+    if isinstance(value, str) and value.startswith(('http://', 'https://')):
+        return value.split('?', 1)[0]
+
+    return value
+
+
+def report_content_hash(application):
+    """
+    Version of the data a report is drawn from.
+
+    The files of the report are presigned urls that are signed again every
+    signing window, so their signature is left out of the hash and the hash
+    only changes when the claim data changes.
+
+    :param application:
+        Report data of the application.
+    :return:
+        Sha256 hex digest of the data.
+    """
+    content = json.dumps(_without_signatures(application), sort_keys=True, default=str)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def report_file_path(application_id, content_hash):
+    """
+    Key of the stored report of an application.
+
+    :param application_id:
+        Application id.
+    :param content_hash:
+        Version of the report data.
+    :return:
+        Key of the report file.
+    """
+    return f"application_{application_id}/reports/report_{content_hash}.pdf"
+
+
+def render_claim_report(application):
+    """
+    Draw the report of an application and all its claims.
+
+    :param application:
+        Report data of the application.
+    :return:
+        PDF file content.
+    """
+    # pylint: disable=import-outside-toplevel
+    from reportlab.lib.colors import HexColor
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import inch
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    client_object = application.get('client')
+    client_incident = client_object.get('client_incident')
+    assessment = application.get('assessment')
+    assessment_exists = False
+
+    if assessment:
+        assessment_exists = True
+        assessment = application.get('assessment')[0]
+
+    buffer = io.BytesIO()
+    styles = getSampleStyleSheet()
+    pdf_canvas = canvas.Canvas(buffer, pagesize=A4)
+    pdf_canvas.setTitle(f"Assessment-Report-{str(application['id'])}")
+    path_cover = page_background('Cover.png')
+    pdf_canvas.drawImage(path_cover, x=0, y=0, width=8.268 * inch, height=11.693 * inch,
+                         mask='auto')
+
+    pdf_canvas.setFillColor(HexColor('#FFFFFF'))
+    pdf_canvas.setFont("Helvetica", 14)
+    pdf_canvas.drawString(22, 225,
+                          f"{client_object['first_name']} {client_object['last_name']}")
+
+    pdf_canvas.setFillColor(HexColor('#FFFFFF'))
+    pdf_canvas.setFont("Helvetica", 14)
+    pdf_canvas.drawString(22, 155,
+                          f"{application['assessor_id__first_name']} {application['assessor_id__last_name']}")
+
+    pdf_canvas.setFillColor(HexColor('#FFFFFF'))
+    pdf_canvas.setFont("Helvetica", 14)
+    pdf_canvas.drawString(22, 80, f"{client_object['insurer__insurance_name']}")
+
+    pdf_canvas.setFillColor(HexColor('#FFFFFF'))
+    pdf_canvas.setFont("Helvetica", 14)
+    pdf_canvas.drawString(320, 225, f"{client_object['policy_no']}")
+
+    pdf_canvas.setFillColor(HexColor('#FFFFFF'))
+    pdf_canvas.setFont("Helvetica", 14)
+    pdf_canvas.drawString(320, 155, f"{client_object['client_incident']['date_of_incident']}")
+
+    pdf_canvas.setFillColor(HexColor('#FFFFFF'))
+    pdf_canvas.setFont("Helvetica", 14)
+
+    if assessment_exists:
+        pdf_canvas.drawString(320, 80,
+                              f"{assessment['scheduled_date_time']}")
+    else:
+        pdf_canvas.drawString(320, 80, "No date scheduled")
+    pdf_canvas.showPage()
+
+    path_client = page_background('client.png')
+    pdf_canvas.drawImage(path_client, x=0, y=0, width=8.268 * inch, height=11.693 * inch,
+                         mask='auto')
+
+    message_style = styles['Normal']
+    message_style.textColor = HexColor('#000000')
+    message_style.fontSize = 12
+
+    msg = f"{client_object['first_name']} {client_object['last_name']}"
+    pdf_canvas = draw_paragraph(
+        pdf_canvas=pdf_canvas,
+        msg=msg,
+        x=105,
+        y=585,
+        max_height=300,
+        max_width=300,
+        message_style=message_style
+    )
+
+    msg = f"{client_object['id_number']}"
+    pdf_canvas = draw_paragraph(
+        pdf_canvas=pdf_canvas,
+        msg=msg,
+        x=105,
+        y=540,
+        max_height=300,
+        max_width=300,
+        message_style=message_style
+    )
+
+    msg = f"{client_object['phone_number']}"
+    pdf_canvas = draw_paragraph(
+        pdf_canvas=pdf_canvas,
+        msg=msg,
+        x=360,
+        y=540,
+        max_height=300,
+        max_width=300,
+        message_style=message_style
+    )
+
+    client_address = f"""
+    {client_incident['street_address']},{client_incident['city']},{client_incident['province']},{client_incident['postal_code']}
+    """
+
+    msg = f"{client_address}"
+    pdf_canvas = draw_paragraph(
+        pdf_canvas=pdf_canvas,
+        msg=msg,
+        x=105,
+        y=513,
+        max_height=300,
+        max_width=300,
+        message_style=message_style
+    )
+
+    msg = f"{client_incident['postal_code']}"
+    pdf_canvas = draw_paragraph(
+        pdf_canvas=pdf_canvas,
+        msg=msg,
+        x=360,
+        y=445,
+        max_height=300,
+        max_width=300,
+        message_style=message_style
+    )
+
+    msg = f"{client_object['policy_no']}"
+    pdf_canvas = draw_paragraph(
+        pdf_canvas=pdf_canvas,
+        msg=msg,
+        x=105,
+        y=445,
+        max_height=300,
+        max_width=300,
+        message_style=message_style
+    )
+
+    msg = f"{client_object['email']}"
+    pdf_canvas = draw_paragraph(
+        pdf_canvas=pdf_canvas,
+        msg=msg,
+        x=105,
+        y=400,
+        max_height=300,
+        max_width=300,
+        message_style=message_style
+    )
+
+    msg = f"{application['date_created']}"
+    pdf_canvas = draw_paragraph(
+        pdf_canvas=pdf_canvas,
+        msg=msg,
+        x=105,
+        y=260,
+        max_height=300,
+        max_width=300,
+        message_style=message_style
+    )
+
+    msg = f"{client_incident['date_of_incident']}"
+    pdf_canvas = draw_paragraph(
+        pdf_canvas=pdf_canvas,
+        msg=msg,
+        x=360,
+        y=260,
+        max_height=300,
+        max_width=300,
+        message_style=message_style
+    )
+
+    msg = f"{client_object['insurer__insurance_name']}"
+    pdf_canvas = draw_paragraph(
+        pdf_canvas=pdf_canvas,
+        msg=msg,
+        x=105,
+        y=220,
+        max_height=300,
+        max_width=300,
+        message_style=message_style
+    )
+
+    application_type = "Multi"
+
+    msg = f"{application_type}"
+    pdf_canvas = draw_paragraph(
+        pdf_canvas=pdf_canvas,
+        msg=msg,
+        x=105,
+        y=175,
+        max_height=300,
+        max_width=300,
+        message_style=message_style
+    )
+
+    pdf_canvas.setFillColor(HexColor('#FFFFFF'))
+    pdf_canvas.setFont("Helvetica-Bold", 25)
+    pdf_canvas.drawString(520, 47, f"{pdf_canvas.getPageNumber()}")
+    pdf_canvas.showPage()
+
+    claims = application.get('claims')
+    if claims:
+        for claim in claims:
+            if claim['application_type__name'] == 'Business':
+                path_business = page_background('business.png')
+                pdf_canvas.drawImage(path_business, x=0, y=0, width=8.268 * inch,
+                                     height=11.693 * inch,
+                                     mask='auto')
+
+                pdf_canvas.showPage()
+
+            elif claim['application_type__name'] == 'Personal':
+                path_personal = page_background('personal.png')
+                pdf_canvas.drawImage(path_personal, x=0, y=0, width=8.268 * inch,
+                                     height=11.693 * inch,
+                                     mask='auto')
+                pdf_canvas.showPage()
+
+            path_overview = page_background('overview.png')
+            pdf_canvas.drawImage(path_overview, x=0, y=0, width=8.268 * inch,
+                                 height=11.693 * inch,
+                                 mask='auto')
+
+            message_style = styles['Normal']
+            message_style.textColor = HexColor('#000000')
+            message_style.fontSize = 18
+            message_style.fontName = 'Helvetica-Bold'
+
+            msg = f"{claim['application_type__name']}"
+            pdf_canvas = draw_paragraph(
+                pdf_canvas=pdf_canvas,
+                msg=msg,
+                x=195,
+                y=485,
+                max_height=300,
+                max_width=300,
+                message_style=message_style
+            )
+            if claim['application_cause'] == '':
+                msg = "Unselected"
+            else:
+                msg = f"{claim['application_cause']['cause_id__name']}"
+
+            pdf_canvas = draw_paragraph(
+                pdf_canvas=pdf_canvas,
+                msg=msg,
+                x=195,
+                y=380,
+                max_height=300,
+                max_width=300,
+                message_style=message_style
+            )
+
+            if claim['application_what'] == '':
+                msg = "Unselected"
+            else:
+                msg = f"{claim['application_what']['what_id__name']}"
+
+            pdf_canvas = draw_paragraph(
+                pdf_canvas=pdf_canvas,
+                msg=msg,
+                x=195,
+                y=275,
+                max_height=300,
+                max_width=300,
+                message_style=message_style
+            )
+
+            if claim['application_how'] == '':
+                msg = "Unselected"
+            else:
+                msg = f"{claim['application_how']['how_id__name']}"
+
+            pdf_canvas = draw_paragraph(
+                pdf_canvas=pdf_canvas,
+                msg=msg,
+                x=195,
+                y=160,
+                max_height=300,
+                max_width=300,
+                message_style=message_style
+            )
+
+            pdf_canvas.setFillColor(HexColor('#FFFFFF'))
+            pdf_canvas.setFont("Helvetica-Bold", 25)
+            pdf_canvas.drawString(520, 47, f"{pdf_canvas.getPageNumber()}")
+            pdf_canvas.showPage()
+
+            list_columns = ['title', 'questions']
+
+            how_questions = pd.DataFrame(columns=list_columns)
+            what_questions = pd.DataFrame(columns=list_columns)
+            
+            if 'details' in claim:
+                details = claim['details']
+                how_questions_list = details['how_questions']
+                what_questions_list = details['what_questions']
+                
+                if not how_questions_list == '':
+                    how_questions = pd.DataFrame(how_questions_list)
+                
+                if not what_questions_list == '':
+                    what_questions = pd.DataFrame(what_questions_list)
+
+            if not how_questions.empty and not what_questions.empty:
+                how_questions = how_questions[list_columns]
+                what_questions = what_questions[list_columns]
+                questions = pd.concat([what_questions, how_questions])
+
+            elif not how_questions.empty and what_questions.empty:
+                questions = how_questions[list_columns]
+
+            elif not what_questions.empty and how_questions.empty:
+                questions = what_questions[list_columns]
+            
+            else:
+                questions = pd.DataFrame(columns=list_columns)
+
+            background_image = page_background('Back.png')
+
+            message_style = styles['Normal']
+            message_style.textColor = HexColor('#000000')
+            message_style.fontSize = 12
+            message_style.fontName = 'Helvetica'
+
+            if not questions.empty:
+                
+                path_question = page_background('question.png')
+                pdf_canvas.drawImage(path_question, x=0, y=0, width=8.268 * inch,
+                                     height=11.693 * inch,
+                                     mask='auto')
+                y_axis = 550
+
+                for _, title in questions.iterrows():
+
+                    title_name = title['title']
+                    question_answers_df = pd.DataFrame(title['questions'])
+                    question_answers_df = question_answers_df.assign(
+                        title=title_name
+                    )
+
+                    question_answers_df = question_answers_df.fillna('')
+                    question_answers_df = question_answers_df.loc[
+                        (question_answers_df['answer'] != "")]
+                    question_answers_df = question_answers_df.loc[
+                        ~(question_answers_df['answer'].isnull())]
+
+                    list_columns = [
+                        'title',
+                        'question',
+                        'answer',
+                        'question_type',
+                        'has_file'
+                    ]
+                    group_answers_df = question_answers_df[list_columns]
+                    group_answers_df = group_answers_df.sort_values(by=['has_file'],
+                                                                    ascending=False)
+                    group_answers_df['answer'] = group_answers_df['answer'].apply(
+                        lambda answer:
+                        answer[0]['answer']
+                    )
+                    data = list(group_answers_df.values.tolist())
+
+                    if not data:
+                        continue
+
+                    first_question = True
+
+                    for question in data:
+
+                        if type(question[2]) == list:
+                            question[2] = question[2][0]
+
+                        if str(question[3]) == 'file':
+                            height = 250
+                            y_axis_check = y_axis - height
+
+                            if y_axis_check < 130:
+                                y_axis = 625
+
+                                pdf_canvas.setFillColor(HexColor('#FFFFFF'))
+                                pdf_canvas.setFont("Helvetica-Bold", 25)
+                                pdf_canvas.drawString(520, 47, f"{pdf_canvas.getPageNumber()}")
+                                pdf_canvas.showPage()
+                                pdf_canvas.drawImage(background_image, x=0, y=0,
+                                                     width=8.268 * inch,
+                                                     height=11.693 * inch,
+                                                     mask='auto')
+
+                            if first_question:
+                                pdf_canvas.setFillColor(HexColor('#C40001'))
+                                pdf_canvas.setFont("Helvetica-Bold", 18)
+                                pdf_canvas.drawString(20, (y_axis + 14), f"{title_name}")
+                                first_question = False
+
+                            pdf_canvas.roundRect(10, y_axis - (0.14 * inch + height),
+                                                 7.8 * inch,
+                                                 (0.07 * inch + height), 8,
+                                                 stroke=True)
+                            pdf_canvas.drawImage(str(question[2]), 25,
+                                                 (y_axis - height + 30), 200, 180)
+
+                            pdf_canvas.setFillColor(HexColor('#FFFFFF'))
+                            msg_width = stringWidth(f"{question[1]}", "Helvetica", 12)
+                            pdf_canvas.rect(25, y_axis - 0.12 * inch, msg_width, 0.25 * inch,
+                                            fill=True,
+                                            stroke=False)
+
+                            msg = f"{question[1]}"
+                            message_style = styles['Normal']
+                            message_style.textColor = HexColor('#000000')
+                            pdf_canvas = draw_paragraph(pdf_canvas, msg, 30,
+                                                        y_axis + 0.03 * inch,
+                                                        7.5 * inch, 0.25 * inch,
+                                                        message_style)
+
+                            y_axis = y_axis - (height + 40)
+
+                        else:
+
+                            msg = f"{question[2]}"
+                            message_style = styles['Normal']
+                            message_style.textColor = HexColor('#000000')
+                            height = paragraph_height(pdf_canvas, question[2],
+                                                      7.5 * inch,
+                                                      0.75 * inch,
+                                                      message_style)
+
+                            question_height = paragraph_height(pdf_canvas, question[1],
+                                                               7.5 * inch,
+                                                               0.25 * inch, message_style)
+
+                            if height < 0.75 * inch:
+                                height = 0.75 * inch
+
+                            y_diff = height + question_height
+                            y_axis_check = y_axis - question_height
+
+                            if y_axis_check < 130:
+                                y_axis = 625 - question_height
+
+                                pdf_canvas.setFillColor(HexColor('#FFFFFF'))
+                                pdf_canvas.setFont("Helvetica-Bold", 25)
+                                pdf_canvas.drawString(520, 47, f"{pdf_canvas.getPageNumber()}")
+                                pdf_canvas.showPage()
+
+                                pdf_canvas.drawImage(background_image, x=0, y=0,
+                                                     width=8.268 * inch,
+                                                     height=11.693 * inch,
+                                                     mask='auto')
+
+                            if first_question:
+                                pdf_canvas.setFillColor(HexColor('#C40001'))
+                                pdf_canvas.setFont("Helvetica-Bold", 18)
+                                pdf_canvas.drawString(20, (y_axis + 14), f"{title_name}")
+                                first_question = False
+
+                            pdf_canvas.roundRect(
+                                10,
+                                y_axis - (0.14 * inch + height + (question_height / 2)),
+                                7.8 * inch,
+                                (0.07 * inch + height + (question_height / 2)), 8,
+                                stroke=True
+                            )
+
+                            pdf_canvas = draw_paragraph(pdf_canvas, msg, 25,
+                                                        (y_axis - question_height / 2) - 10,
+                                                        7.5 * inch,
+                                                        0.75 * inch, message_style)
+
+                            pdf_canvas.setFillColor(HexColor('#FFFFFF'))
+                            msg_width = stringWidth(f"{question[1]}", "Helvetica", 12)
+
+                            pdf_canvas.rect(
+                                25,
+                                (y_axis - question_height / 2),
+                                msg_width + 20,
+                                question_height + 5,
+                                fill=True,
+                                stroke=False
+                            )
+
+                            msg = f"{question[1]}"
+                            pdf_canvas = draw_paragraph(
+                                pdf_canvas,
+                                msg,
+                                30,
+                                (y_axis + (question_height / 2)) - 5, 7.4 * inch,
+                                0.25 * inch,
+                                message_style
+                            )
+
+                            y_axis = y_axis - (y_diff + 40)
+
+                    if y_axis < 255:
+
+                        if first_question:
+                            y_axis = 600
+
+                        else:
+                            y_axis = 625
+
+                        pdf_canvas.setFillColor(HexColor('#FFFFFF'))
+                        pdf_canvas.setFont("Helvetica-Bold", 25)
+                        pdf_canvas.drawString(520, 47, f"{pdf_canvas.getPageNumber()}")
+                        pdf_canvas.showPage()
+                        pdf_canvas.drawImage(background_image, x=0, y=0, width=8.268 * inch,
+                                                height=11.693 * inch, mask='auto')
+            
+            assessment_notes = claim.get('notes')
+
+            if assessment_notes:
+                path_notes = page_background('notes.png')
+                pdf_canvas.drawImage(path_notes, x=0, y=0, width=8.268 * inch,
+                                     height=11.693 * inch,
+                                     mask='auto')
+                height = 550
+                for note in assessment_notes:
+                    check_height = height - 250
+                    if check_height <= 110:
+
+                        pdf_canvas.setFillColor(HexColor('#FFFFFF'))
+                        pdf_canvas.setFont("Helvetica-Bold", 25)
+                        pdf_canvas.drawString(520, 47, f"{pdf_canvas.getPageNumber()}")
+                        pdf_canvas.showPage()
+                        pdf_canvas.drawImage(background_image, x=0, y=0, width=8.268 * inch,
+                                             height=11.693 * inch,
+                                             mask='auto')
+                        height = 625
+
+                        pdf_canvas.setFont("Helvetica-Bold", 10)
+                        pdf_canvas.setFillColor(HexColor('#000000'))
+                        pdf_canvas.drawString(30, height, 'Note description:')
+                        pdf_canvas.drawString(150, height, note['note'])
+                        pdf_canvas.drawString(30, height - 15, 'Picture:')
+                        height = height - 235
+                        pdf_canvas.drawImage(note['file'], 30, height, width=500,
+                                             height=200)
+
+                        height = height - 15
+
+                    else:
+                        pdf_canvas.setFont("Helvetica-Bold", 10)
+                        pdf_canvas.setFillColor(HexColor('#000000'))
+                        pdf_canvas.drawString(30, height, 'Note description:')
+                        pdf_canvas.drawString(150, height, note['note'])
+                        pdf_canvas.drawString(30, height - 15, 'Picture:')
+                        height = height - 235
+                        pdf_canvas.drawImage(note['file'], 30, height, width=500,
+                                             height=200)
+                        height = height - 15
+
+                pdf_canvas.setFillColor(HexColor('#FFFFFF'))
+                pdf_canvas.setFont("Helvetica-Bold", 25)
+                pdf_canvas.drawString(520, 47, f"{pdf_canvas.getPageNumber()}")
+                pdf_canvas.showPage()
+    
+    pdf_canvas.setFillColor(HexColor('#FFFFFF'))
+    pdf_canvas.setFont("Helvetica-Bold", 25)
+    pdf_canvas.drawString(520, 47, f"{pdf_canvas.getPageNumber()}")
+
+    pdf_canvas.save()
+
+    return buffer.getvalue()
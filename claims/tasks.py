@@ -0,0 +1,102 @@
+"""
+Background job handlers for the claim reports.
+
+The handlers are registered by name with ``job_handler`` and run by the
+``run_jobs`` management command, see ``application.jobs``.
+"""
+import os
+import tempfile
+
+from application.jobs import job_handler, PermanentJobError, report_job_progress
+from application.storage import save_s3_file, save_s3_local_file
+from claims.api.services import get_application_report
+from claims.exports import EXPORT_CONTENT_TYPES, write_report_export
+from claims.reports import render_claim_report, report_content_hash, report_file_path
+
+RENDER_CLAIM_REPORT = 'render_claim_report'
+EXPORT_CLAIM_REPORTS = 'export_claim_reports'
+
+
+def claim_report_key(application_id, content_hash):
+    """
+    Idempotency key of the report job of a version of the report data.
+
+    :param application_id:
+        Application id.
+    :param content_hash:
+        Version of the report data.
+    :return:
+        Idempotency key.
+    """
+    return f"claim_report:{application_id}:{content_hash}"
+
+
+@job_handler(RENDER_CLAIM_REPORT)
+def render_application_report(application_id, content_hash=None):
+    """
+    Render the report of an application and store the file.
+
+    The report data is read again when the job runs, so the presigned urls
+    of the files are valid while the report is drawn. The job fails when the
+    data is no longer the version it was queued for, the next report request
+    queues the job of the new version.
+
+    :param application_id:
+        Application id.
+    :param content_hash:
+        Version of the report data the job was queued for, jobs queued
+        without it render the current data.
+    :return:
+        Key of the stored report and the version of its data.
+    """
+    report = get_application_report(application_id)
+
+    if report is None:
+        raise PermanentJobError('Application not found')
+
+    current_hash = report_content_hash(report)
+
+    if content_hash is not None and current_hash != content_hash:
+        raise PermanentJobError('The claim changed after the report was requested')
+
+    file_path = report_file_path(application_id, current_hash)
+    save_s3_file(render_claim_report(report), file_path, content_type='application/pdf')
+
+    return {'file_path': file_path, 'content_hash': current_hash}
+
+
+@job_handler(EXPORT_CLAIM_REPORTS)
+def export_claim_reports(application_ids, export_format, file_path):
+    """
+    Render the reports of applications into one export and store the file.
+
+    The progress of the export is saved with the job after every report.
+
+    :param application_ids:
+        Application ids in the order of the export.
+    :param export_format:
+        'zip' or 'pdf'.
+    :param file_path:
+        Key of the export file.
+    :return:
+        Key of the export, the number of reports and the failed reports.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        export_path = os.path.join(directory, f"export.{export_format}")
+        summary = write_report_export(
+            application_ids,
+            export_format,
+            export_path,
+            progress=report_job_progress
+        )
+
+        if len(summary['failed']) == summary['total']:
+            raise PermanentJobError('None of the reports could be rendered')
+
+        save_s3_local_file(
+            export_path,
+            file_path,
+            content_type=EXPORT_CONTENT_TYPES[export_format]
+        )
+
+    return {'file_path': file_path, 'export_format': export_format, **summary}
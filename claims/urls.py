@@ -69,6 +69,8 @@ urlpatterns = [
     path('get_claim_application/', views.get_claim_application, name="get_claim_application"),
 
     path('report_single_claim/', views.report_single_claim, name="report_single_claim"),
+    path('export_reports/', views.export_reports, name="export_reports"),
+    path('download_report_export/<int:job_id>', views.download_report_export, name="download_report_export"),
     
     path('get_client_claims/', views.get_client_claims, name="get_client_claims"),
     
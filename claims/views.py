@@ -2,24 +2,24 @@
 This module is used for the management of claim applications front end logic
 """
 import io
-import os
 import json
-import pandas as pd
+from application.lazy import lazy_module
 from django.shortcuts import render
 from django.urls import reverse
 from system_management import constants
 from system_management.decorators import check_token_in_session
-from system_management.general_func_classes import host_url, api_connection
-from system_management.amazons3 import upload_to_s3
-from django.http import JsonResponse, FileResponse
+from system_management.general_func_classes import host_url
+from application.api.services import filter_records
+from application.dispatch import dispatch_api
+from application.storage import iter_s3_file, read_s3_file, upload_files_to_s3
+from claims.exports import EXPORT_CONTENT_TYPES
+from claims.tasks import EXPORT_CLAIM_REPORTS
+from claims.reports import draw_paragraph, page_background, paragraph_height
+from django.http import JsonResponse, FileResponse, StreamingHttpResponse
 from django.conf import settings
-from reportlab.lib.colors import HexColor
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import Paragraph, ListFlowable
-from reportlab.lib.units import inch
-from reportlab.pdfbase.pdfmetrics import stringWidth
+
+
+pd = lazy_module('pandas')
 
 
 @check_token_in_session
@@ -48,7 +48,7 @@ def get_claim_application(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="GET", url=url, headers=headers, data=payload)
+        response_data = dispatch_api(method="GET", url=url, headers=headers, data=payload)
 
         status = response_data.get('status')
 
@@ -104,7 +104,7 @@ def create_sub_claim(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload, headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload, headers=headers)
         return JsonResponse(response_data, safe=True)
 
 
@@ -124,7 +124,7 @@ def assessment_preview(request, application_id):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload, headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload, headers=headers)
         status = response_data.get('status')
 
         context = {}
@@ -168,7 +168,7 @@ def manage_application(request, application_id):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="GET", url=url, data=payload, headers=headers)
+        response_data = dispatch_api(method="GET", url=url, data=payload, headers=headers)
         application_data = response_data.get('data')
 
         if application_data:
@@ -183,7 +183,7 @@ def manage_application(request, application_id):
         })
 
         url = f"{host_url(request)}{reverse('get_claim_info_api')}"
-        response_data = api_connection(method="GET", url=url, data=payload, headers=headers)
+        response_data = dispatch_api(method="GET", url=url, data=payload, headers=headers)
         claim_info = response_data.get('data')
 
         if not claim_info:
@@ -239,7 +239,7 @@ def claim_client_add(request):
         'Content-Type': constants.JSON_APPLICATION
     }
 
-    response_data = api_connection(method="GET", url=url, data=payload, headers=headers)
+    response_data = dispatch_api(method="GET", url=url, data=payload, headers=headers)
     providers = get_data_on_success(response_data)
 
     context = {
@@ -302,7 +302,7 @@ def add_claim_client(request):
             "incident_date": incident_date
         })
 
-        response_data = api_connection(method="POST", url=url, data=payload, headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload, headers=headers)
         status = response_data.get('status')
 
         if status == 'success':
@@ -317,8 +317,8 @@ def add_claim_client(request):
                 "client_id": client_id,
             })
 
-            response_data = api_connection(method="POST", url=url, data=payload,
-                                           headers=headers)
+            response_data = dispatch_api(method="POST", url=url, data=payload,
+                                         headers=headers)
 
             status = response_data.get('status')
 
@@ -347,8 +347,8 @@ def add_claim_client(request):
                     "business_phone_number": business_phone_number
                 })
 
-                response_data = api_connection(method="POST", url=url, data=payload,
-                                               headers=headers)
+                response_data = dispatch_api(method="POST", url=url, data=payload,
+                                             headers=headers)
 
                 status = response_data.get('status')
 
@@ -383,7 +383,7 @@ def manage_claims(request):
     }
 
     url = f"{host_url(request)}{reverse('get_claim_categories_api')}"
-    response_data = api_connection(method="GET", url=url, data=payload, headers=headers)
+    response_data = dispatch_api(method="GET", url=url, data=payload, headers=headers)
 
     context = response_data.get('data')
 
@@ -416,8 +416,8 @@ def add_what_category(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -450,8 +450,8 @@ def edit_what_category(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -480,8 +480,8 @@ def del_what_category(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -512,8 +512,8 @@ def add_how_category(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -546,8 +546,8 @@ def edit_how_category(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -576,8 +576,8 @@ def del_how_category(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -608,8 +608,8 @@ def add_cause_category(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -640,8 +640,8 @@ def edit_cause_category(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -670,8 +670,8 @@ def del_cause_category(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -696,75 +696,38 @@ def all_claims(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        url = f"{host_url(request)}{reverse('get_all_claims_api')}"
-        response_data = api_connection(method="GET", url=url, headers=headers, data=payload)
-
-        applications = response_data.get('data')
-        applications_df = pd.DataFrame(applications)
-
-        if not applications_df.empty:
-            if user_role == constants.ADMIN:
-                completed_applications = applications_df[
-                    applications_df['application_status__name'] == 'Completed'
-                ].to_dict('records')
-
-                pending_applications = applications_df[
-                    applications_df['application_status__name'] == 'Pending'
-                ].to_dict('records')
-
-                scheduled_applications = applications_df[
-                    applications_df['application_status__name'] == 'Scheduled'
-                ].to_dict('records')
-
-            elif user_role == constants.ASSESSOR:
-                user_id = request.session.get('user_id')
-                completed_applications = applications_df[
-                    (applications_df['application_status__name'] == 'Completed') &
-                    (applications_df['assessor_id'] == user_id)
-                ].to_dict('records')
-
-                pending_applications = applications_df[
-                    (applications_df['application_status__name'] == 'Pending') &
-                    (applications_df['assessor_id'] == user_id)
-                ].to_dict('records')
-
-                scheduled_applications = applications_df[
-                    (applications_df['application_status__name'] == 'Scheduled') &
-                    (applications_df['assessor_id'] == user_id)
-                ].to_dict('records')
-                
-            else:
-                completed_applications = []
-                pending_applications = []
-                scheduled_applications = []
-        else:
-            completed_applications = []
-            pending_applications = []
-            scheduled_applications = []
+        if user_role == constants.ADMIN:
+            tabs = get_claim_tabs(request, headers, {})
 
-        scheduled_claims = len(scheduled_applications)
-        pending_claims = len(pending_applications)
-        complete_claims = len(completed_applications)
+        elif user_role == constants.ASSESSOR:
+            tabs = get_claim_tabs(request, headers, {
+                'assessor_id': request.session.get('user_id')
+            })
+
+        else:
+            tabs = {
+                "scheduled_claims": 0,
+                "pending_claims": 0,
+                "complete_claims": 0,
+                "completed_applications": [],
+                "pending_applications": [],
+                "scheduled_applications": []
+            }
 
         url = f"{host_url(request)}{reverse('get_all_assessors_api')}"
-        response_data = api_connection(method="GET", url=url, headers=headers, data=payload)
+        response_data = dispatch_api(method="GET", url=url, headers=headers, data=payload)
 
         assessors = get_data_on_success(response_data)
 
         url = f"{host_url(request)}{reverse('get_application_types_api')}"
-        response_data = api_connection(method="GET", url=url, data=payload, headers=headers)
+        response_data = dispatch_api(method="GET", url=url, data=payload, headers=headers)
 
         application_types = get_data_on_success(response_data)
 
         context = {
             "assessors": assessors,
             "application_types": application_types,
-            "scheduled_claims": scheduled_claims,
-            "pending_claims": pending_claims,
-            "complete_claims": complete_claims,
-            "completed_applications": completed_applications,
-            "pending_applications": pending_applications,
-            "scheduled_applications": scheduled_applications
+            **tabs
         }
 
         return render(request, 'claims/claims.html', context)
@@ -789,57 +752,22 @@ def assessor_claims(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        url = f"{host_url(request)}{reverse('get_all_claims_api')}"
-        response_data = api_connection(method="GET", url=url, headers=headers, data=payload)
-
-        applications = response_data.get('data')
-
-        applications_df = pd.DataFrame(applications)
-
-        if not applications_df.empty:
-            completed_applications = applications_df[
-                (applications_df['application_status__name'] == 'Completed') &
-                (applications_df['assessor_id'] == user_id)
-                ].to_dict('records')
-
-            pending_applications = applications_df[
-                (applications_df['application_status__name'] == 'Pending') &
-                (applications_df['assessor_id'] == user_id)
-                ].to_dict('records')
-
-            scheduled_applications = applications_df[
-                (applications_df['application_status__name'] == 'Scheduled') &
-                (applications_df['assessor_id'] == user_id)
-                ].to_dict('records')
-
-        else:
-            completed_applications = []
-            pending_applications = []
-            scheduled_applications = []
-
-        scheduled_claims = len(scheduled_applications)
-        pending_claims = len(pending_applications)
-        complete_claims = len(completed_applications)
+        tabs = get_claim_tabs(request, headers, {'assessor_id': user_id})
 
         url = f"{host_url(request)}{reverse('get_all_assessors_api')}"
-        response_data = api_connection(method="GET", url=url, headers=headers, data=payload)
+        response_data = dispatch_api(method="GET", url=url, headers=headers, data=payload)
 
         assessors = get_data_on_success(response_data)
 
         url = f"{host_url(request)}{reverse('get_application_types_api')}"
-        response_data = api_connection(method="GET", url=url, data=payload, headers=headers)
+        response_data = dispatch_api(method="GET", url=url, data=payload, headers=headers)
 
         application_types = get_data_on_success(response_data)
 
         context = {
             "assessors": assessors,
             "application_types": application_types,
-            "scheduled_claims": scheduled_claims,
-            "pending_claims": pending_claims,
-            "complete_claims": complete_claims,
-            "completed_applications": completed_applications,
-            "pending_applications": pending_applications,
-            "scheduled_applications": scheduled_applications
+            **tabs
         }
 
         return render(request, 'assessor/assessor.html', context)
@@ -880,8 +808,8 @@ def edit_client_application(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
         return JsonResponse(response_data, safe=False)
 
 
@@ -920,8 +848,8 @@ def edit_business_application(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
         return JsonResponse(response_data, safe=False)
 
 
@@ -960,11 +888,60 @@ def edit_claim_application(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
         return JsonResponse(response_data, safe=False)
 
 
+def get_claim_tabs(request, headers, filters):
+    """
+    Collect the applications of each claim status tab and the tab counts.
+
+    Every application of a tab is collected unless LISTING_PAGE_SIZE is set,
+    then the tabs show one page and the next page of a tab is requested with
+    ``<status>_cursor`` in the query string, e.g. ``?pending_cursor=<cursor>``.
+
+    :param request:
+        Django request parameter.
+    :param headers:
+        Api headers with the session token.
+    :param filters:
+        Listing filters applied to every tab e.g. the assessor id.
+    :return:
+        Context with the applications, counts and next cursors of each tab.
+    """
+    url = f"{host_url(request)}{reverse('get_claims_count_api')}"
+    response_data = dispatch_api(method="GET", url=url, headers=headers,
+                                 data=json.dumps(filters))
+    counts = get_data_on_success(response_data) or {}
+
+    context = {
+        "scheduled_claims": counts.get('Scheduled', 0),
+        "pending_claims": counts.get('Pending', 0),
+        "complete_claims": counts.get('Completed', 0),
+    }
+
+    url = f"{host_url(request)}{reverse('get_all_claims_api')}"
+    for status_name, tab_name in (('Completed', 'completed'), ('Pending', 'pending'),
+                                  ('Scheduled', 'scheduled')):
+        data = {
+            **filters,
+            'status': status_name
+        }
+
+        if settings.LISTING_PAGE_SIZE:
+            data['page_size'] = settings.LISTING_PAGE_SIZE
+            data['cursor'] = request.GET.get(f'{tab_name}_cursor')
+
+        payload = json.dumps(data)
+        response_data = dispatch_api(method="GET", url=url, headers=headers, data=payload)
+
+        context[f"{tab_name}_applications"] = get_data_on_success(response_data)
+        context[f"{tab_name}_next_cursor"] = response_data.get('next_cursor')
+
+    return context
+
+
 def get_data_on_success(response_data):
     status = response_data.get('status')
     if status == 'success':
@@ -1001,8 +978,8 @@ def change_application_type(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         status = response_data.get('status')
         if status == 'success':
@@ -1012,7 +989,7 @@ def change_application_type(request):
             })
             url = f"{host_url(request)}{reverse('application_type_categories_api')}"
 
-            response_data = api_connection(method="GET", url=url, data=payload, headers=headers)
+            response_data = dispatch_api(method="GET", url=url, data=payload, headers=headers)
             status = response_data.get('status')
 
             if status == 'success':
@@ -1069,8 +1046,8 @@ def assign_what_application(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -1102,8 +1079,8 @@ def assign_how_application(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -1135,8 +1112,8 @@ def assign_cause_application(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -1168,8 +1145,8 @@ def how_category_questions(request, how_id):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="GET", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="GET", url=url, data=payload,
+                                     headers=headers)
 
         question_titles = get_data_on_success(response_data)
 
@@ -1211,8 +1188,8 @@ def what_category_questions(request, what_id):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="GET", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="GET", url=url, data=payload,
+                                     headers=headers)
         question_titles = get_data_on_success(response_data)
 
         what_category = response_data.get('what_category')
@@ -1251,8 +1228,8 @@ def create_how_title(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -1284,8 +1261,8 @@ def create_what_title(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -1325,8 +1302,8 @@ def create_how_question(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -1366,8 +1343,8 @@ def create_what_question(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -1389,19 +1366,24 @@ def save_claim_questions(request):
         application_id = request.POST.get('application_id')
         what_answers = request.POST.getlist('what_answers[]')
         how_answers = request.POST.getlist('how_answers[]')
-        if what_answers:
-            what_answers = [json.loads(answer) for answer in what_answers]
-            df_what = pd.DataFrame(what_answers)
-            df_what = df_what.apply(lambda series:
-                                    save_file_s3(request, series, application_id, claim_id), axis=1)
-            what_answers = df_what.to_dict('records')
-
-        if how_answers:
-            how_answers = [json.loads(answer) for answer in how_answers]
-            df_how = pd.DataFrame(how_answers)
-            df_how = df_how.apply(lambda series:
-                                  save_file_s3(request, series, application_id, claim_id), axis=1)
-            how_answers = df_how.to_dict('records')
+        what_answers = [json.loads(answer) for answer in what_answers]
+        how_answers = [json.loads(answer) for answer in how_answers]
+
+        upload_results = save_files_s3(
+            request, what_answers + how_answers, application_id, claim_id
+        )
+        failed_uploads = [
+            result for result in upload_results
+            if result['status'] != 'success'
+        ]
+
+        if failed_uploads:
+            response_data = {
+                'status': 'error',
+                'message': 'Files could not be uploaded, please try again',
+                'data': failed_uploads
+            }
+            return JsonResponse(response_data, safe=False)
 
         token = request.session.get('token')
         url = f"{host_url(request)}{reverse('save_claim_questions_api')}"
@@ -1417,40 +1399,51 @@ def save_claim_questions(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
 
-def save_file_s3(request, series, application_id, claim_id):
+def save_files_s3(request, answers, application_id, claim_id):
     """
-    Save file to s3 bucket.
+    Save the files of the file answers to the s3 bucket at the same time.
     
     :param request:
         Django request parameter with file info.
 
-    :param series:
-        Series of question.
+    :param answers:
+        Answers of the claim questions, the answer of a file question is
+        replaced with the link of the uploaded file.
 
     :param application_id:
         Application id.
+
+    :param claim_id:
+        Claim id.
     
     :return:
-        Series of question.
+        Upload result of every file answer.
 
     """
-    answer = series['answer']
-    question_type = series['question_type']
-    if question_type == 'file':
-        file = request.FILES.get(answer)
-        file_name = file.name
-        file_extension = file_name.split('.')[-1]
-        survey_answer = f"survey_{claim_id}/{answer}.{file_extension}"
-        file_path = f"application_files/application_{application_id}/{survey_answer}"
-        file_link = upload_to_s3(file, file_path)
-        series['answer'] = file_link
-    return series
+    file_answers = []
+    uploads = []
+    for answer in answers:
+        if answer['question_type'] == 'file':
+            file = request.FILES.get(answer['answer'])
+            file_extension = file.name.split('.')[-1] if file else ''
+            survey_answer = f"survey_{claim_id}/{answer['answer']}.{file_extension}"
+            file_path = f"application_files/application_{application_id}/{survey_answer}"
+            file_answers.append(answer)
+            uploads.append((file, file_path))
+
+    upload_results = upload_files_to_s3(uploads)
+
+    for answer, result in zip(file_answers, upload_results):
+        if result['status'] == 'success':
+            answer['answer'] = result['url']
+
+    return upload_results
 
 
 @check_token_in_session
@@ -1480,8 +1473,8 @@ def edit_title_how(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -1513,8 +1506,8 @@ def edit_title_what(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -1544,8 +1537,8 @@ def delete_title_how(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -1575,8 +1568,8 @@ def delete_title_what(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -1616,8 +1609,8 @@ def edit_how_question(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -1657,8 +1650,8 @@ def edit_what_question(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -1688,8 +1681,8 @@ def delete_what_question(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -1719,8 +1712,8 @@ def delete_how_question(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(method="POST", url=url, data=payload,
-                                       headers=headers)
+        response_data = dispatch_api(method="POST", url=url, data=payload,
+                                     headers=headers)
 
         return JsonResponse(response_data, safe=False)
 
@@ -1730,6 +1723,10 @@ def generate_report_claim(request, application_id):
     """
     Generate report all claims.
 
+    The report is rendered by a background job and stored until the claim
+    data changes. While the job runs the job status is returned, with a
+    202 status, and the client polls get_job_status_api.
+
     :param request:
         Django incoming request
     
@@ -1737,10 +1734,10 @@ def generate_report_claim(request, application_id):
         Current application id
 
     :param return:
-        PDF for claim application
+        PDF for claim application or the report job status
     """
     if request.method == "GET":
-        url = f"{host_url(request)}{reverse('generate_report_claim_api')}"
+        url = f"{host_url(request)}{reverse('claim_report_api')}"
 
         payload = json.dumps({
             "application_id": application_id
@@ -1751,7 +1748,7 @@ def generate_report_claim(request, application_id):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(
+        response_data = dispatch_api(
             method="POST",
             url=url,
             headers=headers,
@@ -1766,565 +1763,14 @@ def generate_report_claim(request, application_id):
         if status != 'success':
             return JsonResponse(response_data, safe=True)
 
-        application = response_data.get('data')
-        client_object = application.get('client')
-        client_incident = client_object.get('client_incident')
-        assessment = application.get('assessment')
-        assessment_exists = False
-
-        if assessment:
-            assessment_exists = True
-            assessment = application.get('assessment')[0]
-
-        buffer = io.BytesIO()
-        styles = getSampleStyleSheet()
-        pdf_canvas = canvas.Canvas(buffer, pagesize=A4)
-        pdf_canvas.setTitle(f"Assessment-Report-{str(application['id'])}")
-        base_image = os.path.join(settings.BASE_DIR, "system_management", "static", 'images',
-                                  'claim')
-        path_cover = os.path.join(base_image, 'Cover.png')
-        pdf_canvas.drawImage(path_cover, x=0, y=0, width=8.268 * inch, height=11.693 * inch,
-                             mask='auto')
-
-        pdf_canvas.setFillColor(HexColor('#FFFFFF'))
-        pdf_canvas.setFont("Helvetica", 14)
-        pdf_canvas.drawString(22, 225,
-                              f"{client_object['first_name']} {client_object['last_name']}")
-
-        pdf_canvas.setFillColor(HexColor('#FFFFFF'))
-        pdf_canvas.setFont("Helvetica", 14)
-        pdf_canvas.drawString(22, 155,
-                              f"{application['assessor_id__first_name']} {application['assessor_id__last_name']}")
-
-        pdf_canvas.setFillColor(HexColor('#FFFFFF'))
-        pdf_canvas.setFont("Helvetica", 14)
-        pdf_canvas.drawString(22, 80, f"{client_object['insurer__insurance_name']}")
-
-        pdf_canvas.setFillColor(HexColor('#FFFFFF'))
-        pdf_canvas.setFont("Helvetica", 14)
-        pdf_canvas.drawString(320, 225, f"{client_object['policy_no']}")
-
-        pdf_canvas.setFillColor(HexColor('#FFFFFF'))
-        pdf_canvas.setFont("Helvetica", 14)
-        pdf_canvas.drawString(320, 155, f"{client_object['client_incident']['date_of_incident']}")
-
-        pdf_canvas.setFillColor(HexColor('#FFFFFF'))
-        pdf_canvas.setFont("Helvetica", 14)
-
-        if assessment_exists:
-            pdf_canvas.drawString(320, 80,
-                                  f"{assessment['scheduled_date_time']}")
-        else:
-            pdf_canvas.drawString(320, 80, "No date scheduled")
-        pdf_canvas.showPage()
-
-        path_client = os.path.join(base_image, 'client.png')
-        pdf_canvas.drawImage(path_client, x=0, y=0, width=8.268 * inch, height=11.693 * inch,
-                             mask='auto')
-
-        message_style = styles['Normal']
-        message_style.textColor = HexColor('#000000')
-        message_style.fontSize = 12
-
-        msg = f"{client_object['first_name']} {client_object['last_name']}"
-        pdf_canvas = draw_paragraph(
-            pdf_canvas=pdf_canvas,
-            msg=msg,
-            x=105,
-            y=585,
-            max_height=300,
-            max_width=300,
-            message_style=message_style
-        )
-
-        msg = f"{client_object['id_number']}"
-        pdf_canvas = draw_paragraph(
-            pdf_canvas=pdf_canvas,
-            msg=msg,
-            x=105,
-            y=540,
-            max_height=300,
-            max_width=300,
-            message_style=message_style
-        )
-
-        msg = f"{client_object['phone_number']}"
-        pdf_canvas = draw_paragraph(
-            pdf_canvas=pdf_canvas,
-            msg=msg,
-            x=360,
-            y=540,
-            max_height=300,
-            max_width=300,
-            message_style=message_style
-        )
-
-        client_address = f"""
-        {client_incident['street_address']},{client_incident['city']},{client_incident['province']},{client_incident['postal_code']}
-        """
-
-        msg = f"{client_address}"
-        pdf_canvas = draw_paragraph(
-            pdf_canvas=pdf_canvas,
-            msg=msg,
-            x=105,
-            y=513,
-            max_height=300,
-            max_width=300,
-            message_style=message_style
-        )
-
-        msg = f"{client_incident['postal_code']}"
-        pdf_canvas = draw_paragraph(
-            pdf_canvas=pdf_canvas,
-            msg=msg,
-            x=360,
-            y=445,
-            max_height=300,
-            max_width=300,
-            message_style=message_style
-        )
-
-        msg = f"{client_object['policy_no']}"
-        pdf_canvas = draw_paragraph(
-            pdf_canvas=pdf_canvas,
-            msg=msg,
-            x=105,
-            y=445,
-            max_height=300,
-            max_width=300,
-            message_style=message_style
-        )
-
-        msg = f"{client_object['email']}"
-        pdf_canvas = draw_paragraph(
-            pdf_canvas=pdf_canvas,
-            msg=msg,
-            x=105,
-            y=400,
-            max_height=300,
-            max_width=300,
-            message_style=message_style
-        )
-
-        msg = f"{application['date_created']}"
-        pdf_canvas = draw_paragraph(
-            pdf_canvas=pdf_canvas,
-            msg=msg,
-            x=105,
-            y=260,
-            max_height=300,
-            max_width=300,
-            message_style=message_style
-        )
-
-        msg = f"{client_incident['date_of_incident']}"
-        pdf_canvas = draw_paragraph(
-            pdf_canvas=pdf_canvas,
-            msg=msg,
-            x=360,
-            y=260,
-            max_height=300,
-            max_width=300,
-            message_style=message_style
-        )
-
-        msg = f"{client_object['insurer__insurance_name']}"
-        pdf_canvas = draw_paragraph(
-            pdf_canvas=pdf_canvas,
-            msg=msg,
-            x=105,
-            y=220,
-            max_height=300,
-            max_width=300,
-            message_style=message_style
-        )
-
-        application_type = "Multi"
-
-        msg = f"{application_type}"
-        pdf_canvas = draw_paragraph(
-            pdf_canvas=pdf_canvas,
-            msg=msg,
-            x=105,
-            y=175,
-            max_height=300,
-            max_width=300,
-            message_style=message_style
-        )
-
-        pdf_canvas.setFillColor(HexColor('#FFFFFF'))
-        pdf_canvas.setFont("Helvetica-Bold", 25)
-        pdf_canvas.drawString(520, 47, f"{pdf_canvas.getPageNumber()}")
-        pdf_canvas.showPage()
-
-        claims = application.get('claims')
-        if claims:
-            for claim in claims:
-                if claim['application_type__name'] == 'Business':
-                    path_business = os.path.join(base_image, 'business.png')
-                    pdf_canvas.drawImage(path_business, x=0, y=0, width=8.268 * inch,
-                                         height=11.693 * inch,
-                                         mask='auto')
-
-                    pdf_canvas.showPage()
-
-                elif claim['application_type__name'] == 'Personal':
-                    path_personal = os.path.join(base_image, 'personal.png')
-                    pdf_canvas.drawImage(path_personal, x=0, y=0, width=8.268 * inch,
-                                         height=11.693 * inch,
-                                         mask='auto')
-                    pdf_canvas.showPage()
-
-                path_overview = os.path.join(base_image, 'overview.png')
-                pdf_canvas.drawImage(path_overview, x=0, y=0, width=8.268 * inch,
-                                     height=11.693 * inch,
-                                     mask='auto')
-
-                message_style = styles['Normal']
-                message_style.textColor = HexColor('#000000')
-                message_style.fontSize = 18
-                message_style.fontName = 'Helvetica-Bold'
-
-                msg = f"{claim['application_type__name']}"
-                pdf_canvas = draw_paragraph(
-                    pdf_canvas=pdf_canvas,
-                    msg=msg,
-                    x=195,
-                    y=485,
-                    max_height=300,
-                    max_width=300,
-                    message_style=message_style
-                )
-                if claim['application_cause'] == '':
-                    msg = "Unselected"
-                else:
-                    msg = f"{claim['application_cause']['cause_id__name']}"
-
-                pdf_canvas = draw_paragraph(
-                    pdf_canvas=pdf_canvas,
-                    msg=msg,
-                    x=195,
-                    y=380,
-                    max_height=300,
-                    max_width=300,
-                    message_style=message_style
-                )
-
-                if claim['application_what'] == '':
-                    msg = "Unselected"
-                else:
-                    msg = f"{claim['application_what']['what_id__name']}"
-
-                pdf_canvas = draw_paragraph(
-                    pdf_canvas=pdf_canvas,
-                    msg=msg,
-                    x=195,
-                    y=275,
-                    max_height=300,
-                    max_width=300,
-                    message_style=message_style
-                )
-
-                if claim['application_how'] == '':
-                    msg = "Unselected"
-                else:
-                    msg = f"{claim['application_how']['how_id__name']}"
-
-                pdf_canvas = draw_paragraph(
-                    pdf_canvas=pdf_canvas,
-                    msg=msg,
-                    x=195,
-                    y=160,
-                    max_height=300,
-                    max_width=300,
-                    message_style=message_style
-                )
-
-                pdf_canvas.setFillColor(HexColor('#FFFFFF'))
-                pdf_canvas.setFont("Helvetica-Bold", 25)
-                pdf_canvas.drawString(520, 47, f"{pdf_canvas.getPageNumber()}")
-                pdf_canvas.showPage()
-
-                list_columns = ['title', 'questions']
-
-                how_questions = pd.DataFrame(columns=list_columns)
-                what_questions = pd.DataFrame(columns=list_columns)
-                
-                if 'details' in claim:
-                    details = claim['details']
-                    how_questions_list = details['how_questions']
-                    what_questions_list = details['what_questions']
-                    
-                    if not how_questions_list == '':
-                        how_questions = pd.DataFrame(how_questions_list)
-                    
-                    if not what_questions_list == '':
-                        what_questions = pd.DataFrame(what_questions_list)
-
-                if not how_questions.empty and not what_questions.empty:
-                    how_questions = how_questions[list_columns]
-                    what_questions = what_questions[list_columns]
-                    questions = pd.concat([what_questions, how_questions])
-
-                elif not how_questions.empty and what_questions.empty:
-                    questions = how_questions[list_columns]
-
-                elif not what_questions.empty and how_questions.empty:
-                    questions = what_questions[list_columns]
-                
-                else:
-                    questions = pd.DataFrame(columns=list_columns)
-
-                background_image = os.path.join(base_image, 'Back.png')
-
-                message_style = styles['Normal']
-                message_style.textColor = HexColor('#000000')
-                message_style.fontSize = 12
-                message_style.fontName = 'Helvetica'
-
-                if not questions.empty:
-                    
-                    path_question = os.path.join(base_image, 'question.png')
-                    pdf_canvas.drawImage(path_question, x=0, y=0, width=8.268 * inch,
-                                         height=11.693 * inch,
-                                         mask='auto')
-                    y_axis = 550
-
-                    for _, title in questions.iterrows():
-
-                        title_name = title['title']
-                        question_answers_df = pd.DataFrame(title['questions'])
-                        question_answers_df = question_answers_df.assign(
-                            title=title_name
-                        )
-
-                        question_answers_df = question_answers_df.fillna('')
-                        question_answers_df = question_answers_df.loc[
-                            (question_answers_df['answer'] != "")]
-                        question_answers_df = question_answers_df.loc[
-                            ~(question_answers_df['answer'].isnull())]
-
-                        list_columns = [
-                            'title',
-                            'question',
-                            'answer',
-                            'question_type',
-                            'has_file'
-                        ]
-                        group_answers_df = question_answers_df[list_columns]
-                        group_answers_df = group_answers_df.sort_values(by=['has_file'],
-                                                                        ascending=False)
-                        group_answers_df['answer'] = group_answers_df['answer'].apply(
-                            lambda answer:
-                            answer[0]['answer']
-                        )
-                        data = list(group_answers_df.values.tolist())
-
-                        if not data:
-                            continue
-
-                        first_question = True
-
-                        for question in data:
-
-                            if type(question[2]) == list:
-                                question[2] = question[2][0]
-
-                            if str(question[3]) == 'file':
-                                height = 250
-                                y_axis_check = y_axis - height
-
-                                if y_axis_check < 130:
-                                    y_axis = 625
-
-                                    pdf_canvas.setFillColor(HexColor('#FFFFFF'))
-                                    pdf_canvas.setFont("Helvetica-Bold", 25)
-                                    pdf_canvas.drawString(520, 47, f"{pdf_canvas.getPageNumber()}")
-                                    pdf_canvas.showPage()
-                                    pdf_canvas.drawImage(background_image, x=0, y=0,
-                                                         width=8.268 * inch,
-                                                         height=11.693 * inch,
-                                                         mask='auto')
-
-                                if first_question:
-                                    pdf_canvas.setFillColor(HexColor('#C40001'))
-                                    pdf_canvas.setFont("Helvetica-Bold", 18)
-                                    pdf_canvas.drawString(20, (y_axis + 14), f"{title_name}")
-                                    first_question = False
-
-                                pdf_canvas.roundRect(10, y_axis - (0.14 * inch + height),
-                                                     7.8 * inch,
-                                                     (0.07 * inch + height), 8,
-                                                     stroke=True)
-                                pdf_canvas.drawImage(str(question[2]), 25,
-                                                     (y_axis - height + 30), 200, 180)
-
-                                pdf_canvas.setFillColor(HexColor('#FFFFFF'))
-                                msg_width = stringWidth(f"{question[1]}", "Helvetica", 12)
-                                pdf_canvas.rect(25, y_axis - 0.12 * inch, msg_width, 0.25 * inch,
-                                                fill=True,
-                                                stroke=False)
-
-                                msg = f"{question[1]}"
-                                message_style = styles['Normal']
-                                message_style.textColor = HexColor('#000000')
-                                pdf_canvas = draw_paragraph(pdf_canvas, msg, 30,
-                                                            y_axis + 0.03 * inch,
-                                                            7.5 * inch, 0.25 * inch,
-                                                            message_style)
-
-                                y_axis = y_axis - (height + 40)
-
-                            else:
-
-                                msg = f"{question[2]}"
-                                message_style = styles['Normal']
-                                message_style.textColor = HexColor('#000000')
-                                height = paragraph_height(pdf_canvas, question[2],
-                                                          7.5 * inch,
-                                                          0.75 * inch,
-                                                          message_style)
-
-                                question_height = paragraph_height(pdf_canvas, question[1],
-                                                                   7.5 * inch,
-                                                                   0.25 * inch, message_style)
-
-                                if height < 0.75 * inch:
-                                    height = 0.75 * inch
-
-                                y_diff = height + question_height
-                                y_axis_check = y_axis - question_height
-
-                                if y_axis_check < 130:
-                                    y_axis = 625 - question_height
-
-                                    pdf_canvas.setFillColor(HexColor('#FFFFFF'))
-                                    pdf_canvas.setFont("Helvetica-Bold", 25)
-                                    pdf_canvas.drawString(520, 47, f"{pdf_canvas.getPageNumber()}")
-                                    pdf_canvas.showPage()
-
-                                    pdf_canvas.drawImage(background_image, x=0, y=0,
-                                                         width=8.268 * inch,
-                                                         height=11.693 * inch,
-                                                         mask='auto')
-
-                                if first_question:
-                                    pdf_canvas.setFillColor(HexColor('#C40001'))
-                                    pdf_canvas.setFont("Helvetica-Bold", 18)
-                                    pdf_canvas.drawString(20, (y_axis + 14), f"{title_name}")
-                                    first_question = False
-
-                                pdf_canvas.roundRect(
-                                    10,
-                                    y_axis - (0.14 * inch + height + (question_height / 2)),
-                                    7.8 * inch,
-                                    (0.07 * inch + height + (question_height / 2)), 8,
-                                    stroke=True
-                                )
-
-                                pdf_canvas = draw_paragraph(pdf_canvas, msg, 25,
-                                                            (y_axis - question_height / 2) - 10,
-                                                            7.5 * inch,
-                                                            0.75 * inch, message_style)
-
-                                pdf_canvas.setFillColor(HexColor('#FFFFFF'))
-                                msg_width = stringWidth(f"{question[1]}", "Helvetica", 12)
-
-                                pdf_canvas.rect(
-                                    25,
-                                    (y_axis - question_height / 2),
-                                    msg_width + 20,
-                                    question_height + 5,
-                                    fill=True,
-                                    stroke=False
-                                )
-
-                                msg = f"{question[1]}"
-                                pdf_canvas = draw_paragraph(
-                                    pdf_canvas,
-                                    msg,
-                                    30,
-                                    (y_axis + (question_height / 2)) - 5, 7.4 * inch,
-                                    0.25 * inch,
-                                    message_style
-                                )
-
-                                y_axis = y_axis - (y_diff + 40)
-
-                        if y_axis < 255:
-
-                            if first_question:
-                                y_axis = 600
-
-                            else:
-                                y_axis = 625
-
-                            pdf_canvas.setFillColor(HexColor('#FFFFFF'))
-                            pdf_canvas.setFont("Helvetica-Bold", 25)
-                            pdf_canvas.drawString(520, 47, f"{pdf_canvas.getPageNumber()}")
-                            pdf_canvas.showPage()
-                            pdf_canvas.drawImage(background_image, x=0, y=0, width=8.268 * inch,
-                                                    height=11.693 * inch, mask='auto')
-                
-                assessment_notes = claim.get('notes')
-
-                if assessment_notes:
-                    path_notes = os.path.join(base_image, 'notes.png')
-                    pdf_canvas.drawImage(path_notes, x=0, y=0, width=8.268 * inch,
-                                         height=11.693 * inch,
-                                         mask='auto')
-                    height = 550
-                    for note in assessment_notes:
-                        check_height = height - 250
-                        if check_height <= 110:
-
-                            pdf_canvas.setFillColor(HexColor('#FFFFFF'))
-                            pdf_canvas.setFont("Helvetica-Bold", 25)
-                            pdf_canvas.drawString(520, 47, f"{pdf_canvas.getPageNumber()}")
-                            pdf_canvas.showPage()
-                            pdf_canvas.drawImage(background_image, x=0, y=0, width=8.268 * inch,
-                                                 height=11.693 * inch,
-                                                 mask='auto')
-                            height = 625
-
-                            pdf_canvas.setFont("Helvetica-Bold", 10)
-                            pdf_canvas.setFillColor(HexColor('#000000'))
-                            pdf_canvas.drawString(30, height, 'Note description:')
-                            pdf_canvas.drawString(150, height, note['note'])
-                            pdf_canvas.drawString(30, height - 15, 'Picture:')
-                            height = height - 235
-                            pdf_canvas.drawImage(note['file'], 30, height, width=500,
-                                                 height=200)
-
-                            height = height - 15
-
-                        else:
-                            pdf_canvas.setFont("Helvetica-Bold", 10)
-                            pdf_canvas.setFillColor(HexColor('#000000'))
-                            pdf_canvas.drawString(30, height, 'Note description:')
-                            pdf_canvas.drawString(150, height, note['note'])
-                            pdf_canvas.drawString(30, height - 15, 'Picture:')
-                            height = height - 235
-                            pdf_canvas.drawImage(note['file'], 30, height, width=500,
-                                                 height=200)
-                            height = height - 15
-
-                    pdf_canvas.setFillColor(HexColor('#FFFFFF'))
-                    pdf_canvas.setFont("Helvetica-Bold", 25)
-                    pdf_canvas.drawString(520, 47, f"{pdf_canvas.getPageNumber()}")
-                    pdf_canvas.showPage()
-        
-        pdf_canvas.setFillColor(HexColor('#FFFFFF'))
-        pdf_canvas.setFont("Helvetica-Bold", 25)
-        pdf_canvas.drawString(520, 47, f"{pdf_canvas.getPageNumber()}")
+        job = response_data.get('data')
 
-        pdf_canvas.save()
+        if job['status'] != 'succeeded':
+            return JsonResponse(response_data, status=202, safe=True)
 
-        buffer.seek(0)
-        filename = f"Assessment-Report-{str(application['id'])}.pdf"
+        filename = f"Assessment-Report-{str(application_id)}.pdf"
         return FileResponse(
-            buffer,
+            io.BytesIO(read_s3_file(job['result']['file_path'])),
             content_type='application/pdf',
             as_attachment=False,
             filename=filename
@@ -2342,6 +1788,14 @@ def report_single_claim(request):
     :param return:
         PDF for claim application
     """
+    # pylint: disable=import-outside-toplevel
+    from reportlab.lib.colors import HexColor
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import inch
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
     if request.method == "POST":
         claim_id = request.POST.get('claim_id')
         url = f"{host_url(request)}{reverse('report_single_claim_api')}"
@@ -2355,7 +1809,7 @@ def report_single_claim(request):
             'Content-Type': constants.JSON_APPLICATION
         }
 
-        response_data = api_connection(
+        response_data = dispatch_api(
             method="POST",
             url=url,
             headers=headers,
@@ -2386,9 +1840,7 @@ def report_single_claim(request):
         styles = getSampleStyleSheet()
         pdf_canvas = canvas.Canvas(buffer, pagesize=A4)
         pdf_canvas.setTitle(f"Assessment-Report-Claim-{str(claim_id)}")
-        base_image = os.path.join(settings.BASE_DIR, "system_management", "static", 'images',
-                                  'claim')
-        path_cover = os.path.join(base_image, 'Cover.png')
+        path_cover = page_background('Cover.png')
         pdf_canvas.drawImage(path_cover, x=0, y=0, width=8.268 * inch, height=11.693 * inch,
                              mask='auto')
 
@@ -2419,7 +1871,7 @@ def report_single_claim(request):
             pdf_canvas.drawString(320, 80, "No date scheduled")
         pdf_canvas.showPage()
 
-        path_client = os.path.join(base_image, 'client.png')
+        path_client = page_background('client.png')
         pdf_canvas.drawImage(path_client, x=0, y=0, width=8.268 * inch, height=11.693 * inch,
                              mask='auto')
 
@@ -2563,7 +2015,7 @@ def report_single_claim(request):
 
         if claim:
             if claim['application_type__name'] == 'Business':
-                path_business = os.path.join(base_image, 'business.png')
+                path_business = page_background('business.png')
                 pdf_canvas.drawImage(path_business, x=0, y=0, width=8.268 * inch,
                                      height=11.693 * inch,
                                      mask='auto')
@@ -2571,13 +2023,13 @@ def report_single_claim(request):
                 pdf_canvas.showPage()
 
             elif claim['application_type__name'] == 'Personal':
-                path_personal = os.path.join(base_image, 'personal.png')
+                path_personal = page_background('personal.png')
                 pdf_canvas.drawImage(path_personal, x=0, y=0, width=8.268 * inch,
                                      height=11.693 * inch,
                                      mask='auto')
                 pdf_canvas.showPage()
 
-            path_overview = os.path.join(base_image, 'overview.png')
+            path_overview = page_background('overview.png')
             pdf_canvas.drawImage(path_overview, x=0, y=0, width=8.268 * inch, height=11.693 * inch,
                                  mask='auto')
 
@@ -2672,7 +2124,7 @@ def report_single_claim(request):
             else:
                 questions = pd.DataFrame(columns=list_columns)
 
-            background_image = os.path.join(base_image, 'Back.png')
+            background_image = page_background('Back.png')
 
             message_style = styles['Normal']
             message_style.textColor = HexColor('#000000')
@@ -2680,7 +2132,7 @@ def report_single_claim(request):
             message_style.fontName = 'Helvetica'
 
             if not questions.empty:
-                path_question = os.path.join(base_image, 'question.png')
+                path_question = page_background('question.png')
                 pdf_canvas.drawImage(path_question, x=0, y=0, width=8.268 * inch,
                                      height=11.693 * inch,
                                      mask='auto')
@@ -2862,7 +2314,7 @@ def report_single_claim(request):
             assessment_notes = claim.get('notes')
 
             if assessment_notes:
-                path_notes = os.path.join(base_image, 'notes.png')
+                path_notes = page_background('notes.png')
                 pdf_canvas.drawImage(path_notes, x=0, y=0, width=8.268 * inch, height=11.693 * inch,
                                      mask='auto')
                 height = 550
@@ -2922,6 +2374,113 @@ def report_single_claim(request):
         )
 
 
+@check_token_in_session
+def export_reports(request):
+    """
+    Queue a bulk export of the reports of the selected applications.
+
+    :param request:
+        Django incoming request
+
+    :param return:
+        Export job status
+    """
+    if request.method == "POST":
+        url = f"{host_url(request)}{reverse('export_reports_api')}"
+
+        filters = {
+            'application_ids': [
+                int(application_id)
+                for application_id in request.POST.getlist('application_ids')
+            ],
+            'insurer_id': request.POST.get('insurer_id'),
+            'status': request.POST.get('status'),
+            'date_from': request.POST.get('date_from'),
+            'date_to': request.POST.get('date_to'),
+            'export_format': request.POST.get('export_format')
+        }
+        payload = json.dumps({
+            field: value
+            for field, value in filters.items()
+            if value
+        })
+
+        headers = {
+            'Authorization': f'Token {request.session.get("token")}',
+            'Content-Type': constants.JSON_APPLICATION
+        }
+
+        response_data = dispatch_api(
+            method="POST",
+            url=url,
+            headers=headers,
+            data=payload
+        )
+
+        return JsonResponse(response_data, safe=True)
+
+
+@check_token_in_session
+def download_report_export(request, job_id):
+    """
+    Download a finished bulk export of reports.
+
+    The export is streamed from storage, so the file is never held in
+    memory. Only admins and the user who queued the export may download it.
+
+    :param request:
+        Django incoming request
+
+    :param job_id:
+        Export job id
+
+    :param return:
+        ZIP or PDF of the reports or the export job status
+    """
+    if request.method == "GET":
+        url = f"{host_url(request)}{reverse('get_job_status_api')}"
+
+        payload = json.dumps({
+            "job_id": job_id
+        })
+
+        headers = {
+            'Authorization': f'Token {request.session.get("token")}',
+            'Content-Type': constants.JSON_APPLICATION
+        }
+
+        response_data = dispatch_api(
+            method="GET",
+            url=url,
+            headers=headers,
+            data=payload
+        )
+
+        job = response_data.get('data') or {}
+        allowed = request.session.get('role_type') == constants.ADMIN \
+            or job.get('user') == request.session.get('user_id')
+
+        if response_data.get('status') != 'success' \
+                or job.get('name') != EXPORT_CLAIM_REPORTS or not allowed:
+            response_data = {
+                'status': 'error',
+                'message': 'Export not found'
+            }
+            return JsonResponse(response_data, status=404, safe=True)
+
+        if job['status'] != 'succeeded':
+            return JsonResponse(response_data, status=202, safe=True)
+
+        export_format = job['result']['export_format']
+        response = StreamingHttpResponse(
+            iter_s3_file(job['result']['file_path']),
+            content_type=EXPORT_CONTENT_TYPES[export_format]
+        )
+        response['Content-Disposition'] = \
+            f'attachment; filename="Assessment-Reports-{job_id}.{export_format}"'
+        return response
+
+
 def chunks(data_list, number_per_iteration):
     """
     Break the data in chunks for overflow control.
@@ -2934,34 +2493,14 @@ def draw_list(pdf_canvas, list_items, x, y, max_width, max_height):
     """
     Create list of elements on the pdf report.
     """
+    from reportlab.platypus import ListFlowable  # pylint: disable=import-outside-toplevel
+
     list_flowable = ListFlowable(list_items)
     _, h = list_flowable.wrapOn(pdf_canvas, max_width, max_height)
     list_flowable.drawOn(pdf_canvas, x, y - h)
     return pdf_canvas
 
 
-def draw_paragraph(pdf_canvas, msg, x, y, max_width, max_height, message_style):
-    """
-    Draw paragraph on the pdf report.
-    """
-    message = str(msg).replace('\n', '<br />')
-    message = Paragraph(message, style=message_style)
-    _, h = message.wrap(max_width, max_height)
-    message.drawOn(pdf_canvas, x, y - h)
-    return pdf_canvas
-
-
-def paragraph_height(pdf_canvas, msg, max_width, max_height, message_style):
-    """
-    Get the height of the content passed then return the height.
-    """
-    message = str(msg).replace('\n', '<br />')
-    message = Paragraph(message, style=message_style)
-    message.wrapOn(pdf_canvas, max_width, max_height)
-    height = message.height
-    return height
-
-
 @check_token_in_session
 def get_client_claims(request):
     """
@@ -2985,28 +2524,19 @@ def get_client_claims(request):
         }
 
         url = f"{host_url(request)}{reverse('get_client_claims_api')}"
-        response_data = api_connection(method="GET", url=url, headers=headers, data=payload)
-
-        applications = response_data.get('data')
-        applications_df = pd.DataFrame(applications)
+        response_data = dispatch_api(method="GET", url=url, headers=headers, data=payload)
 
-        if not applications_df.empty:
-            completed_applications = applications_df[
-                applications_df['application_status__name'] == 'Completed'
-            ].to_dict('records')
+        applications = response_data.get('data') or []
 
-            pending_applications = applications_df[
-                applications_df['application_status__name'] == 'Pending'
-            ].to_dict('records')
-
-            scheduled_applications = applications_df[
-                applications_df['application_status__name'] == 'Scheduled'
-            ].to_dict('records')
-                
-        else:
-            completed_applications = []
-            pending_applications = []
-            scheduled_applications = []
+        completed_applications = filter_records(
+            applications, application_status__name='Completed'
+        )
+        pending_applications = filter_records(
+            applications, application_status__name='Pending'
+        )
+        scheduled_applications = filter_records(
+            applications, application_status__name='Scheduled'
+        )
 
         scheduled_claims = len(scheduled_applications)
         pending_claims = len(pending_applications)
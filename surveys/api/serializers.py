@@ -960,6 +960,24 @@ class ApplicationClientModelSerializer(serializers.ModelSerializer):
     client = ClientModelSerializer()
     assessment = serializers.SerializerMethodField()
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Load every relation the serializer reads in the same query.
+
+        :param queryset:
+            application queryset to serialize
+        :return:
+            queryset joined to status, assessor, client, insurer and assessment
+        """
+        return queryset.select_related(
+            'application_status',
+            'assessor',
+            'client',
+            'client__insurer',
+            'application'
+        )
+
     @staticmethod
     def get_assessment(obj):
         """
@@ -971,7 +989,7 @@ class ApplicationClientModelSerializer(serializers.ModelSerializer):
             assessment model: field = assessment
         """
         try:
-            assessment = Assessment.objects.get(application_id=obj.id)
+            assessment = obj.application
         except Assessment.DoesNotExist:
             return ''
             
@@ -1078,7 +1096,7 @@ class ClientBusinessModelSerializer(serializers.ModelSerializer):
             business model linked to client
         """
         try:
-            business = Business.objects.get(client_id=obj.id)
+            business = obj.business
         except Business.DoesNotExist:
             business_data = ''
             return business_data
@@ -1,7 +1,8 @@
 """
 Addtional Services for surveys when it comes to data linking.
 """
-import pandas as pd
+from __future__ import annotations
+from application.lazy import lazy_module
 from surveys.models import (
     SurveyCategoryType,
     SurveyCategory,
@@ -14,28 +15,129 @@ from surveys.api.serializers import (
     SurveyCategoryTypeSerializer,
     SurveyApplicationTitleSerializer,
     SurveyCategorySerializer,
-    SurveyAnswerLinkSerializer
+    SurveyAnswerLinkSerializer,
+    SurveyQuestionSerializer,
+    SurveyQuestionOptionSerializer
 )
-from system_management.amazons3 import(
-    open_s3_file
+from application.storage import presign_file_urls
+from application.api.services import (
+    group_records,
+    nest_children,
+    nest_records
 )
+from application.cache import VersionedCache
+from application.metrics import measured
 
 
-def get_survey_categories(df_survey: pd.DataFrame) -> pd.DataFrame:
+pd = lazy_module('pandas')
+survey_catalog_cache = VersionedCache('survey_catalog')
+
+SURVEY_CATALOG_LISTS = {
+    'categories': (
+        SurveyCategory.objects.select_related('type'),
+        SurveyCategorySerializer
+    ),
+    'types': (
+        SurveyCategoryType.objects.select_related('category'),
+        SurveyCategoryTypeSerializer
+    ),
+    'titles': (
+        SurveyApplicationTitle.objects.all(),
+        SurveyApplicationTitleSerializer
+    )
+}
+
+
+def get_survey_categories(survey: dict) -> dict:
     """Get survey categories.
     
+    The category tree of the application type comes from the survey catalog
+    cache, only the answers of the survey are read for every call. The
+    records are nested in plain Python, a single survey is too small for
+    DataFrames to pay off.
+    
+    Args:
+        survey (dict): survey record with its id and application_type_id
+    
+    Returns:
+        dict: survey record with its categories
+    """
+    survey_id = survey['id']
+    
+    application_type_id = survey['application_type_id']
+    
+    categories = survey_catalog_cache.get_or_build(
+        ('tree', (application_type_id,)),
+        lambda: build_survey_catalog([application_type_id])
+    )
+    
+    if categories:
+        questions = list(iter_catalog_questions(categories))
+        
+        if questions:
+            answers = list(SurveyAnswer.objects.values(
+                'id', 
+                'answer', 
+                'question_id', 
+                'question__question_type', 
+                'survey_id'
+            ).filter(
+                question_id__in = [question['id'] for question in questions],
+                survey_id = survey_id
+            ))
+            
+            if answers:
+                file_answers = [
+                    answer for answer in answers
+                    if answer['question__question_type'] == 'file'
+                ]
+                file_urls = presign_file_urls(
+                    [answer['answer'] for answer in file_answers]
+                ) if file_answers else []
+                for file_answer, file_url in zip(file_answers, file_urls):
+                    file_answer['answer'] = file_url
+                
+                question_answers = group_records(answers, 'question_id')
+                
+                for question in questions:
+                    question['answers'] = question_answers.get(question['id'], [])
+
+        nest_records(
+            [survey], 'application_type_id', categories, 'type_id', 'categories'
+        )
+    return survey
+
+
+def iter_catalog_questions(categories: list):
+    """
+    Question records of a category tree built by build_survey_catalog.
+    
     Args:
-        df_survey (DataFrame): survey data
+        categories (list): category records with their nested types
     
     Returns:
-        DataFrame: survey categories
+        generator: question records, in the order of the tree
     """
-    survey_id = df_survey['id'].values.tolist()[0]
+    for category in categories:
+        for category_type in category.get('types', []):
+            for title in category_type.get('titles', []):
+                yield from title.get('questions', [])
+
+
+@measured('pandas')
+def build_survey_catalog(application_type_ids: list) -> list:
+    """
+    Categories of application types with their types, titles, questions
+    and options, without answers.
     
-    application_type_id = df_survey['application_type_id'].values.tolist()[0]
+    Args:
+        application_type_ids (list): application type ids
     
-    categories = SurveyCategory.objects.filter(
-        type_id=application_type_id
+    Returns:
+        list: category records, each with its nested types
+    """
+    categories = SurveyCategory.objects.select_related('type').filter(
+        type_id__in = application_type_ids
     )
     
     categories_serializer = SurveyCategorySerializer(categories, many=True)
@@ -45,7 +147,9 @@ def get_survey_categories(df_survey: pd.DataFrame) -> pd.DataFrame:
     if not df_categories.empty:
         category_ids = df_categories['id'].values.tolist()
         
-        category_types = SurveyCategoryType.objects.filter(
+        category_types = SurveyCategoryType.objects.select_related(
+            'category'
+        ).filter(
             category_id__in = category_ids
         )
         
@@ -88,8 +192,8 @@ def get_survey_categories(df_survey: pd.DataFrame) -> pd.DataFrame:
                     options = '',
                     answers = ''
                 )
-                if question.exists():
-                    question_ids = question.values_list('id', flat=True)
+                if not df_questions.empty:
+                    question_ids = df_questions['id'].values.tolist()
                     
                     options = SurveyQuestionOption.objects.values(
                         'id',
@@ -101,100 +205,113 @@ def get_survey_categories(df_survey: pd.DataFrame) -> pd.DataFrame:
                     
                     df_options = pd.DataFrame(options)
                     
-                    if options.exists():
-                        df_questions['options'] = df_questions['id'].apply(
-                            lambda question_id:
-                                df_options.loc[
-                                    df_options['question_id'] == question_id
-                                ].to_dict('records')
+                    if not df_options.empty:
+                        df_questions['options'] = nest_children(
+                            df_questions, 'id', df_options, 'question_id'
                         )
                     
-                    answer = SurveyAnswer.objects.values(
-                        'id', 
-                        'answer', 
-                        'question_id', 
-                        'question__question_type', 
-                        'survey_id'
-                    ).filter(
-                        question_id__in = question_ids,
-                        survey_id = survey_id
+                    df_title['questions'] = nest_children(
+                        df_title, 'id', df_questions, 'application_title_id'
                     )
-                    
-                    df_answer = pd.DataFrame(answer)
-                    if answer.exists():
-                        df_answer = df_answer.apply(
-                            lambda series:
-                            open_file_questions(series)
-                            ,axis=1
-                        )
-
-                        df_questions['answers'] = df_questions['id'].apply(
-                                lambda question_id:
-                                    df_answer.loc[
-                                        df_answer['question_id'] == question_id
-                                    ].to_dict('records')
-                        )
-                    
-                    df_title['questions'] = df_title['id'].apply(
-                        lambda title_id:
-                            df_questions.loc[
-                                df_questions['application_title_id'] == title_id
-                        ].to_dict('records')
-                    )      
             
-                df_cat_type ['titles'] = df_cat_type['id'].apply(
-                        lambda category_type:
-                            df_title.loc[
-                                df_title['subcategory_type_id'] == category_type
-                            ].to_dict('records')
+                df_cat_type['titles'] = nest_children(
+                    df_cat_type, 'id', df_title, 'subcategory_type_id'
                 )
             
-            df_categories['types'] = df_categories['id'].apply(
-                lambda category:
-                    df_cat_type .loc[
-                        df_cat_type['category_id'] == category
-                    ].to_dict('records')
+            df_categories['types'] = nest_children(
+                df_categories, 'id', df_cat_type, 'category_id'
             )
 
-        df_survey['categories'] = df_survey['application_type_id'].apply(
-            lambda application_type:
-            df_categories.loc[
-                df_categories['type_id'] == application_type
-            ].to_dict('records')
-        )
-    return df_survey
+    return df_categories.to_dict('records')
 
 
-def open_file_questions(series: pd.Series) -> pd.Series:
+def get_survey_catalog_list(catalog_list: str) -> list:
     """
-    Open file questions.
+    All survey categories, category types or application titles.
     
     Args:
-        series (Series): series
+        catalog_list (str): 'categories', 'types' or 'titles'
     
     Returns:
-        Series: series
+        list: serialized records
     """
-    if series['question__question_type'] == 'file':
-        series['answer'] = open_s3_file(series['answer'])
-    return series
+    queryset, serializer = SURVEY_CATALOG_LISTS[catalog_list]
+    return list(serializer(queryset.all(), many=True).data)
+
+
+def get_survey_question_catalog() -> list:
+    """
+    All survey questions with the text of their options.
+    
+    Raises a KeyError when there are questions but no options at all, the
+    same way the survey questions api always has.
+    
+    Returns:
+        list: question records with an options list of option strings
+    """
+    questions = SurveyQuestion.objects.all()
+    options = SurveyQuestionOption.objects.all()
+
+    question_serializer = SurveyQuestionSerializer(questions, many=True)
+    option_serializer = SurveyQuestionOptionSerializer(options, many=True)
+
+    df_questions = pd.DataFrame(question_serializer.data)
+    df_options = pd.DataFrame(option_serializer.data)
+
+    if df_questions.empty:
+        return []
+
+    question_options = group_records(
+        df_options[['option', 'question_id']].to_dict('records'), 'question_id'
+    )
+
+    df_questions['options'] = df_questions['id'].apply(
+        lambda question_id:
+        [option['option'] for option in question_options.get(question_id, [])]
+    )
+
+    return df_questions.to_dict('records')
 
 
-def open_file_series(series: pd.Series) -> pd.Series:
+def open_file_series(df_answers: pd.DataFrame) -> pd.DataFrame:
     """
     Open file questions.
     
+    The files of all file answers are signed in one call.
+    
     Args:
-        series (Series): series
+        df_answers (DataFrame): answers with a serialized question column
     
     Returns:
-        Series: series
+        DataFrame: answers with presigned file urls
     """
-    if series['question']['question_type'] == 'file':
-        series['answer'] = open_s3_file(series['answer'])
-    return series
+    is_file = df_answers['question'].apply(
+        lambda question:
+        question['question_type'] == 'file'
+    )
+    return open_file_answers(df_answers, is_file)
 
 
+def open_file_answers(df_answers: pd.DataFrame, is_file: pd.Series) -> pd.DataFrame:
+    """
+    Replace the answer of file answers with a presigned url.
+    
+    Args:
+        df_answers (DataFrame): answers
+        is_file (Series): mask of the file answers
+    
+    Returns:
+        DataFrame: answers with presigned file urls
+    """
+    if is_file.any():
+        df_answers = df_answers.copy()
+        df_answers.loc[is_file, 'answer'] = presign_file_urls(
+            df_answers.loc[is_file, 'answer'].values.tolist()
+        )
+    return df_answers
+
+
+@measured('pandas')
 def get_survey_answers(df_surveys: pd.DataFrame) -> pd.DataFrame:
     """
     Get survey answers.
@@ -217,11 +334,13 @@ def get_survey_answers(df_surveys: pd.DataFrame) -> pd.DataFrame:
         categories = ''
     )
     if not df_answers.empty:
+        survey_answers = dict(tuple(df_answers.groupby('survey_id', sort=False)))
+        no_answers = df_answers.iloc[0:0]
         df_surveys = df_surveys.apply(
             lambda series:
             get_answer_category(
                 series,
-                df_answers
+                survey_answers.get(series['id'], no_answers)
             )
             ,axis=1
         )
@@ -237,16 +356,11 @@ def get_answer_category(
     
     Args:
         series (Series): series
-        df_answers (DataFrame): survey answers
-        df_options (DataFrame): survey options
+        df_answers (DataFrame): answers of the survey in the series
     
     Returns:
         Series: series
     """
-    df_answers = df_answers.loc[
-        df_answers['survey_id'] == series['id']
-    ]
-    
     df_categories = pd.DataFrame(
         df_answers['category'].values.tolist()
     ).drop_duplicates()
@@ -277,161 +391,48 @@ def get_answer_category(
             )
 
             if not df_titles.empty:
-                df_answers = df_answers.apply(
-                    lambda answer:
-                    open_file_series(answer),
-                    axis=1
-                )
+                df_answers = open_file_series(df_answers)
 
                 df_answers = df_answers[['id', 'answer', 'question_id']]
-                df_question['answers'] = df_question['id'].apply(
-                    lambda question_id:
-                    df_answers.loc[
-                        df_answers['question_id'] == question_id
-                    ].to_dict('records')
+                df_question['answers'] = nest_children(
+                    df_question, 'id', df_answers, 'question_id'
                 )
 
-                df_titles['questions'] = df_titles['id'].apply(
-                    lambda title_id:
-                    df_question.loc[
-                        df_question['application_title_id'] == title_id
-                    ].to_dict('records')
+                df_titles['questions'] = nest_children(
+                    df_titles, 'id', df_question, 'application_title_id'
                 )
 
-                df_types['titles'] = df_types['id'].apply(
-                    lambda type_id:
-                    df_titles.loc[
-                        df_titles['subcategory_type_id'] == type_id
-                    ].to_dict('records')
+                df_types['titles'] = nest_children(
+                    df_types, 'id', df_titles, 'subcategory_type_id'
                 )
 
-            df_categories['types'] = df_categories['id'].apply(
-                lambda category_id:
-                df_types.loc[
-                    df_types['category_id'] == category_id
-                ].to_dict('records')
+            df_categories['types'] = nest_children(
+                df_categories, 'id', df_types, 'category_id'
             )
         
             series['categories'] = df_categories.to_dict('records')
     
     return series
 
-def get_application_type_info(df_application_types: pd.DataFrame) -> pd.DataFrame:
+def get_application_type_info(application_types: list) -> list:
     """
     Get application type info.
     
     Args:
-        df_application_types (DataFrame): application types
+        application_types (list): application type records
     
     Returns:
-        DataFrame: application type info
+        list: application type records with their categories
     """
-    application_type_ids = df_application_types['id'].values.tolist()
-    categories = SurveyCategory.objects.filter(
-        type_id__in = application_type_ids
+    application_type_ids = tuple(
+        application_type['id'] for application_type in application_types
+    )
+    categories = survey_catalog_cache.get_or_build(
+        ('tree', application_type_ids),
+        lambda: build_survey_catalog(list(application_type_ids))
     )
     
-    categories_serializer = SurveyCategorySerializer(categories, many=True)
-    categories_data = categories_serializer.data
-    df_categories = pd.DataFrame(categories_data)
-    
-    if not df_categories.empty:
-        category_ids = df_categories['id'].values.tolist()
-        
-        category_types = SurveyCategoryType.objects.filter(
-            category_id__in = category_ids
-        )
-        
-        type_serializer = SurveyCategoryTypeSerializer(category_types, many=True)
-        
-        cat_type_data = type_serializer.data
-        df_cat_type = pd.DataFrame(cat_type_data)
-        
-        if not df_cat_type.empty:
-            df_cat_type['tab_name'] = df_cat_type['name'].apply(
-                lambda name:
-                str(name).replace(' ', '_')
-            )
-            cat_type_ids = df_cat_type['id'].values.tolist()
-            application_title = SurveyApplicationTitle.objects.filter(
-                subcategory_type_id__in = cat_type_ids
-                )
-            
-            title_serializer =  SurveyApplicationTitleSerializer(application_title, many=True)
-            title_data = title_serializer.data
-            df_title = pd.DataFrame(title_data)
-            
-            if not df_title.empty:
-                title_ids = df_title['id'].values.tolist()
-                question =  SurveyQuestion.objects.values(
-                    'id',
-                    'question',
-                    'question_type',
-                    'is_mandatory',
-                    'has_checkbox',
-                    'has_selection',
-                    'has_text',
-                    'has_date',
-                    'has_file',
-                    'has_other_field',
-                    'has_location',
-                    'application_title_id'
-                ).filter(
-                    application_title_id__in =title_ids
-                )
-
-                df_questions = pd.DataFrame(question)
-                df_questions = df_questions.assign(
-                    options = '',
-                    answers = ''
-                )
-                if question.exists():
-                    question_ids = question.values_list('id', flat=True)
-                    
-                    options = SurveyQuestionOption.objects.values(
-                        'id',
-                        'option',
-                        'question_id'
-                    ).filter(
-                        question_id__in = question_ids
-                    )
-                    
-                    df_options = pd.DataFrame(options)
-                    
-                    if options.exists():
-                        df_questions['options'] = df_questions['id'].apply(
-                            lambda question_id:
-                                df_options.loc[
-                                    df_options['question_id'] == question_id
-                                ].to_dict('records')
-                        )
-                    
-                    df_title['questions'] = df_title['id'].apply(
-                        lambda title_id:
-                            df_questions.loc[
-                                df_questions['application_title_id'] == title_id
-                        ].to_dict('records')
-                    )      
-            
-                df_cat_type ['titles'] = df_cat_type['id'].apply(
-                        lambda category_type:
-                            df_title.loc[
-                                df_title['subcategory_type_id'] == category_type
-                            ].to_dict('records')
-                )
-            
-            df_categories['types'] = df_categories['id'].apply(
-                lambda category:
-                    df_cat_type .loc[
-                        df_cat_type['category_id'] == category
-                    ].to_dict('records')
-            )
-        
-        df_application_types['categories'] = df_application_types['id'].apply(
-            lambda application_type:
-            df_categories.loc[
-                df_categories['type_id'] == application_type
-            ].to_dict('records')
-        )
+    if categories:
+        nest_records(application_types, 'id', categories, 'type_id', 'categories')
 
-    return df_application_types
+    return application_types
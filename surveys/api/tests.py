@@ -1,4 +1,48 @@
 """
 Surveys api test cases.
 """
+import json
 from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+from system_management.models import User
+from application.benchmark import seed_benchmark_data
+from application.models import ApplicationType
+from surveys.api.views import create_multi_survey_api
+from surveys.models import Survey
+
+
+class CreateMultiSurveyTestCase(TestCase):
+    """
+    A survey added to an application returns its categories and the types.
+    """
+
+    def setUp(self):
+        self.seeded = seed_benchmark_data(4, seed=1)
+        self.admin = User.objects.get(id=self.seeded['admin_id'])
+
+    def test_create_survey(self):
+        application_type = ApplicationType.objects.first()
+        request = APIRequestFactory().post(
+            '/create_multi_survey_api/',
+            json.dumps({
+                'application_type': application_type.id,
+                'application_id': self.seeded['survey_application_id']
+            }),
+            content_type='application/json'
+        )
+        force_authenticate(request, user=self.admin)
+
+        response = create_multi_survey_api(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], 'success')
+        self.assertEqual(
+            len(response.data['application_types']),
+            ApplicationType.objects.count()
+        )
+        self.assertEqual(
+            len(response.data['surveys_all']),
+            Survey.objects.filter(
+                application_id=self.seeded['survey_application_id']
+            ).count()
+        )
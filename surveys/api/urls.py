@@ -8,6 +8,7 @@ urlpatterns = [
     
     path('get_survey_overview_api/', views.get_survey_overview_api, name="get_survey_overview_api"),
     path('surveys_api/', views.surveys_api, name="surveys_api"),
+    path('surveys_count_api/', views.surveys_count_api, name="surveys_count_api"),
     path('add_survey_client_api/', views.add_survey_client_api, name="add_survey_client_api"),
     path('view_survey_application_api/',
          views.view_survey_application_api, name="view_survey_application_api"),
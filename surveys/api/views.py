@@ -7,7 +7,8 @@ The following api is stored here:
 
 import datetime
 import json
-import pandas as pd
+from application.lazy import lazy_module
+from django.db import transaction
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.decorators import api_view
@@ -35,7 +36,8 @@ from surveys.models import (
     Survey
 )
 from application.api.serializers import (
-    ApplicationTypeSerializer
+    ApplicationTypeSerializer,
+    ApplicationListingSerializer
 )
 from surveys.api.serializers import (
     AddClientSerializer,
@@ -52,11 +54,7 @@ from surveys.api.serializers import (
     UpdateSurveyQuestionSerializer,
     UpdateSurveyTitleSerializer,
     SurveyAnswerSerializer,
-    SurveyCategorySerializer,
-    SurveyApplicationTitleSerializer,
     AddSurveySurveyCatSerializer,
-    SurveyQuestionSerializer,
-    SurveyQuestionOptionSerializer,
     CreateQuestionSurveySerializer,
     SurveyorUserModelSerializer,
     SurveySaveQuestionSerializer,
@@ -69,13 +67,27 @@ from surveys.api.serializers import (
 from system_management.amazons3 import (
     delete_s3_file
 )
+from application.cache import invalidates
+from application.metrics import query_budget
+from application.api.services import (
+    filter_listing_applications,
+    paginate_applications,
+    count_applications_by_status,
+    save_question_answers
+)
 from surveys.api.services import (
+    survey_catalog_cache,
     get_survey_categories,
     get_survey_answers,
-    get_application_type_info
+    get_application_type_info,
+    get_survey_catalog_list,
+    get_survey_question_catalog
 )
 
 
+pd = lazy_module('pandas')
+
+
 @api_view(['GET'])
 def get_survey_overview_api(request):
     """
@@ -88,36 +100,64 @@ def get_survey_overview_api(request):
         - Survey data from serializer
     """
     if request.method == "GET":
-        application_types = ApplicationType.objects.values(
+        application_types = list(ApplicationType.objects.values(
             'id',
             'name'
-        )
-        df_application_types = pd.DataFrame(application_types)
-        if not df_application_types.empty:
-            df_application_types['tab_name'] = df_application_types['name'].apply(
-                lambda name:
-                str(name).replace(' ', '_')
-            )
-            df_application_types = get_application_type_info(df_application_types)
-        response_data = json.dumps({
+        ))
+        if application_types:
+            for application_type in application_types:
+                application_type['tab_name'] = str(application_type['name']).replace(' ', '_')
+            application_types = get_application_type_info(application_types)
+        response_data = {
             "status": "success",
             "message": "Surveys data retrieved successfully!",
-            "data": df_application_types.to_dict('records'),
-        })
+            "data": application_types,
+        }
         return Response(response_data, status=status.HTTP_200_OK)
 
 
 @api_view(['GET'])
+@query_budget(5)
 def surveys_api(request):
+    """
+    Get survey applications with the surveyors
+
+    Optional filters status, assessor_id and application_type_id. When a
+    page_size is sent the applications are returned newest first one page at
+    a time with the cursor of the next page.
+
+    :param request:
+        request django parameter
+    :return:
+        - status and message stating success or error
+        - Survey applications and surveyors
+    """
     if request.method == "GET":
-        survey_applications = Survey.objects.values_list(
-            'application_id',
-            flat=True
-        )
-        applications = Application.objects.filter(
-            id__in=survey_applications
+        body = json.loads(request.body) if request.body else request.query_params.dict()
+        listing_serializer = ApplicationListingSerializer(data=body)
+
+        if not listing_serializer.is_valid():
+            response_data = {
+                'status': 'error',
+                'message': str(listing_serializer.errors)
+            }
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+
+        validated_data = listing_serializer.validated_data
+        page_size = validated_data.get('page_size')
+        next_cursor = None
+
+        applications = ApplicationClientModelSerializer.setup_eager_loading(
+            filter_listing_applications(Survey.objects.all(), validated_data)
         )
 
+        if page_size:
+            applications, next_cursor = paginate_applications(
+                applications,
+                validated_data.get('cursor'),
+                page_size
+            )
+
         application_serializer = ApplicationClientModelSerializer(
             applications,
             many=True
@@ -126,12 +166,50 @@ def surveys_api(request):
         surveyors = User.objects.filter(user_type_id__name=constants.SURVEYOR)
         serializer = SurveyorUserModelSerializer(surveyors, many=True)
 
-        response_data = json.dumps({
+        response_data = {
             "status": "success",
             "message": "Surveys data retrieved successfully!",
             "data": application_serializer.data,
-            "surveyors": serializer.data
-        })
+            "surveyors": serializer.data,
+            "next_cursor": next_cursor
+        }
+
+        return Response(response_data, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@query_budget(5)
+def surveys_count_api(request):
+    """
+    Number of survey applications per status for the tab badges
+
+    :param request:
+        request django parameter
+    :return:
+        - status and message stating success or error
+        - Survey application count per status
+    """
+    if request.method == "GET":
+        body = json.loads(request.body) if request.body else request.query_params.dict()
+        serializer = ApplicationListingSerializer(data=body)
+
+        if not serializer.is_valid():
+            response_data = {
+                'status': 'error',
+                'message': str(serializer.errors)
+            }
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+
+        applications = filter_listing_applications(
+            Survey.objects.all(),
+            serializer.validated_data
+        )
+
+        response_data = {
+            "status": "success",
+            "message": "Survey counts retrieved successfully!",
+            "data": count_applications_by_status(applications)
+        }
 
         return Response(response_data, status=status.HTTP_200_OK)
 
@@ -176,25 +254,25 @@ def add_survey_client_api(request):
 
             client_id = client.id
 
-            data = json.dumps({
+            data = {
                 "status": "success",
                 "message": "Client information added successfully.",
                 "data": client_id
-            })
+            }
             return Response(data=data, status=status.HTTP_200_OK)
 
         else:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Fields error occurred - invalid request",
                 "data": str(serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
@@ -225,10 +303,10 @@ def add_survey_business_api(request):
             try:
                 client = Client.objects.get(id=client_id)
             except Client.DoesNotExist:
-                data = json.dumps({
+                data = {
                     "status": "error",
                     "message": "Client does not exist."
-                })
+                }
                 return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
             Business.objects.create(
@@ -240,25 +318,25 @@ def add_survey_business_api(request):
                 phone_no=business_phone_number
             )
 
-            data = json.dumps({
+            data = {
                 "status": "success",
                 "message": "Client information added successfully."
-            })
+            }
             return Response(data=data, status=status.HTTP_200_OK)
 
         else:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Fields error occurred - invalid request",
                 "data": str(business_serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
@@ -287,16 +365,16 @@ def edit_client_application_api(request):
                                                        id_number=id_number,
                                                        phone_number=phone_number
                                                        )
-            response_data = json.dumps({
+            response_data = {
                 "status": "success",
                 "message": "Client application edited successfully."
-            })
+            }
             return Response(data=response_data, status=status.HTTP_201_CREATED)
         else:
-            response_data = json.dumps({
+            response_data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -326,16 +404,16 @@ def edit_business_application_api(request):
                                                          phone_no=phone_no
                                                          )
 
-            response_data = json.dumps({
+            response_data = {
                 "status": "success",
                 "message": "Business application edited successfully."
-            })
+            }
             return Response(data=response_data, status=status.HTTP_201_CREATED)
         else:
-            response_data = json.dumps({
+            response_data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -355,10 +433,10 @@ def view_survey_application_api(request):
         body = json.loads(request.body)
 
         if 'application_id' not in body:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Please provide a valid application id."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         application_id = body.get('application_id')
@@ -375,10 +453,10 @@ def view_survey_application_api(request):
         )
 
         if not application:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Application not found."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         application = application.first()
@@ -389,24 +467,24 @@ def view_survey_application_api(request):
 
             serializer = SurveyCategoryTypeSerializer(survey_types, many=True)
 
-            data = json.dumps({
+            data = {
                 "status": "success",
                 "application": application,
                 "data": serializer.data
-            })
+            }
         else:
-            data = json.dumps({
+            data = {
                 "status": "success",
                 "application": application,
                 "data": []
-            })
+            }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
@@ -426,10 +504,10 @@ def survey_category_questions_api(request):
         body = json.loads(request.body)
 
         if 'category_id' not in body:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Please provide a valid category id."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         category_id = body.get('category_id')
@@ -437,10 +515,10 @@ def survey_category_questions_api(request):
             id=category_id).exists()
 
         if not category:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Category not found."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         questions = SurveyQuestion.objects.filter(
@@ -493,19 +571,19 @@ def survey_category_questions_api(request):
 
             questions = df_questions.to_dict('records')
 
-            data = json.dumps({
+            data = {
                 "status": "success",
                 "questions": questions,
                 "application_titles": application_titles
-            })
+            }
             return Response(data=data, status=status.HTTP_200_OK)
 
         else:
-            data = json.dumps({
+            data = {
                 "status": "success",
                 "questions": [],
                 "application_titles": []
-            })
+            }
             return Response(data=data, status=status.HTTP_200_OK)
 
 
@@ -550,17 +628,17 @@ def change_assessor_api(request):
         body = json.loads(request.body)
 
         if 'application_id' not in body:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Please provide a valid application id."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         if 'assessor' not in body:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Please provide a valid assessor id."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         application_id = body.get('application_id')
@@ -580,20 +658,20 @@ def change_assessor_api(request):
             assessor_obj = User.objects.get(id=assessor)
 
         except User.DoesNotExist:
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': 'Assessor not found.'
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         if application.assessor_id == assessor_obj.id:
             message = f"""
             Survey is already assigned to {assessor_obj.first_name} {assessor_obj.last_name}
             """
-            data = json.dumps({
+            data = {
                 'status': 'info',
                 'message': message
-            })
+            }
             return Response(data, status.HTTP_200_OK)
 
         else:
@@ -609,18 +687,18 @@ def change_assessor_api(request):
                 'email': assessor_obj.email
             }
 
-            data = json.dumps({
+            data = {
                 "status": "success",
                 "message": message,
                 "data": data
-            })
+            }
             return Response(data, status=status.HTTP_200_OK)
     else:
 
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
 
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
@@ -636,19 +714,21 @@ def get_survey_categories_api(request):
         get survey categories.
     """
     if request.method == "GET":
-        categories = SurveyCategory.objects.all()
-        serializer = SurveyCategorySerializer(categories, many=True)
-        data = json.dumps({
+        categories = survey_catalog_cache.get_or_build(
+            'categories',
+            lambda: get_survey_catalog_list('categories')
+        )
+        data = {
             "status": "success",
-            "data": serializer.data
-        })
+            "data": categories
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
 
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
@@ -664,19 +744,21 @@ def get_survey_types_api(request):
         get survey categories.
     """
     if request.method == "GET":
-        types = SurveyCategoryType.objects.all()
-        serializer = SurveyCategoryTypeSerializer(types, many=True)
-        data = json.dumps({
+        types = survey_catalog_cache.get_or_build(
+            'types',
+            lambda: get_survey_catalog_list('types')
+        )
+        data = {
             "status": "success",
-            "data": serializer.data
-        })
+            "data": types
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
 
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
@@ -692,24 +774,27 @@ def get_survey_titles_api(request):
         get survey categories.
     """
     if request.method == "GET":
-        titles = SurveyApplicationTitle.objects.all()
-        serializer = SurveyApplicationTitleSerializer(titles, many=True)
-        data = json.dumps({
+        titles = survey_catalog_cache.get_or_build(
+            'titles',
+            lambda: get_survey_catalog_list('titles')
+        )
+        data = {
             "status": "success",
-            "data": serializer.data
-        })
+            "data": titles
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
 
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(survey_catalog_cache)
 def add_survey_category_api(request):
     """
     Add survey category.
@@ -724,10 +809,10 @@ def add_survey_category_api(request):
         serializer = AddSurveySurveyCatSerializer(data=body)
 
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -740,10 +825,10 @@ def add_survey_category_api(request):
             )
 
         except ApplicationType.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Application type not found."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         category_name = validated_data.get("category_name")
@@ -760,23 +845,24 @@ def add_survey_category_api(request):
             'type_name': str(survey_cat.type.name)
         }
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "Survey category added successfully.",
             'data': survey_cat_data
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
 
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(survey_catalog_cache)
 def update_survey_category_api(request):
     """
     Update survey category.
@@ -799,20 +885,20 @@ def update_survey_category_api(request):
                     id=application_type
                 )
             except ApplicationType.DoesNotExist:
-                data = json.dumps({
+                data = {
                     "status": "error",
                     "message": "Application type not found."
-                })
+                }
                 return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
             try:
                 survey_cat = SurveyCategory.objects.get(id=category_id)
 
             except SurveyCategory.DoesNotExist:
-                data = json.dumps({
+                data = {
                     "status": "error",
                     "message": "Survey category not found."
-                })
+                }
                 return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
             prev_id = survey_cat.type_id
@@ -827,32 +913,33 @@ def update_survey_category_api(request):
                 'id': survey_cat.id
             }
 
-            data = json.dumps({
+            data = {
                 "status": "success",
                 "message": "Survey category updated successfully.",
                 "data": data
-            })
+            }
             return Response(data=data, status=status.HTTP_200_OK)
 
         else:
 
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
 
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
     else:
 
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
 
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(survey_catalog_cache)
 def delete_survey_category_api(request):
     """
     Delete survey category.
@@ -865,10 +952,10 @@ def delete_survey_category_api(request):
     if request.method == "POST":
         body = json.loads(request.body)
         if "category_id" not in body:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Please provide a valid category id."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         category_id = body.get("category_id")
@@ -877,10 +964,10 @@ def delete_survey_category_api(request):
             category_object = SurveyCategory.objects.get(id=category_id)
 
         except SurveyCategory.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Survey category not found."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         SurveyQuestionOption.objects.filter(
@@ -905,15 +992,16 @@ def delete_survey_category_api(request):
 
         category_object.delete()
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "Survey category deleted successfully."
-        })
+        }
 
         return Response(data=data, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
+@invalidates(survey_catalog_cache)
 def add_survey_category_type_api(request):
     """
     Add survey category type.
@@ -927,17 +1015,17 @@ def add_survey_category_type_api(request):
         body = json.loads(request.body)
 
         if "category_id" not in body:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Please provide a valid category id."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         if "category_type_name" not in body:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Please provide a valid category type name."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         category_id = body.get("category_id")
@@ -947,10 +1035,10 @@ def add_survey_category_type_api(request):
                 id=category_id
             )
         except SurveyCategory.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Survey category not found."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         category_type_name = body.get("category_type_name")
@@ -968,23 +1056,24 @@ def add_survey_category_type_api(request):
             'type_name': str(survey_cat_type.name).replace(' ', '_')
         }
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "Survey category type added successfully.",
             "data": data
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
 
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(survey_catalog_cache)
 def update_survey_category_type_api(request):
     """
     Update survey category type.
@@ -1006,10 +1095,10 @@ def update_survey_category_type_api(request):
                     id=category_type_id
                 )
             except SurveyCategory.DoesNotExist:
-                data = json.dumps({
+                data = {
                     "status": "error",
                     "message": "Survey category type not found."
-                })
+                }
                 return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
             previous_name = survey_category.name
             survey_category.name = category_name
@@ -1022,32 +1111,33 @@ def update_survey_category_type_api(request):
                 'previous_name': previous_name
             }
 
-            response_data = json.dumps({
+            response_data = {
                 "status": "success",
                 "message": "Survey category type updated successfully.",
                 "data": data
-            })
+            }
             return Response(data=response_data, status=status.HTTP_200_OK)
 
         else:
 
-            response_data = json.dumps({
+            response_data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
 
             return Response(data=response_data, status=status.HTTP_400_BAD_REQUEST)
     else:
 
-        response_data = json.dumps({
+        response_data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
 
         return Response(data=response_data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(survey_catalog_cache)
 def delete_survey_category_type_api(request):
     """
     Delete survey category type.
@@ -1061,10 +1151,10 @@ def delete_survey_category_type_api(request):
         body = json.loads(request.body)
 
         if "category_type_id" not in body:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Please provide a valid category type id."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         category_type_id = body.get("category_type_id")
@@ -1073,10 +1163,10 @@ def delete_survey_category_type_api(request):
             category_object = SurveyCategoryType.objects.get(id=category_type_id)
 
         except SurveyCategoryType.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Survey category type not found."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         SurveyQuestionOption.objects.filter(
@@ -1097,15 +1187,16 @@ def delete_survey_category_type_api(request):
 
         category_object.delete()
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "Survey category type deleted successfully."
-        })
+        }
 
         return Response(data=data, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
+@invalidates(survey_catalog_cache)
 def add_survey_title_api(request):
     """
     Add survey title.
@@ -1128,10 +1219,10 @@ def add_survey_title_api(request):
                 )
 
             except SurveyCategoryType.DoesNotExist:
-                data = json.dumps({
+                data = {
                     "status": "error",
                     "message": "Survey category type not found."
-                })
+                }
                 return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
             application_title = SurveyApplicationTitle.objects.create(
@@ -1143,28 +1234,29 @@ def add_survey_title_api(request):
                 'name': application_title.name
             }
 
-            data = json.dumps({
+            data = {
                 "status": "success",
                 "message": "Survey title added successfully.",
                 "data": title_data
-            })
+            }
             return Response(data=data, status=status.HTTP_200_OK)
 
         else:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(survey_catalog_cache)
 def update_survey_title_api(request):
     """
     Update survey title.
@@ -1187,10 +1279,10 @@ def update_survey_title_api(request):
                 )
 
             except SurveyApplicationTitle.DoesNotExist:
-                data = json.dumps({
+                data = {
                     "status": "error",
                     "message": "Survey title not found."
-                })
+                }
                 return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
             survey_title_object.name = survey_title_name
@@ -1201,28 +1293,29 @@ def update_survey_title_api(request):
                 'name': survey_title_object.name
             }
 
-            response_data = json.dumps({
+            response_data = {
                 "status": "success",
                 "message": "Survey title updated successfully."
-            })
+            }
             return Response(data=response_data, status=status.HTTP_200_OK)
 
         else:
-            response_data = json.dumps({
+            response_data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(data=response_data, status=status.HTTP_400_BAD_REQUEST)
 
     else:
-        response_data = json.dumps({
+        response_data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=response_data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(survey_catalog_cache)
 def delete_survey_title_api(request):
     """
     Delete survey title.
@@ -1236,10 +1329,10 @@ def delete_survey_title_api(request):
         body = json.loads(request.body)
 
         if "survey_title_id" not in body:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Please provide a valid survey title id."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         survey_title_id = body.get("survey_title_id")
@@ -1248,10 +1341,10 @@ def delete_survey_title_api(request):
             survey_title_object = SurveyApplicationTitle.objects.get(id=survey_title_id)
 
         except SurveyApplicationTitle.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Survey title not found."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         SurveyQuestionOption.objects.filter(
@@ -1268,17 +1361,17 @@ def delete_survey_title_api(request):
 
         survey_title_object.delete()
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "Survey title deleted successfully."
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
@@ -1302,10 +1395,10 @@ def generate_report_api(request):
         serializer = ManageSurveySerializer(data=body)
 
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         vaildated_data = serializer.validated_data
@@ -1323,10 +1416,10 @@ def generate_report_api(request):
         )
 
         if not application.exists():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': 'Application not found.'
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         application = application.first()
@@ -1374,21 +1467,21 @@ def generate_report_api(request):
         df_survey = pd.DataFrame(surveys)
         df_survey = get_survey_answers(df_survey)
 
-        data = json.dumps({
+        data = {
             'status': 'success',
             'application': application,
             'client': client,
             'assessment': assessment,
             'surveys': df_survey.to_dict('records')
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
 
-        data = json.dumps({
+        data = {
             'status': 'error',
             'message': constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
@@ -1408,10 +1501,10 @@ def survey_report_single_api(request):
         serializer = GetSurveyInfoSerializer(data=body)
 
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": str(serializer.errors)
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         vaildated_data = serializer.validated_data
@@ -1426,10 +1519,10 @@ def survey_report_single_api(request):
             'application_id'
         )
         if not surveys.exists():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': 'Survey not found.'
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         df_survey = pd.DataFrame(list(surveys))
@@ -1483,21 +1576,21 @@ def survey_report_single_api(request):
             assessment['scheduled_date_time'] = assessment['scheduled_date_time'].strftime(
                 '%b %d, %Y')
 
-        data = json.dumps({
+        data = {
             'status': 'success',
             'application': application,
             'client': client,
             'assessment': assessment,
             'surveys': df_survey.to_dict('records')
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
 
-        data = json.dumps({
+        data = {
             'status': 'error',
             'message': constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
@@ -1524,10 +1617,10 @@ def survey_answer_api(request):
                 question_object = SurveyQuestion.objects.get(id=question_id)
 
             except SurveyQuestion.DoesNotExist:
-                data = json.dumps({
+                data = {
                     'status': 'error',
                     'message': 'Question not found.'
-                })
+                }
                 return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
             application_title_id = question_object.application_title.id
@@ -1551,10 +1644,10 @@ def survey_answer_api(request):
             return Response(data, status=status.HTTP_200_OK)
 
         else:
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(answer_serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
     else:
@@ -1577,49 +1670,35 @@ def get_survey_questions_api(request):
     """
     if request.method == "GET":
 
-        questions = SurveyQuestion.objects.all()
-        options = SurveyQuestionOption.objects.all()
-
-        question_serializer = SurveyQuestionSerializer(questions, many=True)
-        option_serializer = SurveyQuestionOptionSerializer(options, many=True)
-
         try:
-            df_questions = pd.DataFrame(question_serializer.data)
-            df_options = pd.DataFrame(option_serializer.data)
+            questions = survey_catalog_cache.get_or_build(
+                'questions',
+                get_survey_question_catalog
+            )
 
-            if df_questions.empty:
-                data = json.dumps({
+            if not questions:
+                data = {
                     'status': 'success',
                     'questions': [],
-                })
+                }
                 return Response(data, status=status.HTTP_200_OK)
 
-            question_list = df_options['question_id'].values.tolist()
-
-            df_questions['options'] = df_questions['id'].apply(
-                lambda question_id:
-                df_options[df_options['question_id'] == question_id]['option'].values.tolist()
-                if question_id in question_list
-                else []
-            )
-
-            questions = df_questions.to_dict('records')
-
-            data = json.dumps({
+            data = {
                 'status': 'success',
                 'data': questions,
-            })
+            }
             return Response(data, status=status.HTTP_200_OK)
 
         except KeyError:
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': 'Error occurred during serialization of questions'
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
 
 @api_view(['POST'])
+@invalidates(survey_catalog_cache)
 def create_question_survey_api(request):
     """
     Create question api for survey question creation.
@@ -1670,10 +1749,10 @@ def create_question_survey_api(request):
                 has_text = True
 
             else:
-                data = json.dumps({
+                data = {
                     'status': 'error',
                     'message': 'Invalid question type'
-                })
+                }
                 return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
             question_object = SurveyQuestion.objects.create(
@@ -1720,18 +1799,18 @@ def create_question_survey_api(request):
                 'options': options_data
             }
 
-            data = json.dumps({
+            data = {
                 'status': 'success',
                 'message': 'Question created successfully',
                 'data': data
-            })
+            }
             return Response(data, status=status.HTTP_200_OK)
 
         else:
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(question_serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
     else:
@@ -1749,10 +1828,10 @@ def survey_application_management_api(request):
         serializer = ManageSurveySerializer(data=body)
 
         if not serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': serializer.errors
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
@@ -1762,19 +1841,19 @@ def survey_application_management_api(request):
             application = Application.objects.get(id=application_id)
 
         except Application.DoesNotExist:
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': f"Application with id: {application_id} does not exists."
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         surveys = Survey.objects.filter(application_id=application_id)
 
         if not surveys.exists():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': f"Application with id: {application_id} is not a survey."
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         application_serializer = SurveyApplicationRetrieveSerializer(instance=application)
@@ -1809,11 +1888,11 @@ def survey_application_management_api(request):
             ))
         }
 
-        response_data = json.dumps({
+        response_data = {
             'status': 'success',
             'message': f"Application data sent for application with id: {application_id}",
             'data': data
-        })
+        }
 
         return Response(response_data, status=status.HTTP_200_OK)
 
@@ -1832,142 +1911,84 @@ def save_survey_questions_api(request):
         body = json.loads(request.body)
         serializer = SurveySaveQuestionSerializer(data=body)
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = serializer.validated_data
         survey_id = validated_data.get('survey_id')
         survey_answers = validated_data.get('survey_answers')
 
-        [
-            create_question_instance(answer, survey_id)
-            for answer in survey_answers
-        ]
+        with transaction.atomic():
+            save_survey_answers(survey_answers, survey_id)
 
-        data = json.dumps({
+        data = {
             'status': 'success',
             'message': 'Questions saved successfully!'
-        })
+        }
         return Response(data, status=status.HTTP_200_OK)
 
 
-def create_question_instance(answer, survey_id):
+def save_survey_answers(answers, survey_id):
     """
-    Create question instance.
+    Save survey answers in bulk.
 
-    :param answer:
-        Survey answer.
-    :param application_id:
-        Application id.
+    :param answers:
+        Survey answers.
+    :param survey_id:
+        Survey id.
     :return:
-        Question instance.
+        None
     """
-    question_id = answer['question_id']
-
-    try:
-        question = SurveyQuestion.objects.get(id=question_id)
-
-    except SurveyQuestion.DoesNotExist:
+    if not answers:
         return None
 
-    question_type = answer['question_type']
-    answer_field = answer['answer']
-
-    if question.has_other_field:
-        survey_answer = SurveyAnswer.objects.filter(
-            question_id=question_id,
+    question_ids = {answer['question_id'] for answer in answers}
+    question_values = SurveyQuestion.objects.filter(
+        id__in=question_ids
+    ).values(
+        'id',
+        'has_other_field',
+        'application_title_id',
+        'application_title__subcategory_type_id',
+        'application_title__subcategory_type__category_id'
+    )
+    questions = {
+        question['id']: question
+        for question in question_values
+    }
+
+    save_question_answers(
+        answers,
+        {
+            question_id: question['has_other_field']
+            for question_id, question in questions.items()
+        },
+        SurveyAnswer.objects.filter(
+            question_id__in=list(questions),
             survey_id=survey_id
-        ).values('id')
-
-        if not survey_answer.exists():
-
-            application_title = question.application_title
-            subcategory_type = application_title.subcategory_type
-            category = subcategory_type.category
-
-            SurveyAnswer.objects.create(
-                question_id=question.id,
-                survey_id=survey_id,
-                answer=answer_field,
-                application_title_id=application_title.id,
-                subcategory_type_id=subcategory_type.id,
-                category_id=category.id,
-            )
-        elif survey_answer.count() == 1:
-            if question_type == 'other':
-                application_title = question.application_title
-                subcategory_type = application_title.subcategory_type
-                category = subcategory_type.category
-
-                SurveyAnswer.objects.create(
-                    question_id=question.id,
-                    survey_id=survey_id,
-                    answer=answer_field,
-                    application_title_id=application_title.id,
-                    subcategory_type_id=subcategory_type.id,
-                    category_id=category.id,
-                )
-            else:
-                survey_answer = SurveyAnswer.objects.filter(
-                    question_id=question_id,
-                    survey_id=survey_id
-                ).order_by('id').first()
-                if survey_answer:
-                    survey_answer.answer = answer_field
-                    survey_answer.save()
-        else:
-            if question_type == 'other':
-                survey_answer = SurveyAnswer.objects.filter(
-                    question_id=question_id,
-                    survey_id=survey_id
-                ).order_by('id').last()
-                if survey_answer:
-                    survey_answer.answer = answer_field
-                    survey_answer.save()
-            else:
-                survey_answer = SurveyAnswer.objects.filter(
-                    question_id=question_id,
-                    survey_id=survey_id
-                ).order_by('id').first()
-                if survey_answer:
-                    survey_answer.answer = answer_field
-                    survey_answer.save()
-
-    else:
-        if not SurveyAnswer.objects.filter(
-                question_id=question_id,
-                survey_id=survey_id
-        ).exists():
-
-            application_title = question.application_title
-            subcategory_type = application_title.subcategory_type
-            category = subcategory_type.category
-
-            SurveyAnswer.objects.create(
-                question_id=question.id,
-                survey_id=survey_id,
-                answer=answer_field,
-                application_title_id=application_title.id,
-                subcategory_type_id=subcategory_type.id,
-                category_id=category.id,
-            )
-
-        else:
-
-            SurveyAnswer.objects.filter(
-                question_id=question_id,
-                survey_id=survey_id
-            ).update(
-                answer=answer_field
-            )
+        ),
+        lambda question_id, answer_field: SurveyAnswer(
+            question_id=question_id,
+            survey_id=survey_id,
+            answer=answer_field,
+            application_title_id=questions[question_id]['application_title_id'],
+            subcategory_type_id=questions[question_id][
+                'application_title__subcategory_type_id'
+            ],
+            category_id=questions[question_id][
+                'application_title__subcategory_type__category_id'
+            ]
+        )
+    )
 
     return None
 
 
 @api_view(['POST'])
+@invalidates(survey_catalog_cache)
 def delete_survey_question_api(request):
     """
     Delete survey question.
@@ -1982,10 +2003,10 @@ def delete_survey_question_api(request):
         question_serializer = DeleteQuestionSerializer(data=body)
 
         if not question_serializer.is_valid():
-            response_data = json.dumps({
+            response_data = {
                 'status': 'error',
                 'message': str(question_serializer.errors)
-            })
+            }
             return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
 
         question_id = question_serializer.validated_data.get('question_id')
@@ -1994,29 +2015,30 @@ def delete_survey_question_api(request):
             survey_question_object = SurveyQuestion.objects.get(id=question_id)
 
         except SurveyQuestion.DoesNotExist:
-            data = json.dumps({
+            data = {
                 "status": "error",
                 "message": "Survey question not found."
-            })
+            }
             return Response(data=data, status=status.HTTP_400_BAD_REQUEST)
 
         survey_question_object.delete()
 
-        data = json.dumps({
+        data = {
             "status": "success",
             "message": "Survey question deleted successfully."
-        })
+        }
         return Response(data=data, status=status.HTTP_200_OK)
 
     else:
-        data = json.dumps({
+        data = {
             "status": "error",
             "message": constants.INVALID_REQUEST_METHOD
-        })
+        }
         return Response(data=data, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 @api_view(['POST'])
+@invalidates(survey_catalog_cache)
 def update_survey_question_api(request):
     """
     Update survey question API.
@@ -2067,19 +2089,19 @@ def update_survey_question_api(request):
                 has_text = True
 
             else:
-                data = json.dumps({
+                data = {
                     'status': 'error',
                     'message': 'Invalid question type'
-                })
+                }
                 return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
             try:
                 question_object = SurveyQuestion.objects.get(id=application_title_id)
             except SurveyQuestion.DoesNotExist:
-                data = json.dumps({
+                data = {
                     'status': 'error',
                     'message': 'Question not found'
-                })
+                }
                 return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
             question_object.question = question
@@ -2129,18 +2151,18 @@ def update_survey_question_api(request):
                 'options': options_data
             }
 
-            data = json.dumps({
+            data = {
                 'status': 'success',
                 'message': 'Question created successfully',
                 'data': data
-            })
+            }
             return Response(data, status=status.HTTP_200_OK)
 
         else:
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(question_serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
     else:
         data = ({
@@ -2165,10 +2187,10 @@ def change_survey_type_api(request):
         body = json.loads(request.body)
         serializer = ChangeSurveyTypeSerializer(data=body)
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         survey_id = serializer.validated_data.get('survey_id')
@@ -2177,19 +2199,19 @@ def change_survey_type_api(request):
         try:
             survey_object = Survey.objects.get(id=survey_id)
         except Survey.DoesNotExist:
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': 'Survey not found'
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         try:
             application_type = ApplicationType.objects.get(id=application_type)
         except Survey.DoesNotExist:
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': 'Application type not found'
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         survey_object.application_type_id = application_type.id
@@ -2209,10 +2231,10 @@ def change_survey_type_api(request):
             survey_id=survey_id
         ).delete()
 
-        data = json.dumps({
+        data = {
             'status': 'success',
             'message': 'Survey type changed successfully'
-        })
+        }
         return Response(data, status=status.HTTP_200_OK)
 
 
@@ -2235,10 +2257,10 @@ def get_survey_info_api(request):
         serializer = GetSurveyInfoSerializer(data=body)
 
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         survey_id = serializer.validated_data.get('survey_id')
@@ -2252,35 +2274,34 @@ def get_survey_info_api(request):
         )
 
         if not survey_objects.exists():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': 'Survey not found'
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
-        df_survey = pd.DataFrame(survey_objects)
-        data = get_survey_categories(df_survey)
+        data = get_survey_categories(dict(survey_objects[0]))
         application_types = ApplicationType.objects.all()
         application_types_serializer = ApplicationTypeSerializer(
             application_types,
             many=True
         )
-        df_types = pd.DataFrame(application_types_serializer.data)
-        if not df_types.empty:
-            df_types['name'] = df_types['name'].apply(
-                lambda name:
-                "Commercial"
-                if name == constants.BUSINESS
-                else
-                name
-            )
+        type_records = [
+            {
+                **application_type,
+                'name': "Commercial"
+                if application_type['name'] == constants.BUSINESS
+                else application_type['name']
+            }
+            for application_type in application_types_serializer.data
+        ]
 
-        data = json.dumps({
+        data = {
             'status': 'success',
             'message': 'Survey information retrieved successfully',
-            'data': data.to_dict('records')[0],
-            'application_types': df_types.to_dict('records')
-        })
+            'data': data,
+            'application_types': type_records
+        }
         return Response(data, status=status.HTTP_200_OK)
 
 
@@ -2303,10 +2324,10 @@ def create_multi_survey_api(request):
         serializer = CreateMultiSurveySerializer(data=body)
 
         if not serializer.is_valid():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': str(serializer.errors)
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
         application_type = serializer.validated_data.get('application_type')
@@ -2331,34 +2352,33 @@ def create_multi_survey_api(request):
         )
 
         if not survey_objects.exists():
-            data = json.dumps({
+            data = {
                 'status': 'error',
                 'message': 'Survey not found'
-            })
+            }
             return Response(data, status=status.HTTP_400_BAD_REQUEST)
 
-        df_survey = pd.DataFrame(survey_objects)
-        data = get_survey_categories(df_survey)
+        data = get_survey_categories(dict(survey_objects[0]))
         application_types = ApplicationType.objects.all()
         application_types_serializer = ApplicationTypeSerializer(
             application_types,
             many=True
         )
-        df_types = pd.DataFrame(application_types_serializer.data)
-        if not df_types.empty:
-            df_types['name'] = df_types['name'].apply(
-                lambda name:
-                "Commercial"
-                if name == constants.BUSINESS
-                else
-                name
-            )
+        type_records = [
+            {
+                **application_type,
+                'name': "Commercial"
+                if application_type['name'] == constants.BUSINESS
+                else application_type['name']
+            }
+            for application_type in application_types_serializer.data
+        ]
 
-        data = json.dumps({
+        data = {
             'status': 'success',
             'message': 'Survey created successfully',
-            'data': data.to_dict('records')[0],
-            'application_types': df_types.to_dict('records'),
+            'data': data,
+            'application_types': type_records,
             'surveys_all': list(surveys_all)
-        })
+        }
         return Response(data, status=status.HTTP_200_OK)
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.3 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0002_auto_20230920_1140'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='surveyanswer',
+            index=models.Index(fields=['survey', 'question'], name='survey_answer_question_idx'),
+        ),
+    ]
@@ -194,6 +194,9 @@ class SurveyAnswer(models.Model):
         """Metaclass for SurveyAnswers."""
         verbose_name = 'Survey Answer'
         verbose_name_plural = 'Survey Answers'
+        indexes = [
+            models.Index(fields=['survey', 'question'], name='survey_answer_question_idx'),
+        ]
 
     def __str__(self):
         """String representation of SurveyAnswers."""